@@ -18,6 +18,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from urllib.parse import urlparse
 
+import requests
+
 from .config import FetchConfig, FetchResult
 from .fetcher import fetch_html, fetch_playwright
 from .extractor import extract_content
@@ -45,6 +47,7 @@ def fetch_source(
     config: FetchConfig | None = None,
     conditional_headers: dict | None = None,
     cached_html_path: str | None = None,
+    session: requests.Session | None = None,
 ) -> FetchResult | None:
     """
     Fetch URL and extract content.
@@ -59,6 +62,8 @@ def fetch_source(
     Args:
         url: URL to fetch
         config: Fetch configuration (uses defaults if None)
+        session: Optional requests.Session to reuse pooled connections
+            across calls (e.g. when fetching many pages of one site)
 
     Returns:
         FetchResult or None if fetch completely failed
@@ -70,7 +75,7 @@ def fetch_source(
 
     # Fetch HTML
     html, final_url, fetch_method, status_code, response_headers, not_modified = fetch_html(
-        url, config, conditional_headers=conditional_headers
+        url, config, conditional_headers=conditional_headers, session=session
     )
 
     if not_modified:
@@ -8,10 +8,10 @@ the same outcome model without changing crawl behavior.
 from __future__ import annotations
 
 from collections import Counter
-from dataclasses import asdict
 from pathlib import Path
 
 from .capture_config import AccessOutcome, CaptureResult
+from .html_archive import read_html
 
 
 CHALLENGE_MARKERS = [
@@ -37,13 +37,16 @@ SOFT_BLOCK_MARKERS = [
 ]
 
 
-def _read_html_excerpt(path: Path | None, max_chars: int = 250_000) -> str:
-    if not path:
-        return ""
-    try:
-        text = path.read_text(encoding="utf-8", errors="ignore")
-    except Exception:
+def _read_html_excerpt(path: Path | None, max_chars: int = 250_000, html: str | None = None) -> str:
+    if html is not None:
+        text = html
+    elif not path:
         return ""
+    else:
+        try:
+            text = read_html(path)
+        except Exception:
+            return ""
     if len(text) > max_chars:
         return text[:max_chars]
     return text
@@ -78,8 +81,8 @@ def _extract_word_count(extracted_page: dict | None) -> int:
     return 0
 
 
-def _marker_hits(html: str, markers: list[str]) -> list[str]:
-    lower = html.lower()
+def _marker_hits(lower: str, markers: list[str]) -> list[str]:
+    """Markers present in already-lowercased page text."""
     return [m for m in markers if m in lower]
 
 
@@ -108,9 +111,11 @@ def classify_capture_result(
             final_url=capture.final_url,
         )
 
-    html = _read_html_excerpt(capture.html_path)
-    challenge_hits = _marker_hits(html, CHALLENGE_MARKERS)
-    soft_block_hits = _marker_hits(html, SOFT_BLOCK_MARKERS)
+    # Lowercase the (up to 250k char) excerpt once for both marker scans;
+    # soft-block markers only matter when no challenge marker matched.
+    lower = _read_html_excerpt(capture.html_path, html=capture.html).lower()
+    challenge_hits = _marker_hits(lower, CHALLENGE_MARKERS)
+    soft_block_hits = [] if challenge_hits else _marker_hits(lower, SOFT_BLOCK_MARKERS)
 
     waf_hint = None
     if recon is not None:
@@ -171,4 +176,4 @@ def summarize_outcomes(captures: list[CaptureResult]) -> dict[str, int]:
 
 
 def outcome_as_dict(outcome: AccessOutcome | None) -> dict | None:
-    return asdict(outcome) if outcome else None
+    return outcome.to_dict() if outcome else None
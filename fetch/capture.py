@@ -11,14 +11,21 @@ Captures complete page state:
 import hashlib
 import json
 import re
+import threading
 import time
-from dataclasses import asdict
+from contextlib import contextmanager
+from dataclasses import fields
 from datetime import datetime, timezone
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 
 from bs4 import BeautifulSoup
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .capture_config import (
     AssetRef,
     CaptureConfig,
@@ -28,6 +35,7 @@ from .capture_config import (
     PageManifestEntry,
 )
 from .cookies import load_cookies
+from .html_archive import archived_text, write_html
 from .lazy_expander import expand_all
 
 
@@ -85,6 +93,15 @@ def parse_image_dimensions(tag) -> tuple[int, int] | None:
     return None
 
 
+def _link_extension(href: str) -> str:
+    """Lowercased file extension of a link's URL path ('' if none)."""
+    path = urlparse(href).path
+    # Most page links have no dot in the path; skip building a Path for them
+    if '.' not in path:
+        return ''
+    return Path(path).suffix.lower()
+
+
 def inventory_assets(html: str, base_url: str) -> list[AssetRef]:
     """
     Parse HTML and inventory all assets (without downloading).
@@ -164,11 +181,12 @@ def inventory_assets(html: str, base_url: str) -> list[AssetRef]:
             if src:
                 add_asset(url=src, asset_type='audio')
 
-    # Documents: links to PDFs, DOCs, etc.
+    # Documents (PDFs, DOCs, etc.) and videos: links to files, by extension.
+    # One pass over the links; videos are added after all documents.
+    video_links = []
     for a in soup.find_all('a', href=True):
         href = a.get('href', '')
-        parsed = urlparse(href)
-        ext = Path(parsed.path).suffix.lower()
+        ext = _link_extension(href)
 
         if ext in DOCUMENT_EXTENSIONS:
             link_text = a.get_text(strip=True)
@@ -177,20 +195,16 @@ def inventory_assets(html: str, base_url: str) -> list[AssetRef]:
                 asset_type='document',
                 link_text=link_text if link_text else None,
             )
-
-    # Videos: links to video files
-    for a in soup.find_all('a', href=True):
-        href = a.get('href', '')
-        parsed = urlparse(href)
-        ext = Path(parsed.path).suffix.lower()
-
-        if ext in VIDEO_EXTENSIONS:
-            link_text = a.get_text(strip=True)
-            add_asset(
-                url=href,
-                asset_type='video',
-                link_text=link_text if link_text else None,
-            )
+        elif ext in VIDEO_EXTENSIONS:
+            video_links.append((href, a))
+
+    for href, a in video_links:
+        link_text = a.get_text(strip=True)
+        add_asset(
+            url=href,
+            asset_type='video',
+            link_text=link_text if link_text else None,
+        )
 
     return assets
 
@@ -226,6 +240,66 @@ def take_screenshot(page, output_path: Path, config: CaptureConfig) -> bool:
         return False
 
 
+_BROWSER_POOL = threading.local()
+
+
+@contextmanager
+def shared_browser():
+    """
+    Reuse browsers for Playwright captures made on this thread.
+
+    Inside the block, capture_page_playwright() launches Chromium once per
+    headless mode instead of once per URL; each capture still gets a fresh
+    context. Playwright's sync API is bound to the thread that started it,
+    so the pool is per-thread and is torn down when the block exits.
+    """
+    if getattr(_BROWSER_POOL, 'browsers', None) is not None:
+        yield
+        return
+
+    _BROWSER_POOL.browsers = {}
+    _BROWSER_POOL.playwright = None
+    try:
+        yield
+    finally:
+        for browser in _BROWSER_POOL.browsers.values():
+            try:
+                browser.close()
+            except Exception:
+                pass
+        if _BROWSER_POOL.playwright is not None:
+            try:
+                _BROWSER_POOL.playwright.stop()
+            except Exception:
+                pass
+        _BROWSER_POOL.browsers = None
+        _BROWSER_POOL.playwright = None
+
+
+@contextmanager
+def _browser(headless: bool):
+    """Yield a Chromium browser: pooled inside shared_browser(), else launched and closed."""
+    from playwright.sync_api import sync_playwright
+
+    browsers = getattr(_BROWSER_POOL, 'browsers', None)
+    if browsers is None:
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=headless)
+            try:
+                yield browser
+            finally:
+                browser.close()
+        return
+
+    browser = browsers.get(headless)
+    if browser is None or not browser.is_connected():
+        if _BROWSER_POOL.playwright is None:
+            _BROWSER_POOL.playwright = sync_playwright().start()
+        browser = _BROWSER_POOL.playwright.chromium.launch(headless=headless)
+        browsers[headless] = browser
+    yield browser
+
+
 def capture_page_playwright(
     url: str,
     config: CaptureConfig,
@@ -272,128 +346,136 @@ def capture_page_playwright(
     timing.fetch_start_ms = time.time() * 1000
 
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=config.headless)
-
+        with _browser(config.headless) as browser:
             context_args = {
                 'user_agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             }
 
             context = browser.new_context(**context_args)
-
-            # Load cookies if configured
-            if config.cookie_ref:
-                cookies = load_cookies(config.cookie_ref, cookies_dir=config.cookies_dir)
-                if cookies:
+            try:
+                # Load cookies if configured
+                if config.cookie_ref:
+                    cookies = load_cookies(config.cookie_ref, cookies_dir=config.cookies_dir)
+                    if cookies:
+                        try:
+                            context.add_cookies(cookies)
+                        except Exception:
+                            pass
+
+                # Carry cookies set by this site's earlier captures
+                if config.site_cookies is not None:
+                    carried = config.site_cookies.cookies()
+                    if carried:
+                        try:
+                            context.add_cookies(carried)
+                        except Exception:
+                            pass
+
+                # Apply stealth if configured
+                if config.stealth:
                     try:
-                        context.add_cookies(cookies)
-                    except Exception:
-                        pass
-
-            # Apply stealth if configured
-            if config.stealth:
-                try:
-                    from playwright_stealth import Stealth
+                        from playwright_stealth import Stealth
+                        page = context.new_page()
+                        Stealth().apply_stealth_sync(page)
+                    except ImportError:
+                        page = context.new_page()
+                else:
                     page = context.new_page()
-                    Stealth().apply_stealth_sync(page)
-                except ImportError:
-                    page = context.new_page()
-            else:
-                page = context.new_page()
 
-            # Navigate
-            try:
-                page.goto(url, wait_until='networkidle', timeout=config.timeout_ms)
-            except Exception:
-                # Try with just domcontentloaded if networkidle times out
+                # Navigate
                 try:
-                    page.goto(url, wait_until='domcontentloaded', timeout=config.timeout_ms)
-                except Exception as e:
-                    return CaptureResult(
-                        url=url,
-                        final_url=url,
-                        html_path=None,
-                        screenshot_path=None,
-                        asset_inventory=[],
-                        manifest_path=None,
-                        content_hash='',
-                        captured_at=datetime.now(timezone.utc).isoformat(),
-                        fetch_method='playwright',
-                        timing=None,
-                        headers={},
-                        cookies=[],
-                        html_size_bytes=0,
-                        error=f'navigation_failed: {type(e).__name__}',
-                    )
-
-            timing.fetch_end_ms = time.time() * 1000
-            final_url = page.url
-
-            # Expand lazy content
-            timing.expansion_start_ms = time.time() * 1000
-            expansion = expand_all(page, config)
-            timing.expansion_end_ms = time.time() * 1000
-
-            # Get final HTML state
-            html = page.content()
-            content_hash = hash_content(html)
-            html_size = len(html.encode('utf-8', errors='replace'))
-
-            # Setup archive paths
-            domain = urlparse(final_url).netloc.replace('www.', '')
-            pages_dir = archive_dir / domain / 'pages'
-            pages_dir.mkdir(parents=True, exist_ok=True)
-
-            # Save HTML
-            html_filename = url_to_filename(final_url, '.html')
-            html_path = pages_dir / html_filename
-            html_path.write_text(html, encoding='utf-8')
-
-            # Screenshot
-            screenshot_path = None
-            if config.take_screenshot:
-                screenshots_dir = archive_dir / domain / 'screenshots'
-                screenshots_dir.mkdir(parents=True, exist_ok=True)
-                ss_filename = url_to_filename(final_url, f'.{config.screenshot_format}')
-                ss_path = screenshots_dir / ss_filename
-
-                timing_ss_start = time.time() * 1000
-                if take_screenshot(page, ss_path, config):
-                    screenshot_path = ss_path
-                timing.screenshot_ms = time.time() * 1000 - timing_ss_start
-
-            # Get cookies and headers
-            page_cookies = context.cookies()
-            headers = {}  # Would need to intercept response for headers
-
-            # Inventory assets
-            assets = inventory_assets(html, final_url)
-
-            timing.total_ms = time.time() * 1000 - timing.fetch_start_ms
-
-            # Clean up
-            page.close()
-            context.close()
-            browser.close()
-
-            return CaptureResult(
-                url=url,
-                final_url=final_url,
-                html_path=html_path,
-                screenshot_path=screenshot_path,
-                asset_inventory=assets,
-                manifest_path=archive_dir / domain / 'manifest.json',
-                content_hash=content_hash,
-                captured_at=datetime.now(timezone.utc).isoformat(),
-                fetch_method='playwright' if not config.stealth else 'stealth',
-                timing=timing,
-                headers=headers,
-                cookies=page_cookies,
-                html_size_bytes=html_size,
-                error=None,
-                interaction_log=expansion.get("interaction_log", []),
-                expansion_stats=expansion.get("stats", {}),
-            )
+                    page.goto(url, wait_until='networkidle', timeout=config.timeout_ms)
+                except Exception:
+                    # Try with just domcontentloaded if networkidle times out
+                    try:
+                        page.goto(url, wait_until='domcontentloaded', timeout=config.timeout_ms)
+                    except Exception as e:
+                        return CaptureResult(
+                            url=url,
+                            final_url=url,
+                            html_path=None,
+                            screenshot_path=None,
+                            asset_inventory=[],
+                            manifest_path=None,
+                            content_hash='',
+                            captured_at=datetime.now(timezone.utc).isoformat(),
+                            fetch_method='playwright',
+                            timing=None,
+                            headers={},
+                            cookies=[],
+                            html_size_bytes=0,
+                            error=f'navigation_failed: {type(e).__name__}',
+                        )
+
+                timing.fetch_end_ms = time.time() * 1000
+                final_url = page.url
+
+                # Expand lazy content
+                timing.expansion_start_ms = time.time() * 1000
+                expansion = expand_all(page, config)
+                timing.expansion_end_ms = time.time() * 1000
+
+                # Get final HTML state
+                html = page.content()
+                content_hash = hash_content(html)
+                html_size = len(html.encode('utf-8', errors='replace'))
+
+                # Setup archive paths
+                domain = urlparse(final_url).netloc.replace('www.', '')
+                pages_dir = archive_dir / domain / 'pages'
+                pages_dir.mkdir(parents=True, exist_ok=True)
+
+                # Save HTML
+                html_filename = url_to_filename(final_url, '.html')
+                html_path = pages_dir / html_filename
+                html_path = write_html(html_path, html, compress=config.compress_html)
+
+                # Screenshot
+                screenshot_path = None
+                if config.take_screenshot:
+                    screenshots_dir = archive_dir / domain / 'screenshots'
+                    screenshots_dir.mkdir(parents=True, exist_ok=True)
+                    ss_filename = url_to_filename(final_url, f'.{config.screenshot_format}')
+                    ss_path = screenshots_dir / ss_filename
+
+                    timing_ss_start = time.time() * 1000
+                    if take_screenshot(page, ss_path, config):
+                        screenshot_path = ss_path
+                    timing.screenshot_ms = time.time() * 1000 - timing_ss_start
+
+                # Get cookies and headers
+                page_cookies = context.cookies()
+                if config.site_cookies is not None:
+                    config.site_cookies.update(page_cookies)
+                headers = {}  # Would need to intercept response for headers
+
+                # Inventory assets
+                assets = inventory_assets(html, final_url)
+
+                timing.total_ms = time.time() * 1000 - timing.fetch_start_ms
+
+                return CaptureResult(
+                    url=url,
+                    final_url=final_url,
+                    html_path=html_path,
+                    screenshot_path=screenshot_path,
+                    asset_inventory=assets,
+                    manifest_path=archive_dir / domain / 'manifest.json',
+                    content_hash=content_hash,
+                    captured_at=datetime.now(timezone.utc).isoformat(),
+                    fetch_method='playwright' if not config.stealth else 'stealth',
+                    timing=timing,
+                    headers=headers,
+                    cookies=page_cookies,
+                    html_size_bytes=html_size,
+                    error=None,
+                    interaction_log=expansion.get("interaction_log", []),
+                    expansion_stats=expansion.get("stats", {}),
+                    html=archived_text(html),
+                )
+            finally:
+                # Also closes the context's pages; the browser may be shared
+                context.close()
 
     except Exception as e:
         return CaptureResult(
@@ -418,6 +500,7 @@ def capture_page_requests(
     url: str,
     config: CaptureConfig,
     archive_dir: Path,
+    session=None,
 ) -> CaptureResult:
     """
     Capture page using requests (for simple static sites).
@@ -428,6 +511,7 @@ def capture_page_requests(
         url: URL to capture
         config: Capture configuration
         archive_dir: Directory to save captured files
+        session: Optional requests.Session to reuse pooled connections
 
     Returns:
         CaptureResult
@@ -444,7 +528,18 @@ def capture_page_requests(
     }
 
     try:
-        resp = requests.get(url, headers=headers, timeout=config.timeout_ms / 1000, allow_redirects=True)
+        http = session or requests
+        site_cookies = config.site_cookies
+        resp = http.get(
+            url,
+            headers=headers,
+            timeout=config.timeout_ms / 1000,
+            allow_redirects=True,
+            cookies=site_cookies.to_jar() if site_cookies is not None else None,
+        )
+        if site_cookies is not None:
+            for hop in (*resp.history, resp):
+                site_cookies.update_from_jar(hop.cookies)
 
         timing.fetch_end_ms = time.time() * 1000
 
@@ -492,7 +587,7 @@ def capture_page_requests(
         # Save HTML — even for error pages, for classifier inspection
         html_filename = url_to_filename(final_url, '.html')
         html_path = pages_dir / html_filename
-        html_path.write_text(html, encoding='utf-8')
+        html_path = write_html(html_path, html, compress=config.compress_html)
 
         # Inventory assets
         assets = inventory_assets(html, final_url)
@@ -514,6 +609,7 @@ def capture_page_requests(
             cookies=[{'name': c.name, 'value': c.value, 'domain': c.domain} for c in resp.cookies],
             html_size_bytes=html_size,
             error=http_error,
+            html=archived_text(html),
         )
 
     except requests.RequestException as e:
@@ -546,6 +642,7 @@ def capture_page(
     url: str,
     config: CaptureConfig,
     archive_dir: Path,
+    session=None,
 ) -> CaptureResult:
     """
     Capture a complete page.
@@ -557,6 +654,7 @@ def capture_page(
         url: URL to capture
         config: Capture configuration
         archive_dir: Directory to save captured files
+        session: Optional requests.Session for the requests path
 
     Returns:
         CaptureResult with HTML path, screenshot, assets, etc.
@@ -565,7 +663,7 @@ def capture_page(
         return capture_page_playwright(url, config, archive_dir)
     else:
         # Try requests first
-        result = capture_page_requests(url, config, archive_dir)
+        result = capture_page_requests(url, config, archive_dir, session=session)
 
         # Fall back to playwright if requests fails or gets blocked
         # (unless no_js_fallback is set)
@@ -581,6 +679,8 @@ def capture_page(
                 take_screenshot=config.take_screenshot,
                 cookie_ref=config.cookie_ref,
                 cookies_dir=config.cookies_dir,
+                site_cookies=config.site_cookies,
+                compress_html=config.compress_html,
             )
             return capture_page_playwright(url, config_js, archive_dir)
 
@@ -649,8 +749,8 @@ def write_manifest(
                 html_size_bytes=c.html_size_bytes,
                 interaction_log=c.interaction_log,
                 expansion_stats=c.expansion_stats,
-                final_access_outcome=asdict(c.access_outcome) if c.access_outcome else None,
-                attempts=[asdict(a) for a in c.attempts],
+                final_access_outcome=c.access_outcome.to_dict() if c.access_outcome else None,
+                attempts=c.attempts_as_dicts(),
             )
             for c in captures
             if c.html_path  # Only include successful captures
@@ -688,13 +788,17 @@ def write_manifest(
         'domain': manifest.domain,
         'captured': manifest.captured,
         'corpus_version': manifest.corpus_version,
-        'pages': [asdict(p) for p in manifest.pages],
+        # Page fields are already plain values; asdict() would deep-copy them
+        'pages': [{f.name: getattr(p, f.name) for f in fields(p)} for p in manifest.pages],
         'assets': [asdict_asset(a) for a in manifest.assets],
         'stats': manifest.stats,
         'site_profile': manifest.site_profile,
     }
 
-    with open(manifest_path, 'w') as f:
-        json.dump(manifest_dict, f, indent=2)
+    if orjson is not None:
+        manifest_path.write_bytes(orjson.dumps(manifest_dict, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(manifest_path, 'w') as f:
+            json.dump(manifest_dict, f, indent=2)
 
     return manifest_path
@@ -7,6 +7,10 @@ screenshots, and asset inventory.
 
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .cookies import SiteCookieStore
 
 
 @dataclass
@@ -22,6 +26,20 @@ class AccessOutcome:
     link_density_estimate: float | None = None
     final_url: str | None = None
 
+    def to_dict(self) -> dict:
+        """Convert to JSON-serializable dict (same shape as asdict(), without the deep copy)."""
+        return {
+            'outcome': self.outcome,
+            'reason': self.reason,
+            'http_status': self.http_status,
+            'detected_markers': list(self.detected_markers),
+            'waf_hint': self.waf_hint,
+            'challenge_detected': self.challenge_detected,
+            'word_count_estimate': self.word_count_estimate,
+            'link_density_estimate': self.link_density_estimate,
+            'final_url': self.final_url,
+        }
+
 
 @dataclass
 class AccessAttempt:
@@ -34,6 +52,18 @@ class AccessAttempt:
     capture_error: str | None = None
     html_size_bytes: int | None = None
 
+    def to_dict(self) -> dict:
+        """Convert to JSON-serializable dict (same shape as asdict(), without the deep copy)."""
+        return {
+            'attempt_index': self.attempt_index,
+            'strategy': self.strategy,
+            'started_at': self.started_at,
+            'duration_ms': self.duration_ms,
+            'outcome': self.outcome.to_dict(),
+            'capture_error': self.capture_error,
+            'html_size_bytes': self.html_size_bytes,
+        }
+
 
 @dataclass
 class CaptureConfig:
@@ -70,9 +100,11 @@ class CaptureConfig:
     # Cookie/auth
     cookie_ref: str | None = None
     cookies_dir: Path | None = None
+    site_cookies: "SiteCookieStore | None" = None  # Shared across a site's captures
 
     # Archive paths (set by capture_page)
     archive_dir: Path | None = None
+    compress_html: bool = False  # Write pages as .html.zst (needs zstandard)
 
 
 @dataclass
@@ -121,6 +153,18 @@ class CaptureResult:
     expansion_stats: dict = field(default_factory=dict)
     access_outcome: AccessOutcome | None = None
     attempts: list[AccessAttempt] = field(default_factory=list)
+    # Page text as archived at html_path, kept in memory so classification
+    # and extraction don't re-read the file; dropped once the page is done
+    html: str | None = field(default=None, repr=False)
+    # attempts serialized with to_dict(), shared by the telemetry, manifest
+    # and site JSON; whoever mutates an attempt afterwards refreshes it
+    attempt_dicts: list[dict] | None = field(default=None, repr=False)
+
+    def attempts_as_dicts(self) -> list[dict]:
+        """The attempts as dicts, serialized once and cached."""
+        if self.attempt_dicts is None:
+            self.attempt_dicts = [a.to_dict() for a in self.attempts]
+        return self.attempt_dicts
 
 
 @dataclass
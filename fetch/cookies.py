@@ -1,14 +1,17 @@
 """
-Cookie loading utilities for Playwright sessions.
+Cookie loading utilities for Playwright sessions, plus the per-site cookie
+store shared by a site's captures.
 """
 
 from __future__ import annotations
 
 import json
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from http.cookiejar import CookieJar
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 
 @dataclass
@@ -82,3 +85,82 @@ def load_cookies(cookie_ref: str | None, cookies_dir: Path | None = None) -> lis
         filtered.append(cookie)
 
     return filtered
+
+
+class SiteCookieStore:
+    """
+    Cookies set while crawling one site, carried from each capture to the next.
+
+    Consent and session cookies from the first pages then apply to the rest
+    of the site, for both the requests and Playwright capture paths. Cookies
+    are kept in the Playwright format used by load_cookies(), keyed by
+    (domain, path, name). Thread-safe: static captures run concurrently.
+    """
+
+    def __init__(self) -> None:
+        self._cookies: dict[tuple[str, str, str], dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cookies)
+
+    def cookies(self) -> list[dict[str, Any]]:
+        """Unexpired cookies, in Playwright add_cookies() format."""
+        now_ts = datetime.now(timezone.utc).timestamp()
+        with self._lock:
+            return [
+                dict(c) for c in self._cookies.values()
+                if not (0 < c.get("expires", -1) < now_ts)
+            ]
+
+    def update(self, cookies: Iterable[dict[str, Any]]) -> None:
+        """Merge Playwright-format cookies (e.g. from context.cookies())."""
+        with self._lock:
+            for c in cookies:
+                if not c.get("name") or not c.get("domain"):
+                    continue
+                expires = c.get("expires")
+                key = (c["domain"], c.get("path") or "/", c["name"])
+                self._cookies[key] = {
+                    "name": c["name"],
+                    "value": c.get("value", ""),
+                    "domain": c["domain"],
+                    "path": c.get("path") or "/",
+                    "expires": expires if isinstance(expires, (int, float)) else -1,
+                    "httpOnly": bool(c.get("httpOnly", False)),
+                    "secure": bool(c.get("secure", False)),
+                }
+
+    def update_from_jar(self, jar: CookieJar) -> None:
+        """Merge cookies a requests response set (resp.cookies)."""
+        self.update(
+            {
+                "name": c.name,
+                "value": c.value or "",
+                "domain": c.domain,
+                "path": c.path,
+                "expires": c.expires if c.expires else -1,
+                "httpOnly": c.has_nonstandard_attr("HttpOnly"),
+                "secure": c.secure,
+            }
+            for c in jar
+        )
+
+    def to_jar(self) -> CookieJar:
+        """The stored cookies as a jar for requests' cookies= argument."""
+        from requests.cookies import RequestsCookieJar, create_cookie
+
+        jar = RequestsCookieJar()
+        for c in self.cookies():
+            expires = c["expires"]
+            jar.set_cookie(create_cookie(
+                name=c["name"],
+                value=c["value"],
+                domain=c["domain"],
+                path=c["path"],
+                secure=c["secure"],
+                expires=int(expires) if expires and expires > 0 else None,
+                rest={"HttpOnly": None} if c["httpOnly"] else {},
+            ))
+        return jar
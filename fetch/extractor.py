@@ -3,6 +3,9 @@ Content extraction layer with fallback chain:
 trafilatura → readability-lxml → density scorer
 """
 
+import codecs
+import mmap
+import os
 import re
 from dataclasses import dataclass, asdict
 from typing import Literal
@@ -14,6 +17,7 @@ from .quality import check_quality
 from .fullpage import extract_full_page, extraction_to_dict
 from .structured import extract_jsonld
 from .hasher import hash_content
+from .html_archive import is_compressed, read_html
 from urllib.parse import urlparse, urljoin
 from datetime import datetime, timezone
 from pathlib import Path
@@ -551,6 +555,30 @@ def _categorize_links(html: str, base_url: str | None = None) -> dict:
     return categories
 
 
+# Below this size mmap setup costs more than a plain read
+MMAP_MIN_BYTES = 64 * 1024
+
+
+def _read_html(html_path: Path) -> str:
+    """
+    Read archived HTML as text (UTF-8, undecodable bytes dropped).
+
+    Large files are decoded straight from a read-only mapping, so the raw
+    bytes are never copied onto the heap next to the decoded string.
+    """
+    if is_compressed(html_path):
+        return read_html(html_path)
+    with open(html_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_MIN_BYTES:
+            return html_path.read_text(encoding="utf-8", errors="ignore")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            html = codecs.utf_8_decode(mm, "ignore", True)[0]
+    # Match read_text()'s universal-newline translation
+    if "\r" in html:
+        html = html.replace("\r\n", "\n").replace("\r", "\n")
+    return html
+
+
 def extract_from_capture(
     html_path: str | Path,
     url: str | None = None,
@@ -559,12 +587,17 @@ def extract_from_capture(
     interaction_log: list[dict] | None = None,
     expansion_stats: dict | None = None,
     config: FetchConfig | None = None,
+    html: str | None = None,
 ) -> dict:
     """
     Extract structured content from archived HTML capture.
+
+    Pass html when the page text is already in memory to skip reading
+    html_path back from disk.
     """
     html_path = Path(html_path)
-    html = html_path.read_text(encoding="utf-8", errors="ignore")
+    if html is None:
+        html = _read_html(html_path)
     base_url = url or ""
     config = config or FetchConfig()
 
@@ -38,6 +38,7 @@ def fetch_requests(
     url: str,
     config: FetchConfig,
     conditional_headers: dict | None = None,
+    session: requests.Session | None = None,
 ) -> tuple[str | None, str | None, int | None, dict, bool]:
     """
     Fetch URL using requests library.
@@ -45,6 +46,7 @@ def fetch_requests(
     Args:
         url: URL to fetch
         config: Fetch configuration
+        session: Optional requests session to reuse pooled connections
 
     Returns:
         Tuple of (html, final_url) or (None, None) on failure
@@ -55,7 +57,7 @@ def fetch_requests(
         headers.update(conditional_headers)
 
     try:
-        resp = requests.get(
+        resp = (session or requests).get(
             url,
             headers=headers,
             timeout=config.timeout,
@@ -197,6 +199,7 @@ def fetch_html(
     url: str,
     config: FetchConfig | None = None,
     conditional_headers: dict | None = None,
+    session: requests.Session | None = None,
 ) -> tuple[str | None, str | None, Literal['requests', 'playwright', 'playwright_stealth'], int | None, dict, bool]:
     """
     Fetch HTML with fallback chain.
@@ -206,6 +209,7 @@ def fetch_html(
     Args:
         url: URL to fetch
         config: Fetch configuration
+        session: Optional requests session for the requests strategy
 
     Returns:
         Tuple of (html, final_url, method) or (None, None, 'requests') on failure
@@ -220,7 +224,7 @@ def fetch_html(
     # Strategy 1: Plain requests (unless js_always is set)
     if not config.js_always:
         html, final_url, status, resp_headers, not_modified = fetch_requests(
-            url, config, conditional_headers=conditional_headers
+            url, config, conditional_headers=conditional_headers, session=session
         )
         if not_modified:
             return None, final_url, 'requests', status, resp_headers, True
@@ -0,0 +1,64 @@
+"""
+Reading and writing archived page HTML.
+
+Pages are stored as plain UTF-8 .html by default. With compression on
+(crawl.py --compress-raw) they are written as .html.zst, which is
+typically 4-5x smaller; readers handle both transparently. Compression
+needs the optional zstandard package and falls back to plain files
+without it.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+ZSTD_SUFFIX = ".zst"
+ZSTD_LEVEL = 3
+
+
+def compression_available() -> bool:
+    return zstandard is not None
+
+
+def write_html(path: Path, html: str, compress: bool = False) -> Path:
+    """
+    Write page HTML, zstd-compressed to <path>.zst when requested and available.
+
+    Returns:
+        The path actually written
+    """
+    if compress and zstandard is not None:
+        path = path.with_name(path.name + ZSTD_SUFFIX)
+        data = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(html.encode("utf-8"))
+        path.write_bytes(data)
+        return path
+    path.write_text(html, encoding="utf-8")
+    return path
+
+
+def is_compressed(path: Path) -> bool:
+    return path.suffix == ZSTD_SUFFIX
+
+
+def archived_text(html: str) -> str:
+    """The text read_html() returns for a page write_html() stored (newlines translated)."""
+    if "\r" in html:
+        html = html.replace("\r\n", "\n").replace("\r", "\n")
+    return html
+
+
+def read_html(path: Path) -> str:
+    """Read archived HTML as text (UTF-8, undecodable bytes dropped), plain or .zst."""
+    if not is_compressed(path):
+        return path.read_text(encoding="utf-8", errors="ignore")
+    if zstandard is None:
+        raise RuntimeError(f"zstandard is required to read {path}")
+    with open(path, "rb") as f:
+        html = zstandard.ZstdDecompressor().stream_reader(f).read().decode("utf-8", errors="ignore")
+    # Match read_text()'s universal-newline translation
+    return archived_text(html)
@@ -11,6 +11,8 @@ import time
 from dataclasses import replace
 from typing import Any
 
+import requests
+
 from .config import FetchConfig, FetchResult
 from .extractor import extract_content
 from .fetcher import fetch_html
@@ -110,10 +112,14 @@ def interactive_fetch(
     max_interactions: int = MAX_INTERACTIONS,
     delta_threshold: int = DELTA_THRESHOLD,
     timeout_sec: int = INTERACTIVE_TIMEOUT_SEC,
+    session: requests.Session | None = None,
 ) -> FetchResult | None:
     """
     Fetch a URL with optional Playwright interactions.
 
+    The baseline requests fetch goes through session when given, so a
+    caller fetching many pages reuses its pooled connections.
+
     Returns the best extraction seen (baseline or interactive).
     """
     if config is None:
@@ -121,7 +127,7 @@ def interactive_fetch(
     config = _ensure_return_html(config)
 
     baseline = None
-    html, final_url, fetch_method, status_code, response_headers, not_modified = fetch_html(url, config)
+    html, final_url, fetch_method, status_code, response_headers, not_modified = fetch_html(url, config, session=session)
 
     if html:
         baseline = _best_from_html(html, final_url or url, config)
@@ -26,6 +26,9 @@ from .js_detect import detect_js_required
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 DEFAULT_CACHE_PATH = PROJECT_ROOT / "corpus" / "access" / "recon_cache.json"
 _CACHE_LOCK = threading.Lock()
+# Parsed cache files, keyed by path and valid while the file's (mtime, size)
+# is unchanged, so each recon_site() call doesn't re-read the whole file
+_CACHE_MEMO: dict[Path, tuple[tuple[int, int], dict]] = {}
 
 
 @dataclass
@@ -178,27 +181,58 @@ def _cache_key(url: str) -> str:
     return domain.replace("www.", "")
 
 
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 def _load_cache(path: Path) -> dict:
-    if not path.exists():
+    """The parsed cache file; callers hold _CACHE_LOCK and must not mutate entries."""
+    signature = _file_signature(path)
+    if signature is None:
         return {}
+    memo = _CACHE_MEMO.get(path)
+    if memo is not None and memo[0] == signature:
+        return memo[1]
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        cache = json.loads(path.read_text(encoding="utf-8"))
     except Exception:
         return {}
+    _CACHE_MEMO[path] = (signature, cache)
+    return cache
 
 
 def _save_cache(path: Path, cache: dict) -> None:
+    _CACHE_MEMO.pop(path, None)
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+    signature = _file_signature(path)
+    if signature is not None:
+        _CACHE_MEMO[path] = (signature, cache)
+
+
+def recon_site(
+    url: str,
+    cache_path: Path | None = None,
+    ttl_days: int = 7,
+    session: requests.Session | None = None,
+    use_cache: bool = True,
+) -> ReconResult:
+    """
+    Probe url and classify its access profile (CDN, WAF, challenge, JS needs).
 
-
-def recon_site(url: str, cache_path: Path | None = None, ttl_days: int = 7) -> ReconResult:
+    Results are cached per domain in cache_path for ttl_days (1 day for
+    failed probes). use_cache=False always probes, then refreshes the entry.
+    """
     cache_path = cache_path or DEFAULT_CACHE_PATH
     key = _cache_key(url)
     now = datetime.now(timezone.utc)
 
     with _CACHE_LOCK:
-        cache = _load_cache(cache_path)
+        cache = _load_cache(cache_path) if use_cache else {}
         cached = cache.get(key)
         if cached:
             try:
@@ -211,10 +245,14 @@ def recon_site(url: str, cache_path: Path | None = None, ttl_days: int = 7) -> R
                 ) if cached_notes else False
                 effective_ttl = timedelta(days=1) if has_error else timedelta(days=ttl_days)
                 if age < effective_ttl:
-                    # Backfill new fields for old cache entries
-                    cached.setdefault("waf_detected", False)
-                    cached.setdefault("likely_bot_defended", False)
-                    return ReconResult(**cached)
+                    # Backfill new fields for old cache entries. Copy the
+                    # containers: the parsed cache is shared between calls
+                    fields = {
+                        "waf_detected": False,
+                        "likely_bot_defended": False,
+                        **{k: v.copy() if isinstance(v, (dict, list)) else v for k, v in cached.items()},
+                    }
+                    return ReconResult(**fields)
             except Exception:
                 pass
 
@@ -227,7 +265,7 @@ def recon_site(url: str, cache_path: Path | None = None, ttl_days: int = 7) -> R
     notes = []
 
     try:
-        resp = requests.get(url, headers=headers, timeout=10, allow_redirects=True)
+        resp = (session or requests).get(url, headers=headers, timeout=10, allow_redirects=True)
         status_code = resp.status_code
         resp_headers = dict(resp.headers)
         if resp.text and len(resp.text) < 2_000_000:
@@ -273,7 +311,7 @@ def recon_site(url: str, cache_path: Path | None = None, ttl_days: int = 7) -> R
     )
 
     with _CACHE_LOCK:
-        cache = _load_cache(cache_path)
+        cache = dict(_load_cache(cache_path))
         cache[key] = asdict(result)
         _save_cache(cache_path, cache)
     return result
@@ -71,13 +71,19 @@ class RobotsChecker:
         self._raw_content: str = ''
 
     @classmethod
-    def fetch(cls, base_url: str, use_cache: bool = True) -> 'RobotsChecker':
+    def fetch(
+        cls,
+        base_url: str,
+        use_cache: bool = True,
+        session: requests.Session | None = None,
+    ) -> 'RobotsChecker':
         """
         Fetch and parse robots.txt for a domain.
 
         Args:
             base_url: Base URL (e.g., "https://example.com")
             use_cache: If True, return cached checker if available
+            session: Optional requests session to reuse pooled connections
 
         Returns:
             RobotsChecker instance
@@ -89,22 +95,45 @@ class RobotsChecker:
             return cls._cache[domain]
 
         checker = cls(base_url)
-        checker._fetch_and_parse()
+        checker._fetch_and_parse(session)
 
         if use_cache:
             cls._cache[domain] = checker
 
         return checker
 
+    @classmethod
+    def from_content(cls, base_url: str, content: str | None) -> 'RobotsChecker':
+        """
+        Build a checker from previously fetched robots.txt content.
+
+        Args:
+            base_url: Base URL (e.g., "https://example.com")
+            content: robots.txt body, or None if the site has none
+
+        Returns:
+            RobotsChecker instance
+        """
+        checker = cls(base_url)
+        if content is not None:
+            checker._apply_content(content)
+        return checker
+
+    @property
+    def raw_content(self) -> str:
+        """robots.txt body as fetched ('' if not found)."""
+        return self._raw_content
+
     @classmethod
     def clear_cache(cls):
         """Clear the robots.txt cache."""
         cls._cache.clear()
 
-    def _fetch_and_parse(self):
+    def _fetch_and_parse(self, session: requests.Session | None = None):
         """Fetch robots.txt and parse it."""
+        http = session or requests
         try:
-            resp = requests.get(
+            resp = http.get(
                 self.robots_url,
                 timeout=REQUEST_TIMEOUT,
                 headers={'User-Agent': USER_AGENT},
@@ -112,12 +141,7 @@ class RobotsChecker:
             )
 
             if resp.status_code == 200:
-                self.found = True
-                self._raw_content = resp.text
-                self._parse_content(resp.text)
-
-                # Also feed to RobotFileParser for rule matching
-                self._parser.parse(resp.text.splitlines())
+                self._apply_content(resp.text)
 
             elif resp.status_code in (404, 403, 410):
                 # No robots.txt = everything allowed
@@ -128,6 +152,15 @@ class RobotsChecker:
         except requests.RequestException as e:
             self.error = str(e)
 
+    def _apply_content(self, content: str):
+        """Load a robots.txt body into this checker."""
+        self.found = True
+        self._raw_content = content
+        self._parse_content(content)
+
+        # Also feed to RobotFileParser for rule matching
+        self._parser.parse(content.splitlines())
+
     def _parse_content(self, content: str):
         """Parse robots.txt content for extra directives."""
         current_agent = None
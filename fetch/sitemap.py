@@ -13,13 +13,17 @@ Usage:
     sitemap_url = discover_sitemap("https://example.com")
     if sitemap_url:
         urls = parse_sitemap(sitemap_url)
+
+    # or discover and parse with one request for the sitemap itself
+    result = find_sitemap("https://example.com")
 """
 
+import itertools
 import re
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Iterator
+from typing import Iterable, Iterator
 from urllib.parse import urljoin, urlparse
 
 import requests
@@ -42,8 +46,16 @@ SITEMAP_NS = {
     'xhtml': 'http://www.w3.org/1999/xhtml',
 }
 
+_SM = '{http://www.sitemaps.org/schemas/sitemap/0.9}'
+
 REQUEST_TIMEOUT = 10
 USER_AGENT = "TruckingCorpusBot/1.0 (Research)"
+CHUNK_SIZE = 64 * 1024  # bytes read from the response per parser feed
+
+# Characters at the start of a body that _looks_like_sitemap inspects, and
+# the bytes buffered to be sure of having them (up to 4 per UTF-8 character)
+SNIFF_CHARS = 500
+SNIFF_BYTES = 4 * SNIFF_CHARS
 
 
 @dataclass
@@ -68,57 +80,127 @@ class SitemapResult:
     fetch_time: str = ''
 
 
-def _get(url: str) -> tuple[str | None, int]:
-    """Fetch URL, return (content, status_code)."""
+def _open(url: str, session: requests.Session | None = None) -> tuple[requests.Response | None, int]:
+    """
+    Start a streamed GET, return (response, status_code).
+
+    The response is returned only for a 200 and the body is not read yet;
+    the caller reads what it needs and closes it.
+    """
+    http = session or requests
     try:
-        resp = requests.get(
+        resp = http.get(
             url,
             timeout=REQUEST_TIMEOUT,
             headers={'User-Agent': USER_AGENT},
             allow_redirects=True,
+            stream=True,
         )
-        if resp.status_code == 200:
-            return resp.text, resp.status_code
-        return None, resp.status_code
     except requests.RequestException:
         return None, 0
+    if resp.status_code == 200:
+        return resp, resp.status_code
+    resp.close()
+    return None, resp.status_code
+
+
+def _read_head(chunks: Iterator[bytes]) -> bytes:
+    """
+    Read chunks until SNIFF_BYTES are buffered or the body ends.
+
+    With chunked transfer encoding the first chunk can be as small as the
+    XML declaration, too little to tell whether the body is a sitemap.
+    """
+    head = b''
+    for chunk in chunks:
+        head += chunk
+        if len(head) >= SNIFF_BYTES:
+            break
+    return head
+
+
+def _is_sitemap_url(url: str, session: requests.Session | None = None) -> bool:
+    """Check whether url serves a sitemap, reading only the start of the body."""
+    resp, _ = _open(url, session)
+    if resp is None:
+        return False
+    with resp:
+        try:
+            head = _read_head(resp.iter_content(chunk_size=CHUNK_SIZE))
+        except requests.RequestException:
+            return False
+    return _looks_like_sitemap(head.decode('utf-8', errors='ignore'))
 
 
-def discover_sitemap(base_url: str, robots_hints: list[str] | None = None) -> str | None:
+def discover_sitemap(
+    base_url: str,
+    robots_hints: list[str] | None = None,
+    session: requests.Session | None = None,
+) -> str | None:
     """
     Discover sitemap URL for a domain.
 
     Args:
         base_url: Base URL (e.g., "https://example.com")
         robots_hints: Sitemap URLs found in robots.txt (checked first)
+        session: Optional requests session to reuse pooled connections
 
     Returns:
         Sitemap URL if found, None otherwise
     """
-    # Normalize base URL
+    for url in _candidate_urls(base_url, robots_hints):
+        if _is_sitemap_url(url, session):
+            return url
+    return None
+
+
+def _candidate_urls(base_url: str, robots_hints: list[str] | None = None) -> Iterator[str]:
+    """Sitemap locations to try: robots.txt hints first (most reliable), then common paths."""
+    yield from robots_hints or []
     parsed = urlparse(base_url)
     base = f"{parsed.scheme}://{parsed.netloc}"
+    for path in SITEMAP_PATHS:
+        yield urljoin(base, path)
 
-    # Try robots.txt hints first (most reliable)
-    if robots_hints:
-        for hint in robots_hints:
-            content, status = _get(hint)
-            if content and _looks_like_sitemap(content):
-                return hint
 
-    # Try common paths
-    for path in SITEMAP_PATHS:
-        url = urljoin(base, path)
-        content, status = _get(url)
-        if content and _looks_like_sitemap(content):
-            return url
+def find_sitemap(
+    base_url: str,
+    robots_hints: list[str] | None = None,
+    max_urls: int = 10000,
+    session: requests.Session | None = None,
+) -> SitemapResult | None:
+    """
+    Discover and parse a domain's sitemap.
+
+    Same result as parse_sitemap(discover_sitemap(...)), but the sitemap is
+    parsed from the response that identified it instead of being requested
+    a second time.
 
+    Returns:
+        SitemapResult for the first candidate that looks like a sitemap,
+        None if none does
+    """
+    for url in _candidate_urls(base_url, robots_hints):
+        resp, _ = _open(url, session)
+        if resp is None:
+            continue
+        chunks = resp.iter_content(chunk_size=CHUNK_SIZE)
+        try:
+            head = _read_head(chunks)
+        except requests.RequestException:
+            resp.close()
+            continue
+        if not _looks_like_sitemap(head.decode('utf-8', errors='ignore')):
+            resp.close()
+            continue
+        result = SitemapResult(fetch_time=datetime.utcnow().isoformat(), sitemap_url=url)
+        return _parse_response(result, resp, itertools.chain([head], chunks), True, max_urls, session)
     return None
 
 
 def _looks_like_sitemap(content: str) -> bool:
     """Quick check if content looks like a sitemap XML."""
-    content_start = content[:500].lower()
+    content_start = content[:SNIFF_CHARS].lower()
     return (
         '<?xml' in content_start
         and ('urlset' in content_start or 'sitemapindex' in content_start)
@@ -156,6 +238,7 @@ def parse_sitemap(
     sitemap_url: str,
     follow_index: bool = True,
     max_urls: int = 10000,
+    session: requests.Session | None = None,
 ) -> SitemapResult:
     """
     Parse a sitemap and extract URLs.
@@ -164,6 +247,7 @@ def parse_sitemap(
         sitemap_url: URL of the sitemap
         follow_index: If True, recursively fetch child sitemaps
         max_urls: Maximum URLs to return (prevents memory issues)
+        session: Optional requests session to reuse pooled connections
 
     Returns:
         SitemapResult with URLs and metadata
@@ -173,119 +257,153 @@ def parse_sitemap(
         sitemap_url=sitemap_url,
     )
 
-    content, status = _get(sitemap_url)
-    if not content:
+    resp, status = _open(sitemap_url, session)
+    if resp is None:
         result.error = f"Failed to fetch sitemap (status {status})"
         return result
+    return _parse_response(
+        result, resp, resp.iter_content(chunk_size=CHUNK_SIZE), follow_index, max_urls, session
+    )
 
-    try:
-        root = ET.fromstring(content)
-    except ET.ParseError as e:
-        result.error = f"XML parse error: {e}"
-        return result
 
-    result.found = True
+def _parse_response(
+    result: SitemapResult,
+    resp: requests.Response,
+    chunks: Iterable[bytes],
+    follow_index: bool,
+    max_urls: int,
+    session: requests.Session | None,
+) -> SitemapResult:
+    """Parse an open sitemap response (body read from chunks) into result, closing it."""
+    sitemap_url = result.sitemap_url
 
-    # Check if this is a sitemap index
-    if root.tag.endswith('sitemapindex') or 'sitemapindex' in root.tag:
-        result.is_index = True
-        result.child_sitemaps = _parse_sitemap_index(root)
+    # Stream the document from the response: a large urlset is never held
+    # whole or built into a tree, and once max_urls entries are collected
+    # the rest is not downloaded
+    with resp:
+        try:
+            events = _iter_events(chunks)
+            _, root = next(events)
+
+            # Check if this is a sitemap index
+            if root.tag.endswith('sitemapindex') or 'sitemapindex' in root.tag:
+                result.is_index = True
+                result.child_sitemaps = _parse_sitemap_index(events, root)
+            else:
+                # Regular sitemap with URLs
+                urls = _parse_urlset(events, root, sitemap_url, max_urls)
+        except ET.ParseError as e:
+            result.error = f"XML parse error: {e}"
+            result.is_index = False
+            result.child_sitemaps = []
+            return result
+        except requests.RequestException as e:
+            result.error = f"Failed to read sitemap: {type(e).__name__}"
+            result.is_index = False
+            result.child_sitemaps = []
+            return result
 
+    result.found = True
+
+    if not result.is_index:
+        result.urls = urls
+    elif follow_index:
         # Recursively fetch child sitemaps
-        if follow_index:
-            for child_url in result.child_sitemaps:
-                if len(result.urls) >= max_urls:
-                    break
-                child_result = parse_sitemap(
-                    child_url,
-                    follow_index=False,  # Don't recurse further
-                    max_urls=max_urls - len(result.urls),
-                )
-                result.urls.extend(child_result.urls)
-    else:
-        # Regular sitemap with URLs
-        result.urls = list(_parse_urlset(root, sitemap_url, max_urls))
+        for child_url in result.child_sitemaps:
+            if len(result.urls) >= max_urls:
+                break
+            child_result = parse_sitemap(
+                child_url,
+                follow_index=False,  # Don't recurse further
+                max_urls=max_urls - len(result.urls),
+                session=session,
+            )
+            result.urls.extend(child_result.urls)
 
     return result
 
 
-def _parse_sitemap_index(root: ET.Element) -> list[str]:
-    """Parse sitemap index and return child sitemap URLs."""
-    child_urls = []
+def _iter_events(chunks: Iterable[bytes]) -> Iterator:
+    """Yield iterparse-style ('start'|'end', elem) pairs, feeding the parser chunk by chunk."""
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from parser.read_events()
+    parser.close()
+    yield from parser.read_events()
 
-    # Try with namespace
-    for sitemap in root.findall('sm:sitemap', SITEMAP_NS):
-        loc = sitemap.find('sm:loc', SITEMAP_NS)
-        if loc is not None and loc.text:
-            child_urls.append(loc.text.strip())
 
-    # Try without namespace (some sitemaps don't use it)
-    if not child_urls:
-        for sitemap in root.findall('.//{http://www.sitemaps.org/schemas/sitemap/0.9}sitemap'):
-            loc = sitemap.find('{http://www.sitemaps.org/schemas/sitemap/0.9}loc')
-            if loc is not None and loc.text:
-                child_urls.append(loc.text.strip())
+def _parse_sitemap_index(events: Iterator, root: ET.Element) -> list[str]:
+    """Parse the rest of a sitemap index stream and return child sitemap URLs."""
+    child_urls = []
+    bare_child_urls = []  # used only if no namespaced <sitemap> entries exist
 
-    # Try bare tags (no namespace)
-    if not child_urls:
-        for sitemap in root.findall('.//sitemap'):
-            loc = sitemap.find('loc')
+    for event, elem in events:
+        if event != 'end':
+            continue
+        if elem.tag == _SM + 'sitemap':
+            loc = elem.find(_SM + 'loc')
             if loc is not None and loc.text:
                 child_urls.append(loc.text.strip())
+        elif elem.tag == 'sitemap':
+            loc = elem.find('loc')
+            if loc is not None and loc.text:
+                bare_child_urls.append(loc.text.strip())
 
-    return child_urls
+    return child_urls or bare_child_urls
 
 
 def _parse_urlset(
+    events: Iterator,
     root: ET.Element,
     source_sitemap: str,
     max_urls: int,
-) -> Iterator[SitemapURL]:
-    """Parse urlset and yield SitemapURL objects."""
-    count = 0
-
-    # Try with namespace
-    urls = root.findall('sm:url', SITEMAP_NS)
-    if not urls:
-        urls = root.findall('.//{http://www.sitemaps.org/schemas/sitemap/0.9}url')
-    if not urls:
-        urls = root.findall('.//url')
-
-    for url_elem in urls:
-        if count >= max_urls:
+) -> list[SitemapURL]:
+    """Parse the rest of a urlset stream into at most max_urls SitemapURL objects."""
+    urls = []
+    for event, url_elem in events:
+        if event != 'end' or url_elem.tag not in (_SM + 'url', 'url'):
+            continue
+        if len(urls) >= max_urls:
             break
 
-        # Extract loc (required)
-        loc = None
-        for tag in ['sm:loc', '{http://www.sitemaps.org/schemas/sitemap/0.9}loc', 'loc']:
-            loc_elem = url_elem.find(tag, SITEMAP_NS) if ':' in tag else url_elem.find(tag)
-            if loc_elem is not None and loc_elem.text:
-                loc = loc_elem.text.strip()
-                break
+        entry = _parse_url_elem(url_elem, source_sitemap)
+        # Drop finished entries so memory stays flat on large sitemaps
+        url_elem.clear()
+        root.clear()
 
-        if not loc:
-            continue
+        if entry is not None:
+            urls.append(entry)
 
-        # Extract optional fields
-        lastmod = _get_text(url_elem, ['sm:lastmod', '{http://www.sitemaps.org/schemas/sitemap/0.9}lastmod', 'lastmod'])
-        changefreq = _get_text(url_elem, ['sm:changefreq', '{http://www.sitemaps.org/schemas/sitemap/0.9}changefreq', 'changefreq'])
-        priority_str = _get_text(url_elem, ['sm:priority', '{http://www.sitemaps.org/schemas/sitemap/0.9}priority', 'priority'])
-
-        priority = None
-        if priority_str:
-            try:
-                priority = float(priority_str)
-            except ValueError:
-                pass
-
-        yield SitemapURL(
-            loc=loc,
-            lastmod=_parse_datetime(lastmod),
-            changefreq=changefreq,
-            priority=priority,
-            source_sitemap=source_sitemap,
-        )
-        count += 1
+    return urls
+
+
+def _parse_url_elem(url_elem: ET.Element, source_sitemap: str) -> SitemapURL | None:
+    """Build a SitemapURL from a <url> element, or None if it has no <loc>."""
+    # Extract loc (required)
+    loc = _get_text(url_elem, ['sm:loc', '{http://www.sitemaps.org/schemas/sitemap/0.9}loc', 'loc'])
+    if not loc:
+        return None
+
+    # Extract optional fields
+    lastmod = _get_text(url_elem, ['sm:lastmod', '{http://www.sitemaps.org/schemas/sitemap/0.9}lastmod', 'lastmod'])
+    changefreq = _get_text(url_elem, ['sm:changefreq', '{http://www.sitemaps.org/schemas/sitemap/0.9}changefreq', 'changefreq'])
+    priority_str = _get_text(url_elem, ['sm:priority', '{http://www.sitemaps.org/schemas/sitemap/0.9}priority', 'priority'])
+
+    priority = None
+    if priority_str:
+        try:
+            priority = float(priority_str)
+        except ValueError:
+            pass
+
+    return SitemapURL(
+        loc=loc,
+        lastmod=_parse_datetime(lastmod),
+        changefreq=changefreq,
+        priority=priority,
+        source_sitemap=source_sitemap,
+    )
 
 
 def _get_text(elem: ET.Element, tags: list[str]) -> str | None:
@@ -11,6 +11,13 @@ from collections import Counter
 from datetime import datetime
 from pathlib import Path
 import json
+import os
+import tempfile
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 def resolve_fetch_method(captures: list) -> str:
@@ -23,6 +30,38 @@ def resolve_fetch_method(captures: list) -> str:
     return "mixed"
 
 
+class AccessSummary:
+    """Running site-level access summary, fed one per-URL telemetry entry at a time."""
+
+    def __init__(self) -> None:
+        self.outcome_counts: dict[str, int] = {}
+        self.strategies_used: dict[str, int] = {}
+        self.total_urls = 0
+        self.total_attempts = 0
+
+    def add(self, entry: dict) -> None:
+        outcome = entry.get("final_outcome", "unknown")
+        self.outcome_counts[outcome] = self.outcome_counts.get(outcome, 0) + 1
+        self.total_attempts += len(entry.get("attempts", []))
+        for strategy in entry.get("escalations_used", []):
+            self.strategies_used[strategy] = self.strategies_used.get(strategy, 0) + 1
+        self.total_urls += 1
+
+    def to_dict(self) -> dict:
+        if not self.total_urls:
+            return {}
+        successes = self.outcome_counts.get("success_real_content", 0)
+        total_urls = self.total_urls
+        return {
+            "outcome_counts": self.outcome_counts,
+            "escalations_used": self.strategies_used,
+            "total_urls_attempted": total_urls,
+            "total_attempts": self.total_attempts,
+            "effective_success_rate": round(successes / total_urls, 3),
+            "average_attempts_per_url": round(self.total_attempts / total_urls, 2),
+        }
+
+
 def _build_access_summary(access_telemetry: list[dict]) -> dict:
     """
     Build site-level access summary from per-URL attempt telemetry.
@@ -37,34 +76,73 @@ def _build_access_summary(access_telemetry: list[dict]) -> dict:
     Returns:
         Dict with outcome_counts and escalations_used summaries.
     """
-    if not access_telemetry:
-        return {}
+    summary = AccessSummary()
+    for entry in access_telemetry or []:
+        summary.add(entry)
+    return summary.to_dict()
 
-    outcome_counts: dict[str, int] = {}
-    strategies_used: dict[str, int] = {}
-    total_attempts = 0
 
-    for entry in access_telemetry:
-        outcome = entry.get("final_outcome", "unknown")
-        outcome_counts[outcome] = outcome_counts.get(outcome, 0) + 1
+def access_telemetry_file(domain: str, sites_dir: Path) -> Path:
+    """
+    The JSONL sidecar holding a seed's per-URL access telemetry.
 
-        attempts = entry.get("attempts", [])
-        total_attempts += len(attempts)
+    Named after the full seed (ups.com/freight -> ups_com_freight), so seeds
+    sharing a base domain don't write the same file.
+    """
+    return sites_dir / f"{domain.replace('.', '_').replace('/', '_')}.attempts.jsonl"
 
-        for strategy in entry.get("escalations_used", []):
-            strategies_used[strategy] = strategies_used.get(strategy, 0) + 1
-
-    successes = outcome_counts.get("success_real_content", 0)
-    total_urls = len(access_telemetry)
-
-    return {
-        "outcome_counts": outcome_counts,
-        "escalations_used": strategies_used,
-        "total_urls_attempted": total_urls,
-        "total_attempts": total_attempts,
-        "effective_success_rate": round(successes / total_urls, 3) if total_urls else 0,
-        "average_attempts_per_url": round(total_attempts / total_urls, 2) if total_urls else 0,
-    }
+
+class AccessTelemetryLog:
+    """
+    Per-URL access telemetry streamed to a JSONL sidecar as each URL completes.
+
+    Only the running AccessSummary stays in memory, so a large site doesn't
+    hold every attempt record until its site JSON is written. Lines go to a
+    temp file that replaces path when the log is closed; if the capture
+    fails, the temp file is discarded and the previous sidecar is kept.
+    With path=None nothing is written and only the summary is kept.
+    """
+
+    def __init__(self, path: Path | None) -> None:
+        self.path = path
+        self.summary = AccessSummary()
+        self._file = None
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+            self._tmp_path = Path(tmp)
+            self._file = os.fdopen(fd, "wb")
+
+    def add(self, entry: dict) -> None:
+        if self._file is not None:
+            if orjson is not None:
+                self._file.write(orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS) + b"\n")
+            else:
+                self._file.write(json.dumps(entry).encode("utf-8") + b"\n")
+        self.summary.add(entry)
+
+    def close(self) -> None:
+        """Finish the log: move the temp file into place."""
+        if self._file is None or self._file.closed:
+            return
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+    def discard(self) -> None:
+        """Drop what was written, leaving any existing sidecar untouched."""
+        if self._file is None or self._file.closed:
+            return
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+    def __enter__(self) -> "AccessTelemetryLog":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
 
 
 def build_capture_site_data(
@@ -75,6 +153,8 @@ def build_capture_site_data(
     site_profile: dict | None = None,
     snapshot_date: str | None = None,
     access_telemetry: list[dict] | None = None,
+    access_telemetry_path: str | None = None,
+    access_summary: dict | None = None,
 ) -> dict:
     domain = carrier["domain"]
     base_domain = domain.split("/")[0] if "/" in domain else domain
@@ -125,10 +205,15 @@ def build_capture_site_data(
         "base_domain": base_domain,
     }
 
-    # Div 4k1: access telemetry
+    # Div 4k1: access telemetry, inline or streamed to a JSONL sidecar
+    # (access_telemetry_path is relative to the sites directory)
     if access_telemetry:
         site_data["access_telemetry"] = access_telemetry
         site_data["access_summary"] = _build_access_summary(access_telemetry)
+    elif access_summary:
+        if access_telemetry_path:
+            site_data["access_telemetry_path"] = access_telemetry_path
+        site_data["access_summary"] = access_summary
 
     return site_data
 
@@ -137,8 +222,11 @@ def write_site_json(site_data: dict, sites_dir: Path) -> Path:
     base_domain = site_data.get("base_domain") or site_data["domain"].split("/")[0]
     site_file = sites_dir / f"{base_domain.replace('.', '_')}.json"
     site_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(site_file, "w") as f:
-        json.dump(site_data, f, indent=2)
+    if orjson is not None:
+        site_file.write_bytes(orjson.dumps(site_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(site_file, "w") as f:
+            json.dump(site_data, f, indent=2)
     return site_file
 
 
@@ -155,7 +243,10 @@ def get_word_count(site_data: dict) -> int:
 
 
 __all__ = [
+    "AccessSummary",
+    "AccessTelemetryLog",
     "_build_access_summary",
+    "access_telemetry_file",
     "build_capture_site_data",
     "get_page_count",
     "get_word_count",
@@ -0,0 +1,139 @@
+"""
+Per-host request pacing for the capture loop.
+
+Keeps the polite delay between requests to the same host while letting
+requests to different hosts (e.g. www. and careers. subdomains found in
+one sitemap) proceed in parallel. AddressLimiter does the same at site
+level for --jobs, capping how many sites share one server IP at a time.
+"""
+
+from __future__ import annotations
+
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+from urllib.parse import urlparse
+
+
+class HostRateLimiter:
+    """Thread-safe spacing of requests per host."""
+
+    def __init__(self) -> None:
+        self._next_ok: dict[str, float] = {}
+        self._held: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, host: str, delay: float) -> float:
+        """
+        Block until a request to host may start, then reserve the next slot.
+
+        The first request to a host starts immediately; each later one starts
+        at least the previous caller's `delay` seconds after the one before.
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_ok.get(host, now))
+            self._next_ok[host] = start + delay
+        wait = start - now
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def acquire_url(self, url: str, delay: float) -> float:
+        """acquire() keyed by the URL's host."""
+        return self.acquire(urlparse(url).netloc, delay)
+
+    @contextmanager
+    def hold_url(self, url: str, delay: float) -> Iterator[None]:
+        """
+        Hold the URL's host for one request, spaced from the end of the last.
+
+        Unlike acquire(), requests to a host never overlap: a holder waits
+        for the previous one to finish and then `delay` seconds more, so a
+        slow response pushes the next request back.
+        """
+        host = urlparse(url).netloc
+        with self._lock:
+            held = self._held.setdefault(host, threading.Lock())
+        with held:
+            self.acquire(host, 0.0)
+            try:
+                yield
+            finally:
+                with self._lock:
+                    self._next_ok[host] = time.monotonic() + delay
+
+    def try_acquire(self, host: str, delay: float) -> bool:
+        """Reserve a start for host if one may start now, without waiting."""
+        with self._lock:
+            now = time.monotonic()
+            if self._next_ok.get(host, now) > now:
+                return False
+            self._next_ok[host] = now + delay
+        return True
+
+
+class AddressLimiter:
+    """
+    Thread-safe cap on concurrent holders per resolved server address.
+
+    Carriers behind the same CDN edge often resolve to one IP; crawling
+    several of them at once just competes for that edge and invites 429s,
+    while sites on distinct addresses don't slow each other down.
+    """
+
+    def __init__(self, per_address: int) -> None:
+        self.per_address = per_address
+        self._slots: dict[str, threading.BoundedSemaphore] = {}
+        self._addresses: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def address(self, host: str) -> str:
+        """The host's IPv4 address (cached), or the host itself if it doesn't resolve."""
+        with self._lock:
+            cached = self._addresses.get(host)
+        if cached is not None:
+            return cached
+        try:
+            addr = socket.gethostbyname(host)
+        except (OSError, UnicodeError):
+            addr = host
+        with self._lock:
+            return self._addresses.setdefault(host, addr)
+
+    def url_address(self, url: str) -> str:
+        """address() of the URL's host."""
+        return self.address(urlparse(url).hostname or "")
+
+    def _slot(self, addr: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._slots.get(addr)
+            if slot is None:
+                slot = self._slots[addr] = threading.BoundedSemaphore(self.per_address)
+        return slot
+
+    def try_acquire(self, addr: str) -> bool:
+        """Take a slot for addr if one is free, without waiting."""
+        return self._slot(addr).acquire(blocking=False)
+
+    def acquire(self, addr: str) -> None:
+        """Take a slot for addr, blocking until one is free."""
+        self._slot(addr).acquire()
+
+    def release(self, addr: str) -> None:
+        self._slot(addr).release()
+
+    @contextmanager
+    def hold_url(self, url: str) -> Iterator[str]:
+        """Hold one of the slots for the URL's server address, blocking until free."""
+        addr = self.url_address(url)
+        self.acquire(addr)
+        try:
+            yield addr
+        finally:
+            self.release(addr)
@@ -0,0 +1,114 @@
+"""
+Process-wide robots.txt cache with TTL, persisted under corpus/cache/robots.
+
+Sites that are re-crawled (e.g. --freshen retries) or crawled by parallel
+jobs reuse the parsed RobotsChecker instead of refetching robots.txt.
+Definitive results are written to disk as <host>.txt (the robots.txt
+body) or <host>.missing (no robots.txt), with the file mtime serving as
+the fetch time, so the cache survives across runs. Transient failures are
+only cached in memory.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+from fetch.robots import RobotsChecker
+
+from .config import CORPUS_DIR
+
+ROBOTS_CACHE_DIR = CORPUS_DIR / "cache" / "robots"
+DEFAULT_TTL = 3600  # seconds
+
+_CACHE: dict[str, tuple[float, RobotsChecker]] = {}
+_LOCK = threading.Lock()
+
+
+def _cache_key(url: str) -> str:
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+def _disk_paths(url: str, cache_dir: Path) -> tuple[Path, Path]:
+    host = urlparse(url).netloc.replace(":", "_")
+    return cache_dir / f"{host}.txt", cache_dir / f"{host}.missing"
+
+
+def _load_from_disk(url: str, cache_dir: Path, ttl: float, now: float) -> tuple[float, RobotsChecker] | None:
+    body_path, missing_path = _disk_paths(url, cache_dir)
+    for path in (body_path, missing_path):
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            continue
+        if now - mtime >= ttl:
+            continue
+        try:
+            content = path.read_text(encoding="utf-8") if path is body_path else None
+        except OSError:
+            continue
+        return mtime, RobotsChecker.from_content(url, content)
+    return None
+
+
+def _save_to_disk(url: str, checker: RobotsChecker, cache_dir: Path) -> None:
+    if checker.error:
+        return
+    body_path, missing_path = _disk_paths(url, cache_dir)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        if checker.found:
+            body_path.write_text(checker.raw_content, encoding="utf-8")
+            missing_path.unlink(missing_ok=True)
+        else:
+            missing_path.touch()
+            body_path.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def get_robots(
+    url: str,
+    ttl: float = DEFAULT_TTL,
+    session=None,
+    cache_dir: Path | None = None,
+) -> RobotsChecker:
+    """
+    Return the RobotsChecker for url's scheme://host, fetching at most once per TTL.
+
+    Args:
+        url: Any URL on the site
+        ttl: Seconds a cached result stays valid
+        session: Optional requests.Session for the fetch
+        cache_dir: On-disk cache location (default: corpus/cache/robots)
+
+    Returns:
+        RobotsChecker instance
+    """
+    cache_dir = cache_dir or ROBOTS_CACHE_DIR
+    key = _cache_key(url)
+    now = time.time()
+
+    with _LOCK:
+        hit = _CACHE.get(key)
+    if hit and now - hit[0] < ttl:
+        return hit[1]
+
+    entry = _load_from_disk(url, cache_dir, ttl, now)
+    if entry is None:
+        checker = RobotsChecker.fetch(url, use_cache=False, session=session)
+        _save_to_disk(url, checker, cache_dir)
+        entry = (now, checker)
+
+    with _LOCK:
+        _CACHE[key] = entry
+    return entry[1]
+
+
+def clear_cache() -> None:
+    """Drop in-memory entries (the on-disk cache is left in place)."""
+    with _LOCK:
+        _CACHE.clear()
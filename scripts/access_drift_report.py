@@ -15,6 +15,7 @@ Usage:
 """
 
 import argparse
+import heapq
 import json
 import sys
 from collections import defaultdict
@@ -39,8 +40,8 @@ def load_seeds() -> list[dict]:
     return data.get("carriers", [])
 
 
-def load_site_data(domain: str) -> dict | None:
-    """Load current crawl data for a domain."""
+def find_site_file(domain: str) -> Path | None:
+    """Locate the current crawl JSON for a domain."""
     filename = domain.replace(".", "_").replace("/", "_") + ".json"
     filepath = SITES_DIR / filename
 
@@ -53,6 +54,16 @@ def load_site_data(domain: str) -> dict | None:
     if not filepath.exists():
         return None
 
+    return filepath
+
+
+def load_site_data(domain: str, filepath: Path | None = None) -> dict | None:
+    """Load current crawl data for a domain."""
+    if filepath is None:
+        filepath = find_site_file(domain)
+    if filepath is None:
+        return None
+
     try:
         return json.loads(filepath.read_text())
     except (json.JSONDecodeError, OSError):
@@ -233,19 +244,32 @@ def analyze_all_drift(threshold: float = 0.3, domain_filter: str = None) -> list
         if domain_filter and domain != domain_filter:
             continue
 
-        # Load current data
-        site_data = load_site_data(domain)
-        if site_data is None:
+        filepath = find_site_file(domain)
+        if filepath is None:
             continue
-
-        # Extract current snapshot
-        current = extract_snapshot(site_data)
-        if current is None:
+        try:
+            mtime_ns = filepath.stat().st_mtime_ns
+        except OSError:
             continue
 
         # Get previous snapshot from history
         previous = history.get("snapshots", {}).get(domain)
 
+        if previous and previous.get("mtime_ns") == mtime_ns:
+            # File untouched since last snapshot - skip the parse
+            current = previous
+        else:
+            # Load current data
+            site_data = load_site_data(domain, filepath)
+            if site_data is None:
+                continue
+
+            # Extract current snapshot
+            current = extract_snapshot(site_data)
+            if current is None:
+                continue
+            current["mtime_ns"] = mtime_ns
+
         if previous:
             # Compare
             drift = compare_snapshots(previous, current, threshold)
@@ -312,9 +336,8 @@ def format_report(drifts: list[dict]) -> str:
     if content_changes:
         lines.append("CONTENT CHANGES")
         lines.append("-" * 40)
-        # Sort by absolute change
-        content_changes.sort(key=lambda x: abs(x[1]), reverse=True)
-        for domain, change in content_changes[:15]:
+        # Largest absolute changes first
+        for domain, change in heapq.nlargest(15, content_changes, key=lambda x: abs(x[1])):
             arrow = "+" if change > 0 else ""
             lines.append(f"  {domain:35} {arrow}{change:.1%}")
         lines.append("")
@@ -17,12 +17,22 @@ Usage:
 """
 
 import argparse
+import heapq
 import json
+import mmap
+import os
 import sys
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -31,6 +41,17 @@ PROJECT_ROOT = Path(__file__).parent.parent
 SEEDS_FILE = PROJECT_ROOT / "seeds" / "trucking_carriers.json"
 SITES_DIR = PROJECT_ROOT / "corpus" / "sites"
 
+# Site loading is I/O-bound; threads overlap the file reads
+LOAD_WORKERS = 32
+
+# orjson parses bytes directly and is several times faster on large corpora
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Below this size mmap setup costs more than a plain read
+MMAP_MIN_BYTES = 64 * 1024
+
+SNAPSHOT_DATE_FORMAT = "%Y-%m-%d"
+
 
 def load_seeds() -> dict:
     """Load carrier seeds file."""
@@ -39,45 +60,99 @@ def load_seeds() -> dict:
     return json.loads(SEEDS_FILE.read_text())
 
 
-def load_site_data(domain: str) -> dict | None:
+def _read_site_file(filepath: Path) -> dict:
+    """Parse a site JSON file, memory-mapping large files for orjson."""
+    if orjson is None:
+        return _loads(filepath.read_bytes())
+
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_MIN_BYTES:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def build_site_index() -> tuple[dict[str, Path], dict[str, list[Path]]]:
+    """
+    Index the sites directory with a single scandir.
+
+    Returns (index, prefix_map): filename -> path, and the leading
+    filename token (before the first "_") -> candidate paths.
+    """
+    index = {}
+    prefix_map = defaultdict(list)
+    if not SITES_DIR.exists():
+        return index, prefix_map
+
+    with os.scandir(SITES_DIR) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".json"):
+                continue
+            path = SITES_DIR / entry.name
+            index[entry.name] = path
+            if not entry.name.endswith("_summary.json"):
+                prefix_map[entry.name.split("_", 1)[0]].append(path)
+
+    return index, prefix_map
+
+
+def load_site_data(
+    domain: str,
+    index: dict[str, Path] | None = None,
+    prefix_map: dict[str, list[Path]] | None = None,
+) -> dict | None:
     """Load crawl data for a domain."""
+    if index is None or prefix_map is None:
+        index, prefix_map = build_site_index()
+
     # Normalize domain to filename
     filename = domain.replace(".", "_").replace("/", "_") + ".json"
-    filepath = SITES_DIR / filename
+    filepath = index.get(filename)
 
-    if not filepath.exists():
+    if filepath is None:
         # Try alternate patterns
-        for f in SITES_DIR.glob(f"{domain.split('.')[0]}*.json"):
-            if not f.name.endswith("_summary.json"):
-                filepath = f
-                break
+        candidates = prefix_map.get(domain.split(".")[0])
+        if candidates:
+            filepath = candidates[0]
 
-    if not filepath.exists():
+    if filepath is None:
         return None
 
     try:
-        return json.loads(filepath.read_text())
+        return _read_site_file(filepath)
     except (json.JSONDecodeError, OSError):
         return None
 
 
-def get_crawl_age_days(site_data: dict) -> float | None:
-    """Get age of crawl in days."""
+def get_crawl_age_days(site_data: dict, now: datetime | None = None) -> float | None:
+    """
+    Get age of crawl in days.
+
+    Pass a shared `now` when scoring many sites so the clock is read once
+    per report rather than once per site.
+    """
+    if now is None:
+        now = datetime.now(timezone.utc)
+
     crawl_start = site_data.get("crawl_start")
     if not crawl_start:
         # Fall back to snapshot_date
         snapshot = site_data.get("snapshot_date")
         if snapshot:
             try:
-                dt = datetime.strptime(snapshot, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-                return (datetime.now(timezone.utc) - dt).total_seconds() / 86400
+                dt = datetime.strptime(snapshot, SNAPSHOT_DATE_FORMAT).replace(tzinfo=timezone.utc)
+                return (now - dt).total_seconds() / 86400
             except ValueError:
                 pass
         return None
 
+    # fromisoformat only accepts a trailing "Z" from Python 3.11
+    if crawl_start.endswith("Z"):
+        crawl_start = crawl_start[:-1] + "+00:00"
+
     try:
-        dt = datetime.fromisoformat(crawl_start.replace("Z", "+00:00"))
-        return (datetime.now(timezone.utc) - dt).total_seconds() / 86400
+        dt = datetime.fromisoformat(crawl_start)
+        return (now - dt).total_seconds() / 86400
     except ValueError:
         return None
 
@@ -91,21 +166,26 @@ def analyze_access() -> dict:
     - by_method: {method: count}
     - blocked_domains: [(domain, reason)]
     - freshness: {fresh, stale, missing}
-    - escalations: Counter of escalation patterns
+    - escalations: {pattern: count}
     """
     seeds = load_seeds()
     carriers = seeds.get("carriers", [])
 
     # Track metrics
-    by_tier = defaultdict(lambda: {"success": 0, "failed": 0, "blocked": 0, "total": 0})
-    by_method = Counter()
+    # Per-tier counters kept as parallel dicts; combined into by_tier at the end
+    tier_total = defaultdict(int)
+    tier_success = defaultdict(int)
+    tier_failed = defaultdict(int)
+    tier_blocked = defaultdict(int)
+    by_method = defaultdict(int)
     outcome_counts = Counter()
     blocked_domains = []
     freshness = {"fresh": 0, "stale": 0, "missing": 0}
-    escalations = Counter()
+    escalations = defaultdict(int)
     word_counts = []
     page_counts = []
 
+    targets = []
     for carrier in carriers:
         domain = carrier.get("domain", "")
         tier = carrier.get("tier", 3)
@@ -117,13 +197,27 @@ def analyze_access() -> dict:
         else:
             base_domain = domain
 
-        by_tier[tier]["total"] += 1
+        targets.append((base_domain, tier, name))
 
-        # Load crawl data
-        site_data = load_site_data(base_domain)
+    # One clock read for the whole report keeps freshness consistent
+    now = datetime.now(timezone.utc)
+
+    # Load crawl data up front, overlapping file reads
+    index, prefix_map = build_site_index()
+    if targets:
+        with ThreadPoolExecutor(max_workers=min(LOAD_WORKERS, len(targets))) as executor:
+            loaded = list(executor.map(
+                lambda domain: load_site_data(domain, index, prefix_map),
+                [t[0] for t in targets],
+            ))
+    else:
+        loaded = []
+
+    for (base_domain, tier, name), site_data in zip(targets, loaded):
+        tier_total[tier] += 1
 
         if site_data is None:
-            by_tier[tier]["failed"] += 1
+            tier_failed[tier] += 1
             freshness["missing"] += 1
             blocked_domains.append((base_domain, "no_crawl_data", tier, name))
             continue
@@ -133,17 +227,17 @@ def analyze_access() -> dict:
         total_words = site_data.get("total_word_count", 0)
 
         if len(pages) == 0 or total_words < 100:
-            by_tier[tier]["failed"] += 1
+            tier_failed[tier] += 1
             blocked_domains.append((base_domain, "low_content", tier, name))
         else:
-            by_tier[tier]["success"] += 1
+            tier_success[tier] += 1
             word_counts.append(total_words)
             page_counts.append(len(pages))
 
         # Check blocked status
         access = site_data.get("access", {})
         if access.get("blocked"):
-            by_tier[tier]["blocked"] += 1
+            tier_blocked[tier] += 1
             reason = access.get("notes", "unknown")
             blocked_domains.append((base_domain, reason, tier, name))
 
@@ -162,7 +256,7 @@ def analyze_access() -> dict:
             escalations[esc] += 1
 
         # Check freshness (stale if >30 days old)
-        age = get_crawl_age_days(site_data)
+        age = get_crawl_age_days(site_data, now)
         if age is None:
             freshness["missing"] += 1
         elif age > 30:
@@ -170,8 +264,18 @@ def analyze_access() -> dict:
         else:
             freshness["fresh"] += 1
 
+    by_tier = {
+        tier: {
+            "success": tier_success[tier],
+            "failed": tier_failed[tier],
+            "blocked": tier_blocked[tier],
+            "total": total,
+        }
+        for tier, total in tier_total.items()
+    }
+
     return {
-        "by_tier": dict(by_tier),
+        "by_tier": by_tier,
         "by_method": dict(by_method),
         "blocked_domains": blocked_domains,
         "freshness": freshness,
@@ -272,8 +376,9 @@ def format_report(analysis: dict, metrics: dict, tier_filter: int | None = None)
     # Method distribution
     lines.append("METHOD DISTRIBUTION")
     lines.append("-" * 40)
-    for method, count in sorted(analysis["by_method"].items(), key=lambda x: -x[1]):
-        pct = count / sum(analysis["by_method"].values()) if analysis["by_method"] else 0
+    method_total = sum(analysis["by_method"].values()) or 1
+    for method, count in sorted(analysis["by_method"].items(), key=itemgetter(1), reverse=True):
+        pct = count / method_total
         lines.append(f"  {method:20} {count:4} ({pct:.1%})")
     lines.append("")
 
@@ -283,7 +388,7 @@ def format_report(analysis: dict, metrics: dict, tier_filter: int | None = None)
         lines.append("ACCESS OUTCOMES")
         lines.append("-" * 40)
         total_outcomes = sum(outcomes.values()) or 1
-        for outcome, count in sorted(outcomes.items(), key=lambda x: -x[1]):
+        for outcome, count in sorted(outcomes.items(), key=itemgetter(1), reverse=True):
             lines.append(f"  {outcome:24} {count:4} ({count/total_outcomes:.1%})")
         lines.append("")
 
@@ -291,7 +396,7 @@ def format_report(analysis: dict, metrics: dict, tier_filter: int | None = None)
     if analysis["escalations"]:
         lines.append("ESCALATION PATTERNS")
         lines.append("-" * 40)
-        for pattern, count in sorted(analysis["escalations"].items(), key=lambda x: -x[1])[:10]:
+        for pattern, count in heapq.nlargest(10, analysis["escalations"].items(), key=itemgetter(1)):
             lines.append(f"  {pattern:30} {count}")
         lines.append("")
 
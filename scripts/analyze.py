@@ -8,22 +8,106 @@ Generates:
 - The "mean website" - aggregate/typical site structure and content
 """
 
+import hashlib
 import json
+import pickle
 import re
-from collections import Counter, defaultdict
+import sys
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 PROJECT_ROOT = Path(__file__).parent.parent
 SITES_DIR = PROJECT_ROOT / "corpus" / "sites"
 ANALYSIS_DIR = PROJECT_ROOT / "analysis"
 
+# Site loading is I/O-bound; threads overlap the file reads
+LOAD_WORKERS = 32
+
+# orjson parses bytes directly and is several times faster on large corpora
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Pages per n-gram work item when generate_report runs with jobs > 1
+NGRAM_BATCH_PAGES = 200
+
+_WORD_RE = re.compile(r'\b[a-zA-Z]+\b')
+
+
+def _intern_site(site: dict) -> dict:
+    """Intern the short labels repeated across every page of the corpus."""
+    if isinstance(site.get('domain'), str):
+        site['domain'] = sys.intern(site['domain'])
+    for page in site.get('pages', []):
+        page_type = page.get('page_type')
+        if isinstance(page_type, str):
+            page['page_type'] = sys.intern(page_type)
+    return site
+
+
+def _load_site_file(path: Path) -> dict:
+    """Parse a single site JSON file."""
+    return _intern_site(_loads(path.read_bytes()))
+
 
-def load_all_sites() -> list[dict]:
+def iter_sites(files: list[Path] | None = None):
+    """
+    Yield site dicts one at a time.
+
+    Files are read on a thread pool, at most one batch ahead of the
+    consumer, so only a bounded number of parsed sites is alive at once.
+    """
+    if files is None:
+        files = list(SITES_DIR.glob("*.json"))
+    if not files:
+        return
+
+    batch_size = LOAD_WORKERS * 2
+    with ThreadPoolExecutor(max_workers=min(LOAD_WORKERS, len(files))) as executor:
+        for start in range(0, len(files), batch_size):
+            yield from executor.map(_load_site_file, files[start:start + batch_size])
+
+
+def load_all_sites(files: list[Path] | None = None) -> list[dict]:
     """Load all site JSON files."""
-    sites = []
-    for f in SITES_DIR.glob("*.json"):
-        with open(f) as fp:
-            sites.append(json.load(fp))
+    return list(iter_sites(files))
+
+
+def load_all_sites_cached(files: list[Path] | None = None) -> list[dict]:
+    """
+    Load all sites, reusing a pickled copy when the corpus is unchanged.
+
+    The cache is keyed on a hash of every file's path, size and mtime, so
+    a recrawl, an added or removed site, or a file replaced by an older
+    copy (rsync, cp -p, git checkout) invalidates it.
+    """
+    if files is None:
+        files = list(SITES_DIR.glob("*.json"))
+    if not files:
+        return []
+
+    key = hashlib.sha1()
+    for path, stat in sorted((str(f), f.stat()) for f in files):
+        key.update(f"{path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    cache_path = ANALYSIS_DIR / f".corpus_cache.{key.hexdigest()[:16]}.pkl"
+
+    if cache_path.exists():
+        try:
+            return pickle.loads(cache_path.read_bytes())
+        except (pickle.UnpicklingError, EOFError, OSError):
+            pass
+
+    sites = load_all_sites(files)
+
+    ANALYSIS_DIR.mkdir(parents=True, exist_ok=True)
+    for stale in ANALYSIS_DIR.glob(".corpus_cache.*.pkl"):
+        stale.unlink(missing_ok=True)
+    cache_path.write_bytes(pickle.dumps(sites, protocol=pickle.HIGHEST_PROTOCOL))
+
     return sites
 
 
@@ -38,7 +122,8 @@ def term_frequency_report(sites: list[dict]) -> dict:
     per_category = defaultdict(Counter)
 
     for site in sites:
-        site_terms = Counter(site.get('term_counts', {}))
+        # Counter.update takes plain mappings; no need to wrap each site
+        site_terms = site.get('term_counts', {})
         global_counts.update(site_terms)
         per_site[site['domain']] = dict(site_terms)
 
@@ -57,26 +142,56 @@ def term_frequency_report(sites: list[dict]) -> dict:
     }
 
 
+def _tokenize(text: str) -> list[str]:
+    """Lowercase text and split it into alphabetic words."""
+    return _WORD_RE.findall(text.lower())
+
+
+def _ngram_tuples(words: list[str], n: int):
+    """Yield n-grams over a word list as word tuples."""
+    return zip(*[words[i:] for i in range(n)])
+
+
+def _top_ngrams(counts: Counter, n: int, top_k: int) -> dict:
+    """Join the top_k n-gram tuples into the report format."""
+    return {
+        'n': n,
+        'top': {' '.join(ng): count for ng, count in counts.most_common(top_k)},
+    }
+
+
+def _count_ngrams_into(texts: list[str], bigrams: Counter, trigrams: Counter) -> None:
+    """Tokenize each text once and add its bigrams and trigrams."""
+    for text in texts:
+        words = _tokenize(text)
+        bigrams.update(_ngram_tuples(words, 2))
+        trigrams.update(_ngram_tuples(words, 3))
+
+
+def _count_ngram_batch(texts: list[str]) -> tuple[Counter, Counter]:
+    """Process-pool entry point: bigram and trigram counts for a batch."""
+    bigrams = Counter()
+    trigrams = Counter()
+    _count_ngrams_into(texts, bigrams, trigrams)
+    return bigrams, trigrams
+
+
 def compute_ngrams(text: str, n: int = 2) -> Counter:
     """Compute n-grams from text."""
-    words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
-    ngrams = zip(*[words[i:] for i in range(n)])
-    return Counter(' '.join(ng) for ng in ngrams)
+    return Counter(' '.join(ng) for ng in _ngram_tuples(_tokenize(text), n))
 
 
 def corpus_ngrams(sites: list[dict], n: int = 2, top_k: int = 100) -> dict:
     """Compute n-grams across entire corpus."""
+    # Count word tuples and only join the top_k survivors into strings
     all_ngrams = Counter()
 
     for site in sites:
         for page in site.get('pages', []):
             text = page.get('full_text', '')
-            all_ngrams.update(compute_ngrams(text, n))
+            all_ngrams.update(_ngram_tuples(_tokenize(text), n))
 
-    return {
-        'n': n,
-        'top': dict(all_ngrams.most_common(top_k)),
-    }
+    return _top_ngrams(all_ngrams, n, top_k)
 
 
 def mean_website(sites: list[dict]) -> dict:
@@ -94,26 +209,28 @@ def mean_website(sites: list[dict]) -> dict:
     if not sites:
         return {}
 
-    # Page type distribution
+    # Page type distribution, with running word-count sums per type
     page_type_counts = Counter()
-    page_type_word_counts = defaultdict(list)
+    page_type_word_sums = defaultdict(int)
 
     # H1s and headings
     all_h1s = Counter()
     all_headings = Counter()
 
     # Structure
-    total_pages = []
-    pages_by_type = defaultdict(list)
+    total_pages = 0
+    sites_with_page_type = defaultdict(set)
 
     for site in sites:
+        domain = site['domain']
         pages = site.get('pages', [])
-        total_pages.append(len(pages))
+        total_pages += len(pages)
 
         for page in pages:
             pt = page.get('page_type', 'other')
             page_type_counts[pt] += 1
-            page_type_word_counts[pt].append(page.get('word_count', 0))
+            page_type_word_sums[pt] += page.get('word_count', 0)
+            sites_with_page_type[page.get('page_type')].add(domain)
 
             if page.get('h1'):
                 # Normalize H1 for comparison (lowercase, strip)
@@ -126,18 +243,14 @@ def mean_website(sites: list[dict]) -> dict:
                     all_headings[heading_normalized] += 1
 
     # Compute averages
-    avg_pages = sum(total_pages) / len(total_pages) if total_pages else 0
+    avg_pages = total_pages / len(sites)
 
-    avg_word_count_by_type = {}
-    for pt, counts in page_type_word_counts.items():
-        avg_word_count_by_type[pt] = sum(counts) / len(counts) if counts else 0
+    avg_word_count_by_type = {
+        pt: page_type_word_sums[pt] / count
+        for pt, count in page_type_counts.items()
+    }
 
     # Page types that appear in >50% of sites
-    sites_with_page_type = defaultdict(set)
-    for site in sites:
-        for page in site.get('pages', []):
-            sites_with_page_type[page.get('page_type')].add(site['domain'])
-
     common_page_types = {
         pt: len(domains) / len(sites)
         for pt, domains in sites_with_page_type.items()
@@ -199,21 +312,105 @@ def h1_analysis(sites: list[dict]) -> dict:
     }
 
 
-def generate_report(sites: list[dict]) -> dict:
-    """Generate full analysis report."""
+# Page fields used by the report sections other than n-grams
+_REPORT_PAGE_FIELDS = ('page_type', 'word_count', 'h1', 'term_counts')
+
+
+def _slim_page(page: dict) -> dict:
+    """Drop page text, keeping only the fields the report needs."""
+    slim = {k: page[k] for k in _REPORT_PAGE_FIELDS if k in page}
+    if 'sections' in page:
+        slim['sections'] = [{'heading': sec.get('heading')} for sec in page['sections']]
+    return slim
+
+
+def _find_site(by_domain: dict[str, dict], query: str) -> dict | None:
+    """Look up a site by exact domain, falling back to a substring match."""
+    site = by_domain.get(query)
+    if site is not None:
+        return site
+    return next((s for domain, s in by_domain.items() if query in domain), None)
+
+
+def generate_report(sites, jobs: int = 1) -> dict:
+    """
+    Generate full analysis report.
+
+    sites may be any iterable, e.g. iter_sites(). Bigrams and trigrams
+    are counted as each site streams past; page text is then dropped so
+    the remaining sections run over a slim copy of the corpus.
+
+    With jobs > 1, n-gram counting runs on a process pool in batches of
+    page text. Batches are merged in submission order, so the result
+    (including tie order) matches the serial path.
+    """
+    bigrams = Counter()
+    trigrams = Counter()
+    slim_sites = []
+
+    # Summary scalars, accumulated during the single pass over sites
+    total_pages = 0
+    total_words = 0
+    by_tier = Counter()
+    by_category = Counter()
+
+    executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    pending = deque()
+    batch = []
+
+    def merge(result: tuple[Counter, Counter]) -> None:
+        bigrams.update(result[0])
+        trigrams.update(result[1])
+
+    try:
+        for site in sites:
+            pages = site.get('pages', [])
+            texts = [page.get('full_text', '') for page in pages]
+
+            if executor is None:
+                _count_ngrams_into(texts, bigrams, trigrams)
+            else:
+                batch.extend(texts)
+                if len(batch) >= NGRAM_BATCH_PAGES:
+                    pending.append(executor.submit(_count_ngram_batch, batch))
+                    batch = []
+                    # Bound in-flight batches so queued text stays small
+                    while len(pending) > jobs * 2:
+                        merge(pending.popleft().result())
+
+            total_pages += site['structure']['total_pages']
+            total_words += site['total_word_count']
+            by_tier[site['tier']] += 1
+            by_category.update(site.get('category', []))
+
+            slim_sites.append({**site, 'pages': [_slim_page(p) for p in pages]})
+
+        if executor is not None:
+            if batch:
+                pending.append(executor.submit(_count_ngram_batch, batch))
+            while pending:
+                merge(pending.popleft().result())
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    sites = slim_sites
+    term_frequency = term_frequency_report(sites)
+
     return {
         'summary': {
             'total_sites': len(sites),
-            'total_pages': sum(s['structure']['total_pages'] for s in sites),
-            'total_words': sum(s['total_word_count'] for s in sites),
-            'by_tier': Counter(s['tier'] for s in sites),
-            'by_category': Counter(cat for s in sites for cat in s.get('category', [])),
+            'total_pages': total_pages,
+            'total_words': total_words,
+            'by_tier': by_tier,
+            'by_category': by_category,
         },
-        'term_frequency': term_frequency_report(sites),
-        'bigrams': corpus_ngrams(sites, n=2, top_k=50),
-        'trigrams': corpus_ngrams(sites, n=3, top_k=50),
+        'term_frequency': term_frequency,
+        'bigrams': _top_ngrams(bigrams, 2, 50),
+        'trigrams': _top_ngrams(trigrams, 3, 50),
         'mean_website': mean_website(sites),
-        'comparison_matrix': site_comparison_matrix(sites),
+        # Global counts are already ranked; reuse them for the matrix columns
+        'comparison_matrix': site_comparison_matrix(sites, list(term_frequency['global'])[:20]),
         'homepage_h1s': h1_analysis(sites),
     }
 
@@ -225,17 +422,20 @@ def main():
     parser.add_argument('--output', '-o', default='report.json', help='Output file')
     parser.add_argument('--term', '-t', help='Show sites mentioning specific term')
     parser.add_argument('--compare', nargs=2, help='Compare two domains')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Worker processes for n-gram counting in the full report')
     args = parser.parse_args()
 
-    sites = load_all_sites()
+    files = list(SITES_DIR.glob("*.json"))
 
-    if not sites:
+    if not files:
         print("No sites found in corpus. Run crawl.py first.")
         return
 
-    print(f"Loaded {len(sites)} sites")
+    print(f"Found {len(files)} sites")
 
     if args.term:
+        sites = load_all_sites_cached(files)
         # Quick term lookup
         term = args.term.lower()
         print(f"\nSites mentioning '{term}':")
@@ -247,9 +447,11 @@ def main():
 
     if args.compare:
         # Compare two sites
+        sites = load_all_sites_cached(files)
         d1, d2 = args.compare
-        s1 = next((s for s in sites if d1 in s['domain']), None)
-        s2 = next((s for s in sites if d2 in s['domain']), None)
+        by_domain = {s['domain']: s for s in sites}
+        s1 = _find_site(by_domain, d1)
+        s2 = _find_site(by_domain, d2)
 
         if not s1 or not s2:
             print("Could not find both domains")
@@ -259,24 +461,34 @@ def main():
         print(f"  Pages: {s1['structure']['total_pages']} vs {s2['structure']['total_pages']}")
         print(f"  Words: {s1['total_word_count']:,} vs {s2['total_word_count']:,}")
 
-        all_terms = set(s1.get('term_counts', {}).keys()) | set(s2.get('term_counts', {}).keys())
-        print(f"\n  Term comparison:")
-        for term in sorted(all_terms):
-            c1 = s1.get('term_counts', {}).get(term, 0)
-            c2 = s2.get('term_counts', {}).get(term, 0)
+        tc1 = s1.get('term_counts', {})
+        tc2 = s2.get('term_counts', {})
+        # Drop all-zero terms before sorting; only the remainder is shown
+        nonzero = []
+        for term in tc1.keys() | tc2.keys():
+            c1 = tc1.get(term, 0)
+            c2 = tc2.get(term, 0)
             if c1 > 0 or c2 > 0:
-                print(f"    {term}: {c1} vs {c2}")
+                nonzero.append((term, c1, c2))
+
+        print(f"\n  Term comparison:")
+        for term, c1, c2 in sorted(nonzero):
+            print(f"    {term}: {c1} vs {c2}")
         return
 
     # Full report
     print("Generating full report...")
-    report = generate_report(sites)
+    report = generate_report(iter_sites(files), jobs=args.jobs)
 
     ANALYSIS_DIR.mkdir(parents=True, exist_ok=True)
     output_path = ANALYSIS_DIR / args.output
 
-    with open(output_path, 'w') as f:
-        json.dump(report, f, indent=2)
+    if orjson is not None:
+        # by_tier is keyed by int tier, hence OPT_NON_STR_KEYS
+        data = orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(report, indent=2).encode()
+    output_path.write_bytes(data)
 
     print(f"Report saved to {output_path}")
 
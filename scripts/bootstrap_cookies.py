@@ -7,22 +7,37 @@ import argparse
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def save_cookies(domain: str, cookies: list[dict]) -> Path:
     cookies_dir = Path.home() / ".crawl" / "cookies"
     cookies_dir.mkdir(parents=True, exist_ok=True)
     path = cookies_dir / f"{domain}.json"
-    path.write_text(json.dumps(cookies, indent=2), encoding="utf-8")
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(cookies, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(cookies, indent=2), encoding="utf-8")
     return path
 
 
 def main() -> None:
-    parser = argparse.ArgumentParser(description="Bootstrap cookies for a domain")
-    parser.add_argument("--domain", required=True, help="Domain to open (e.g., knight-swift.com)")
-    parser.add_argument("--url", help="Optional full URL (defaults to https://www.{domain})")
+    parser = argparse.ArgumentParser(description="Bootstrap cookies for one or more domains")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--domain", help="Domain to open (e.g., knight-swift.com)")
+    target.add_argument("--domains", help="Comma-separated domains to bootstrap in one browser session")
+    parser.add_argument("--url", help="Optional full URL (defaults to https://www.{domain}; single domain only)")
     args = parser.parse_args()
 
-    url = args.url or f"https://www.{args.domain}"
+    if args.domains:
+        if args.url:
+            parser.error("--url can only be used with --domain")
+        targets = [(d, f"https://www.{d}") for d in (d.strip() for d in args.domains.split(",")) if d]
+    else:
+        targets = [(args.domain, args.url or f"https://www.{args.domain}")]
 
     try:
         from playwright.sync_api import sync_playwright
@@ -30,15 +45,18 @@ def main() -> None:
         print("Playwright is required: pip install playwright && playwright install")
         return
 
+    # One browser launch for the whole batch; each domain gets a fresh context
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=False)
-        context = browser.new_context()
-        page = context.new_page()
-        page.goto(url)
-        input(f"Solve any challenges for {args.domain}, then press Enter to save cookies...")
-        cookies = context.cookies()
-        path = save_cookies(args.domain, cookies)
-        print(f"Saved {len(cookies)} cookies to {path}")
+        for domain, url in targets:
+            context = browser.new_context()
+            page = context.new_page()
+            page.goto(url)
+            input(f"Solve any challenges for {domain}, then press Enter to save cookies...")
+            cookies = context.cookies()
+            path = save_cookies(domain, cookies)
+            print(f"Saved {len(cookies)} cookies to {path}")
+            context.close()
         browser.close()
 
 
@@ -9,12 +9,21 @@ Usage:
 """
 
 import argparse
+import glob
+import hashlib
 import json
 import re
 import sys
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -39,42 +48,131 @@ BUCKETS = {
     ],
 }
 
+# Sentence boundary: terminal punctuation followed by whitespace. Matching
+# the punctuation directly (rather than via a lookbehind) lets the engine
+# skip ahead to candidate characters, roughly halving the scan time.
+_SENT_END_RE = re.compile(r"[.!?]\s+")
+
+# Write buffer for markdown reports; small per-line writes coalesce into
+# large write() calls
+REPORT_BUFFER_BYTES = 1 << 20
+
+# Classification results keyed by a digest of the page text, so repeated
+# pages (and repeated calls for the same page) run the NLP pass once
+_CLASSIFY_CACHE: dict[bytes, dict[str, list[str]]] = {}
+
+# One alternation per bucket; finds every keyword occurrence in a single
+# scan of the lowered text
+_BUCKET_PATTERNS = {
+    bucket: re.compile("|".join(re.escape(k) for k in keywords))
+    for bucket, keywords in BUCKETS.items()
+}
+
 
 def _read_json(path: Path) -> dict:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
+def _dump_json(data: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _sentence_bounds(text: str) -> tuple[list[int], list[int]]:
+    """Return parallel (starts, ends) offsets of the sentences in text."""
+    starts = [0]
+    ends = []
+    for m in _SENT_END_RE.finditer(text):
+        # Keep the punctuation with the sentence it ends
+        ends.append(m.start() + 1)
+        starts.append(m.end())
+    ends.append(len(text))
+    return starts, ends
+
+
 def _sentences(text: str) -> list[str]:
-    parts = re.split(r"(?<=[.!?])\s+", text)
-    return [p.strip() for p in parts if p.strip()]
+    starts, ends = _sentence_bounds(text)
+    parts = (text[start:end].strip() for start, end in zip(starts, ends))
+    return [p for p in parts if p]
 
 
-def _collect_hits(text: str, keywords: list[str]) -> list[str]:
-    hits = []
+def _prepare_text(text: str) -> tuple[str | None, list[int], list[int]]:
+    """
+    Do the per-page work shared by every bucket scan.
+
+    Returns (lower, starts, ends): the lowered text, or None when lowering
+    changed its length, and the sentence start/end offsets.
+    """
     lower = text.lower()
-    if not any(k in lower for k in keywords):
+    if len(lower) != len(text):
+        lower = None
+    starts, ends = _sentence_bounds(text)
+    return lower, starts, ends
+
+
+def _collect_hits(text: str, bucket: str, prepared: tuple | None = None) -> list[str]:
+    """
+    Return up to 5 sentences of text that mention a keyword from bucket.
+
+    Keyword matches are located with one scan and mapped to sentences by
+    offset. Callers checking several buckets pass the result of
+    _prepare_text so the text is lowered and split only once.
+    """
+    lower, starts, ends = prepared or _prepare_text(text)
+    pattern = _BUCKET_PATTERNS[bucket]
+    hits = []
+    if lower is None:
+        # Case folding changed offsets (rare non-ASCII); check sentence by sentence
+        for start, end in zip(starts, ends):
+            s = text[start:end].strip()
+            if s and pattern.search(s.lower()):
+                hits.append(s)
+                if len(hits) == 5:
+                    break
         return hits
-    for s in _sentences(text):
-        s_lower = s.lower()
-        if any(k in s_lower for k in keywords):
-            hits.append(s)
-    return hits[:5]
+
+    last_idx = -1
+    for m in pattern.finditer(lower):
+        idx = bisect_right(starts, m.start()) - 1
+        if idx == last_idx:
+            continue
+        last_idx = idx
+        hits.append(text[starts[idx]:ends[idx]].strip())
+        if len(hits) == 5:
+            break
+    return hits
 
 
 def _classify_page(page: dict) -> dict[str, list[str]]:
+    """Classify a page's text into bucket snippets, memoized on a text digest."""
     text = " ".join([
         page.get("title") or "",
         page.get("h1") or "",
         page.get("full_text") or "",
     ])
+    key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    cached = _CLASSIFY_CACHE.get(key)
+    if cached is None:
+        cached = _classify_text(text)
+        _CLASSIFY_CACHE[key] = cached
+    # Copy so callers can't mutate the cached lists
+    return {bucket: list(hits) for bucket, hits in cached.items()}
+
+
+def _classify_text(text: str) -> dict[str, list[str]]:
     results: dict[str, list[str]] = {}
 
     try:
-        nlp_data = nlp_utils.extract_all_lightweight(text)
-        audience = nlp_data.get("audience")
-        money_scored = nlp_data.get("money_all_scored", [])
-        comp_keywords = nlp_data.get("comp_keywords", {})
+        # Only the extractors this report reads; extract_all_lightweight would
+        # also run dates/locations/urgency/sentiment on every page
+        money = nlp_utils.dedupe_mentions(nlp_utils.extract_money(text))
+        _, money_scored = nlp_utils.filter_comp_mentions(money, text)
+        comp_keywords = nlp_utils.detect_comp_keywords(text)
+        audience = nlp_utils.classify_audience(text)
 
         # Map audience to a bucket if strong signal
         if audience in results or audience is None:
@@ -96,9 +194,11 @@ def _classify_page(page: dict) -> dict[str, list[str]]:
                 # If audience unknown, attach to drivers as default comp bucket
                 results.setdefault("drivers", []).append(snippet)
 
-        # Add keyword-based sentences for all buckets
-        for bucket, keywords in BUCKETS.items():
-            hits = _collect_hits(text, keywords)
+        # Add keyword-based sentences for all buckets, lowering and
+        # splitting the text once
+        prepared = _prepare_text(text)
+        for bucket in BUCKETS:
+            hits = _collect_hits(text, bucket, prepared)
             if hits:
                 results.setdefault(bucket, []).extend(hits)
 
@@ -108,30 +208,33 @@ def _classify_page(page: dict) -> dict[str, list[str]]:
                 if bucket in results:
                     results[bucket].extend([f"Keywords: {', '.join(sorted(comp_keywords.keys()))}"])
 
-        # De-dupe and trim
+        # De-dupe (order-preserving) and trim
         for bucket in list(results.keys()):
-            deduped = []
-            seen = set()
-            for h in results[bucket]:
-                if h not in seen:
-                    seen.add(h)
-                    deduped.append(h)
-            results[bucket] = deduped[:6]
+            results[bucket] = list(dict.fromkeys(results[bucket]))[:6]
 
     except Exception:
         # Fallback to simple keyword matching
-        for bucket, keywords in BUCKETS.items():
-            hits = _collect_hits(text, keywords)
+        for bucket in BUCKETS:
+            hits = _collect_hits(text, bucket)
             if hits:
                 results[bucket] = hits
 
     return results
 
 
-def _collect_page_hits(page: dict) -> list[dict]:
+def _classify_site(site: dict) -> list[tuple[dict, dict[str, list[str]]]]:
+    """Classify each page once; keep only pages with at least one bucket."""
+    classified_pages = []
+    for page in site.get("pages", []):
+        classified = _classify_page(page)
+        if classified:
+            classified_pages.append((page, classified))
+    return classified_pages
+
+
+def _collect_page_hits(page: dict, classified: dict[str, list[str]]) -> list[dict]:
     """Collect snippets with URLs for diffing."""
     items = []
-    classified = _classify_page(page)
     url = page.get("url", "")
     changed = page.get("changed_since_last")
     for bucket, hits in classified.items():
@@ -145,19 +248,16 @@ def _collect_page_hits(page: dict) -> list[dict]:
     return items
 
 
-def _render_site(site: dict) -> str:
+def _render_site(site: dict, classified_pages: list[tuple[dict, dict[str, list[str]]]]) -> list[str]:
+    """Render one site's markdown section as a list of lines."""
     lines = []
     domain = site.get("domain", "unknown")
     company = site.get("company_name", domain)
     lines.append(f"## {company} ({domain})")
 
-    pages = site.get("pages", [])
     bucket_hits = {k: [] for k in BUCKETS.keys()}
 
-    for p in pages:
-        classified = _classify_page(p)
-        if not classified:
-            continue
+    for p, classified in classified_pages:
         url = p.get("url", "")
         changed = p.get("changed_since_last")
         changed_tag = ""
@@ -180,16 +280,48 @@ def _render_site(site: dict) -> str:
                 lines.append(f"  - “{h}”")
 
     lines.append("")
-    return "\n".join(lines)
+    return lines
+
+
+def _build_site_entry(site: dict, classified_pages: list[tuple[dict, dict[str, list[str]]]]) -> dict:
+    """Build the JSON report entry for one site."""
+    site_entry = {
+        "domain": site.get("domain"),
+        "company_name": site.get("company_name"),
+        "buckets": {k: [] for k in BUCKETS.keys()},
+        "hits": [],
+    }
+    for page, classified in classified_pages:
+        url = page.get("url", "")
+        changed = page.get("changed_since_last")
+        for bucket, hits in classified.items():
+            site_entry["buckets"][bucket].append({
+                "url": url,
+                "changed_since_last": changed,
+                "snippets": hits,
+            })
+        site_entry["hits"].extend(_collect_page_hits(page, classified))
+    return site_entry
+
 
+def _process_site(path: Path) -> tuple[list[str], dict]:
+    """Read, classify and render one site; returns (markdown lines, json entry)."""
+    site = _read_json(path)
+    classified_pages = _classify_site(site)
+    return _render_site(site, classified_pages), _build_site_entry(site, classified_pages)
 
-def _expand_sites(values: Iterable[str]) -> list[Path]:
-    paths = []
+
+def _expand_sites(values: Iterable[str]) -> set[Path]:
+    """Expand site arguments (paths or globs) to the set of existing files."""
+    paths = set()
     for v in values:
-        if "*" in v:
-            paths.extend(Path(".").glob(v))
+        if any(c in v for c in "*?["):
+            # iglob matches only existing files and also accepts absolute patterns
+            paths.update(Path(p) for p in glob.iglob(v, recursive=True))
         else:
-            paths.append(Path(v))
+            p = Path(v)
+            if p.exists():
+                paths.add(p)
     return paths
 
 
@@ -201,24 +333,24 @@ def main() -> None:
     parser.add_argument("--out-json", action="store_true", help="Also write JSON output")
     parser.add_argument("--diff", nargs=2, metavar=("OLD", "NEW"),
                         help="Generate diff report between two JSON reports")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="Parallel worker processes")
     args = parser.parse_args()
 
     if args.diff:
         old_path, new_path = args.diff
-        old = json.loads(Path(old_path).read_text(encoding="utf-8"))
-        new = json.loads(Path(new_path).read_text(encoding="utf-8"))
+        old = _read_json(Path(old_path))
+        new = _read_json(Path(new_path))
         _write_diff_report(old, new)
         return
 
-    site_paths = []
-    if args.site:
-        site_paths.extend([Path(p) for p in args.site])
-    if args.sites:
-        site_paths.extend(_expand_sites(args.sites))
-    if not site_paths:
+    if not args.site and not args.sites:
         raise SystemExit("No sites provided. Use --site or --sites.")
 
-    site_paths = sorted({p for p in site_paths if p.exists()})
+    site_paths = {p for p in map(Path, args.site or []) if p.exists()}
+    if args.sites:
+        site_paths |= _expand_sites(args.sites)
+
+    site_paths = sorted(site_paths)
     if not site_paths:
         raise SystemExit("No valid site files found.")
 
@@ -226,11 +358,12 @@ def main() -> None:
     out_path = Path(args.out) if args.out else Path("corpus/reports") / f"comp_packages_{date_str}.md"
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    lines = []
-    lines.append(f"# Compensation & Inducements Report ({date_str})")
-    lines.append("")
-    lines.append("Buckets: Drivers, Owner Operators, Carriers")
-    lines.append("")
+    header = [
+        f"# Compensation & Inducements Report ({date_str})",
+        "",
+        "Buckets: Drivers, Owner Operators, Carriers",
+        "",
+    ]
 
     json_out = {
         "date": date_str,
@@ -238,54 +371,41 @@ def main() -> None:
         "sites": [],
     }
 
-    for p in site_paths:
-        site = _read_json(p)
-        lines.append(_render_site(site))
-        # Build JSON structure
-        site_entry = {
-            "domain": site.get("domain"),
-            "company_name": site.get("company_name"),
-            "buckets": {k: [] for k in BUCKETS.keys()},
-            "hits": [],
-        }
-        for page in site.get("pages", []):
-            classified = _classify_page(page)
-            if not classified:
-                continue
-            url = page.get("url", "")
-            changed = page.get("changed_since_last")
-            for bucket, hits in classified.items():
-                site_entry["buckets"][bucket].append({
-                    "url": url,
-                    "changed_since_last": changed,
-                    "snippets": hits,
-                })
-            site_entry["hits"].extend(_collect_page_hits(page))
-        json_out["sites"].append(site_entry)
-
-    out_path.write_text("\n".join(lines), encoding="utf-8")
+    # Sites are independent and classification is CPU-bound; map keeps order
+    executor = None
+    if args.jobs > 1 and len(site_paths) > 1:
+        executor = ProcessPoolExecutor(max_workers=min(args.jobs, len(site_paths)))
+    results = executor.map(_process_site, site_paths) if executor else map(_process_site, site_paths)
+
+    # Write each site's section as soon as it is ready instead of
+    # building the whole report string first
+    try:
+        with open(out_path, "wb", buffering=REPORT_BUFFER_BYTES) as f:
+            f.write("\n".join(header).encode("utf-8"))
+            for site_lines, site_entry in results:
+                f.write(("\n" + "\n".join(site_lines)).encode("utf-8"))
+                json_out["sites"].append(site_entry)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
     print(f"Wrote report: {out_path}")
     if args.out_json:
         json_path = out_path.with_suffix(".json")
-        json_path.write_text(json.dumps(json_out, indent=2), encoding="utf-8")
+        json_path.write_bytes(_dump_json(json_out))
         print(f"Wrote report: {json_path}")
 
 
-def _write_diff_report(old: dict, new: dict) -> None:
-    """Write a diff markdown report between two JSON outputs."""
+def _diff_report_lines(old: dict, new: dict, date_str: str) -> Iterator[str]:
+    """Yield the lines of a diff markdown report between two JSON outputs."""
     def key(h):
         return (h.get("bucket"), h.get("url"), h.get("snippet"))
 
     old_sites = {s.get("domain"): s for s in old.get("sites", [])}
     new_sites = {s.get("domain"): s for s in new.get("sites", [])}
 
-    date_str = datetime.now().strftime("%Y-%m-%d")
-    out_path = Path("corpus/reports") / f"comp_packages_diff_{date_str}.md"
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-
-    lines = []
-    lines.append(f"# Compensation Diff Report ({date_str})")
-    lines.append("")
+    yield f"# Compensation Diff Report ({date_str})"
+    yield ""
 
     for domain, new_site in new_sites.items():
         old_site = old_sites.get(domain, {})
@@ -299,21 +419,31 @@ def _write_diff_report(old: dict, new: dict) -> None:
             continue
 
         company = new_site.get("company_name", domain)
-        lines.append(f"## {company} ({domain})")
+        yield f"## {company} ({domain})"
 
         if added:
-            lines.append("### Added")
+            yield "### Added"
             for bucket, url, snippet in sorted(added):
-                lines.append(f"- [{bucket}] {url}")
-                lines.append(f"  - “{snippet}”")
+                yield f"- [{bucket}] {url}"
+                yield f"  - “{snippet}”"
         if removed:
-            lines.append("### Removed")
+            yield "### Removed"
             for bucket, url, snippet in sorted(removed):
-                lines.append(f"- [{bucket}] {url}")
-                lines.append(f"  - “{snippet}”")
-        lines.append("")
+                yield f"- [{bucket}] {url}"
+                yield f"  - “{snippet}”"
+        yield ""
+
+
+def _write_diff_report(old: dict, new: dict) -> None:
+    """Write a diff markdown report between two JSON outputs."""
+    date_str = datetime.now().strftime("%Y-%m-%d")
+    out_path = Path("corpus/reports") / f"comp_packages_diff_{date_str}.md"
+    out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    out_path.write_text("\n".join(lines), encoding="utf-8")
+    # Lines are encoded one at a time; the buffer coalesces the writes
+    with open(out_path, "wb", buffering=REPORT_BUFFER_BYTES) as f:
+        for i, line in enumerate(_diff_report_lines(old, new, date_str)):
+            f.write((line if i == 0 else "\n" + line).encode("utf-8"))
     print(f"Wrote report: {out_path}")
 
 
@@ -21,63 +21,134 @@ Usage:
 
 import argparse
 import asyncio
+import codecs
+import itertools
 import json
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from fetch.monkey import COOKIES_DIR, load_site_cookies, save_site_cookies
 
+# Thread count for scanning the cookie directory
+LOAD_WORKERS = 16
+
+# orjson parses bytes directly and is several times faster than json
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Phrases that mark a block or challenge page in cmd_check
+BLOCK_INDICATORS = (
+    'access denied', '403 forbidden', 'rate limit',
+    'captcha', 'challenge', 'blocked', 'bot detected',
+)
+
+# One case-insensitive scan instead of lowering the body and testing each phrase
+_BLOCK_RE = re.compile('|'.join(map(re.escape, BLOCK_INDICATORS)), re.IGNORECASE)
+
+# Carry-over between streamed chunks so a phrase split across them still matches
+_BLOCK_OVERLAP = max(map(len, BLOCK_INDICATORS)) - 1
+
+# cmd_check reads at most this much of the body before deciding
+CHECK_CHUNK_SIZE = 8192
+MAX_CHECK_CHARS = 256 * 1024
 
-def format_expiry(expires: float | None) -> str:
-    """Format cookie expiry timestamp."""
+
+def format_expiry(expires: float | None, now_ts: float | None = None) -> str:
+    """Format cookie expiry timestamp relative to now_ts (default: current time)."""
     if expires is None or expires < 0:
         return 'session'
 
-    try:
-        dt = datetime.fromtimestamp(expires, tz=timezone.utc)
-        now = datetime.now(timezone.utc)
+    if now_ts is None:
+        now_ts = datetime.now(timezone.utc).timestamp()
 
-        if dt < now:
+    try:
+        remaining = expires - now_ts
+        if remaining < 0:
             return 'EXPIRED'
 
-        delta = dt - now
-        if delta.days > 365:
-            return f'{delta.days // 365}y'
-        elif delta.days > 30:
-            return f'{delta.days // 30}mo'
-        elif delta.days > 0:
-            return f'{delta.days}d'
-        elif delta.seconds > 3600:
-            return f'{delta.seconds // 3600}h'
+        days, seconds = divmod(int(remaining), 86400)
+        if days > 365:
+            return f'{days // 365}y'
+        elif days > 30:
+            return f'{days // 30}mo'
+        elif days > 0:
+            return f'{days}d'
+        elif seconds > 3600:
+            return f'{seconds // 3600}h'
         else:
-            return f'{delta.seconds // 60}m'
+            return f'{seconds // 60}m'
     except Exception:
         return 'unknown'
 
 
-def days_until_expiry(expires: float | None) -> float | None:
-    """Get days until cookie expires."""
+def days_until_expiry(expires: float | None, now_ts: float | None = None) -> float | None:
+    """Get days until cookie expires, relative to now_ts (default: current time)."""
     if expires is None or expires < 0:
         return None
 
+    if now_ts is None:
+        now_ts = datetime.now(timezone.utc).timestamp()
+
     try:
-        dt = datetime.fromtimestamp(expires, tz=timezone.utc)
-        now = datetime.now(timezone.utc)
-        delta = dt - now
-        return delta.total_seconds() / 86400
+        return (expires - now_ts) / 86400
     except Exception:
         return None
 
 
+def _summarize_cookie_file(path: Path, now_ts: float) -> str:
+    """Build the cmd_list row for one cookie file."""
+    domain = path.stem
+    try:
+        cookies = _loads(path.read_bytes())
+        count = len(cookies)
+
+        # Find soonest expiry
+        soonest = None
+        for c in cookies:
+            expires = c.get('expires', -1)
+            if expires > 0 and (soonest is None or expires < soonest):
+                soonest = expires
+        if soonest is not None:
+            expiry_str = format_expiry(soonest, now_ts)
+            days = days_until_expiry(soonest, now_ts)
+            if days is not None and days < 0:
+                status = ' [EXPIRED]'
+            elif days is not None and days < 7:
+                status = ' [EXPIRING SOON]'
+            else:
+                status = ''
+        else:
+            expiry_str = 'session'
+            status = ''
+
+        # File age
+        age_days, age_seconds = divmod(int(now_ts - path.stat().st_mtime), 86400)
+        if age_days > 0:
+            age_str = f'{age_days}d ago'
+        else:
+            age_str = f'{age_seconds // 3600}h ago'
+
+        return f'  {domain:30} {count:3} cookies  expires: {expiry_str:8}  saved: {age_str}{status}'
+
+    except Exception as e:
+        return f'  {domain:30} ERROR: {e}'
+
+
 def cmd_list():
     """List all saved cookie files."""
     COOKIES_DIR.mkdir(parents=True, exist_ok=True)
 
-    cookie_files = list(COOKIES_DIR.glob('*.json'))
+    cookie_files = sorted(COOKIES_DIR.glob('*.json'))
 
     if not cookie_files:
         print('No saved cookies.')
@@ -86,40 +157,12 @@ def cmd_list():
     print(f'Saved Cookies ({len(cookie_files)} domains):')
     print()
 
-    for path in sorted(cookie_files):
-        domain = path.stem
-        try:
-            cookies = json.loads(path.read_text())
-            count = len(cookies)
-
-            # Find soonest expiry
-            expires_list = [c.get('expires', -1) for c in cookies if c.get('expires', -1) > 0]
-            if expires_list:
-                soonest = min(expires_list)
-                expiry_str = format_expiry(soonest)
-                days = days_until_expiry(soonest)
-                if days is not None and days < 0:
-                    status = ' [EXPIRED]'
-                elif days is not None and days < 7:
-                    status = ' [EXPIRING SOON]'
-                else:
-                    status = ''
-            else:
-                expiry_str = 'session'
-                status = ''
-
-            # File age
-            mtime = datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc)
-            age = datetime.now(timezone.utc) - mtime
-            if age.days > 0:
-                age_str = f'{age.days}d ago'
-            else:
-                age_str = f'{age.seconds // 3600}h ago'
+    now_ts = datetime.now(timezone.utc).timestamp()
 
-            print(f'  {domain:30} {count:3} cookies  expires: {expiry_str:8}  saved: {age_str}{status}')
-
-        except Exception as e:
-            print(f'  {domain:30} ERROR: {e}')
+    # Reads and parses overlap across files; rows come back in sorted order
+    with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as executor:
+        for row in executor.map(lambda path: _summarize_cookie_file(path, now_ts), cookie_files):
+            print(row)
 
 
 def cmd_show(domain: str):
@@ -133,6 +176,8 @@ def cmd_show(domain: str):
     print(f'Cookies for {domain} ({len(cookies)}):')
     print()
 
+    now_ts = datetime.now(timezone.utc).timestamp()
+
     for cookie in sorted(cookies, key=lambda c: c.get('name', '')):
         name = cookie.get('name', 'unknown')
         value = cookie.get('value', '')
@@ -143,7 +188,7 @@ def cmd_show(domain: str):
         secure = cookie.get('secure', False)
         same_site = cookie.get('sameSite', 'None')
 
-        expiry_str = format_expiry(expires)
+        expiry_str = format_expiry(expires, now_ts)
         flags = []
         if http_only:
             flags.append('HttpOnly')
@@ -165,6 +210,56 @@ def cmd_show(domain: str):
         print()
 
 
+def _sniff_encoding(prefix: bytes) -> str:
+    """
+    Guess a body's encoding from its first bytes.
+
+    The same detection resp.apparent_encoding runs, but on a prefix so the
+    whole body isn't downloaded; utf-8 if nothing usable is detected.
+    """
+    from requests.compat import chardet
+
+    encoding = chardet.detect(prefix)['encoding'] if chardet is not None else None
+    try:
+        return codecs.lookup(encoding).name if encoding else 'utf-8'
+    except LookupError:
+        return 'utf-8'
+
+
+def _scan_for_block(resp) -> tuple[int, bool, bool]:
+    """
+    Stream a response body looking for block indicators.
+
+    Stops at the first match or after MAX_CHECK_CHARS, keeping the tail of
+    the previous chunk so phrases split across chunks are still found.
+    Without a charset in the headers the encoding is sniffed from the first
+    chunk (see _sniff_encoding).
+
+    Returns:
+        (characters read, blocked, truncated), where truncated means the
+        scan stopped early and the body may be longer
+    """
+    chunks = resp.iter_content(chunk_size=CHECK_CHUNK_SIZE)
+    first = next(chunks, b'')
+    decoder = codecs.getincrementaldecoder(resp.encoding or _sniff_encoding(first))(errors='replace')
+
+    content_len = 0
+    tail = ''
+    for raw in itertools.chain([first], chunks):
+        chunk = decoder.decode(raw)
+        content_len += len(chunk)
+        window = tail + chunk
+        if _BLOCK_RE.search(window):
+            return content_len, True, True
+        if content_len >= MAX_CHECK_CHARS:
+            return content_len, False, True
+        tail = window[-_BLOCK_OVERLAP:]
+
+    # Bytes of an incomplete last character decode to one replacement char
+    content_len += len(decoder.decode(b'', final=True))
+    return content_len, False, False
+
+
 def cmd_check(domain: str) -> bool:
     """Check if cookies are valid by making test request."""
     import requests
@@ -191,7 +286,7 @@ def cmd_check(domain: str) -> bool:
 
     try:
         url = f'https://www.{domain}'
-        resp = requests.get(
+        with requests.get(
             url,
             cookies=cookie_dict,
             headers={
@@ -200,23 +295,16 @@ def cmd_check(domain: str) -> bool:
             },
             timeout=15,
             allow_redirects=True,
-        )
-
-        # Check response
-        status = resp.status_code
-        content_len = len(resp.text)
-
-        # Look for block indicators
-        block_indicators = [
-            'access denied', '403 forbidden', 'rate limit',
-            'captcha', 'challenge', 'blocked', 'bot detected'
-        ]
-        text_lower = resp.text.lower()
-        blocked = any(ind in text_lower for ind in block_indicators)
+            stream=True,
+        ) as resp:
+            # Check response
+            status = resp.status_code
+            content_len, blocked, truncated = _scan_for_block(resp)
 
         print()
         print(f'Status: {status}')
-        print(f'Content length: {content_len:,} bytes')
+        more = '+' if truncated else ''
+        print(f'Content length: {content_len:,}{more} chars')
 
         if status == 200 and content_len > 5000 and not blocked:
             print('Result: VALID - cookies appear to work')
@@ -243,17 +331,22 @@ def cmd_expiring(days: int):
     print(f'Cookies expiring within {days} days:')
     print()
 
+    # Compare raw timestamps against a single cutoff instead of building a
+    # datetime per cookie
+    now_ts = datetime.now(timezone.utc).timestamp()
+    cutoff = now_ts + days * 86400
+
     found_any = False
     for path in sorted(COOKIES_DIR.glob('*.json')):
         domain = path.stem
         try:
-            cookies = json.loads(path.read_text())
+            cookies = _loads(path.read_bytes())
 
             expiring = []
             for c in cookies:
-                d = days_until_expiry(c.get('expires'))
-                if d is not None and d < days:
-                    expiring.append((c.get('name'), d))
+                expires = c.get('expires')
+                if expires is not None and 0 <= expires < cutoff:
+                    expiring.append((c.get('name'), (expires - now_ts) / 86400))
 
             if expiring:
                 found_any = True
@@ -320,6 +413,20 @@ def cmd_delete(domain: str):
     print(f'Deleted cookies for {domain}')
 
 
+def _netscape_line(c: dict) -> str:
+    """Format one cookie as a Netscape cookie-file line."""
+    domain_str = c.get('domain', '')
+    # Netscape format: include_subdomains is TRUE if domain starts with .
+    include_sub = 'TRUE' if domain_str.startswith('.') else 'FALSE'
+    path = c.get('path', '/')
+    secure = 'TRUE' if c.get('secure') else 'FALSE'
+    expires = int(c.get('expires', 0))
+    name = c.get('name', '')
+    value = c.get('value', '')
+
+    return f'{domain_str}\t{include_sub}\t{path}\t{secure}\t{expires}\t{name}\t{value}\n'
+
+
 def cmd_export(domain: str):
     """Export cookies in Netscape format."""
     cookies = load_site_cookies(domain)
@@ -328,24 +435,9 @@ def cmd_export(domain: str):
         print(f'No cookies found for {domain}')
         return
 
-    # Netscape cookie format
-    lines = ['# Netscape HTTP Cookie File']
-
-    for c in cookies:
-        domain_str = c.get('domain', '')
-        # Netscape format: include_subdomains is TRUE if domain starts with .
-        include_sub = 'TRUE' if domain_str.startswith('.') else 'FALSE'
-        path = c.get('path', '/')
-        secure = 'TRUE' if c.get('secure') else 'FALSE'
-        expires = int(c.get('expires', 0))
-        name = c.get('name', '')
-        value = c.get('value', '')
-
-        line = f'{domain_str}\t{include_sub}\t{path}\t{secure}\t{expires}\t{name}\t{value}'
-        lines.append(line)
-
-    output = '\n'.join(lines)
-    print(output)
+    # Netscape cookie format, written line by line rather than joined
+    sys.stdout.write('# Netscape HTTP Cookie File\n')
+    sys.stdout.writelines(_netscape_line(c) for c in cookies)
     print()
     print(f'# {len(cookies)} cookies exported')
 
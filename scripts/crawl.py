@@ -10,23 +10,32 @@ Capture-first crawl pipeline:
 """
 
 import argparse
+import io
 import json
+import multiprocessing
 import os
+import queue
 import random
 import sys
+import threading
 import time
-from dataclasses import asdict
+from collections import deque
+from dataclasses import asdict, fields
 from datetime import datetime, timezone
+from http.cookiejar import DefaultCookiePolicy
 from pathlib import Path
-from urllib.parse import urlparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from contextvars import ContextVar
+
+import requests
+from requests.adapters import HTTPAdapter
 
 try:
-    from tqdm import tqdm
-    TQDM_AVAILABLE = True
+    import orjson
 except ImportError:
-    TQDM_AVAILABLE = False
-    tqdm = None
+    orjson = None
 
 # Add parent dir to path for fetch module
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -42,20 +51,26 @@ from orchestrate.config import (
     load_fetch_profiles,
 )
 from orchestrate.fetch_spec import resolve_fetch_spec, extract_access_hints, _normalize_method
+from orchestrate.rate_limit import AddressLimiter, HostRateLimiter
+from orchestrate.robots_cache import get_robots
 from orchestrate.presenter import (
+    AccessTelemetryLog,
+    access_telemetry_file,
     build_capture_site_data,
     get_page_count,
     get_word_count,
     write_site_json,
 )
 
-from fetch.capture import capture_page, write_manifest
-from fetch.capture_config import CaptureConfig, CaptureResult, AccessAttempt
+from fetch.capture import capture_page, shared_browser, write_manifest
+from fetch.capture_config import AssetRef, CaptureConfig, CaptureResult, AccessAttempt
 from fetch.access_classifier import classify_capture_result, outcome_as_dict
+from fetch.cookies import SiteCookieStore
 from fetch.extractor import extract_from_capture
+from fetch.html_archive import compression_available
 from fetch.recon import recon_site
 from fetch.robots import RobotsChecker
-from fetch.sitemap import discover_sitemap, parse_sitemap
+from fetch.sitemap import find_sitemap
 from fetch.access_policy import (
     AccessPlan,
     build_access_plan,
@@ -66,13 +81,6 @@ from fetch.access_policy import (
     strategy_to_capture_kwargs,
 )
 
-# Monkey queue for terminal failures
-try:
-    from fetch.monkey import add_to_monkey_queue
-    _MONKEY_AVAILABLE = True
-except ImportError:
-    _MONKEY_AVAILABLE = False
-
 # Project paths (from orchestrate.config)
 PROJECT_ROOT = oconfig.PROJECT_ROOT
 CORPUS_DIR = oconfig.CORPUS_DIR
@@ -83,6 +91,95 @@ SITES_DIR = oconfig.SITES_DIR
 # Crawl settings
 DEFAULT_DEPTH = 2
 REQUEST_DELAY = 3.0  # seconds between requests (polite crawling)
+HTTP_POOL_SIZE = 64  # pooled keep-alive connections per host
+URL_CAPTURE_WORKERS = 4  # in-flight captures per site when the plan starts with requests
+# Background extraction threads per site. Extraction is BeautifulSoup tree
+# building, which holds the GIL: 16 pages took the same time on 1, 2 and 4
+# threads, so more workers only add contention. The one worker already
+# overlaps extraction with the capture loop's requests and delays.
+EXTRACT_WORKERS = 1
+STATUS_MIN_INTERVAL = 1.0  # seconds between crawl_status.json rewrites
+
+
+def _build_http_session(pool_size: int = HTTP_POOL_SIZE) -> requests.Session:
+    """Build a session for recon, robots, sitemap and requests captures.
+
+    Connections (TCP + TLS) are pooled across the requests made through it,
+    but the session never stores cookies, so each request goes out just as a
+    one-off requests.get() would.
+    """
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSIONS = threading.local()
+
+
+def _http_session() -> requests.Session:
+    """
+    This thread's pooled session, built on first use.
+
+    requests.Session isn't documented as thread-safe, and --jobs site
+    workers, sitemap discovery and the URL capture pool all make requests
+    at once, so each thread keeps its own session (and connection pool).
+    """
+    session = getattr(_SESSIONS, "session", None)
+    if session is None:
+        session = _SESSIONS.session = _build_http_session()
+    return session
+
+
+# Set per site thread when parallel sites run without --progress, so each
+# site's log is written in one piece instead of interleaving line by line
+_SITE_LOG: ContextVar[io.StringIO | None] = ContextVar("_SITE_LOG", default=None)
+
+
+def _log(*args, **kwargs) -> None:
+    """print() for capture_site output; goes to the site's buffer when one is set."""
+    buf = _SITE_LOG.get()
+    if buf is None:
+        print(*args, **kwargs)
+    else:
+        kwargs.pop("flush", None)
+        print(*args, file=buf, **kwargs)
+
+
+def _load_tqdm():
+    """Import tqdm for --progress runs; None if it is not installed."""
+    try:
+        from tqdm import tqdm
+    except ImportError:
+        return None
+    return tqdm
+
+
+def _load_monkey_queue():
+    """Import the monkey queue (asyncio + human-interaction stack) when a site needs it."""
+    try:
+        from fetch.monkey import add_to_monkey_queue
+    except ImportError:
+        return None
+    return add_to_monkey_queue
+
+
+def _dump_json(data: dict, indent: bool = False) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, indent=2).encode("utf-8")
+    return json.dumps(data).encode("utf-8")
+
+
+def _url_key(url: str) -> str:
+    """De-dupe key for a URL: no fragment, sorted query, lowercase host, no trailing slash."""
+    p = urlparse(url)
+    query = urlencode(sorted(parse_qsl(p.query, keep_blank_values=True)))
+    return urlunparse((p.scheme.lower(), p.netloc.lower(), p.path.rstrip("/") or "/", "", query, ""))
 
 
 def _build_start_url(domain: str) -> str:
@@ -147,6 +244,7 @@ def _resolve_capture_config(fetch_spec: dict, args: argparse.Namespace) -> Captu
         take_screenshot=expand_lazy,
         no_js_fallback=no_js_fallback,
         cookie_ref=fetch_spec.get("cookies") or fetch_spec.get("cookie"),
+        compress_html=getattr(args, "compress_raw", False),
     )
 
 
@@ -218,6 +316,8 @@ def _make_capture_config_for_strategy(
         no_js_fallback=True,  # We handle fallback via policy engine now
         cookie_ref=base_config.cookie_ref,
         cookies_dir=base_config.cookies_dir,
+        site_cookies=base_config.site_cookies,
+        compress_html=base_config.compress_html,
     )
 
 
@@ -228,10 +328,19 @@ def _capture_url_adaptive(
     recon,
     domain_playbook: dict | None,
     escalation_mode: str,
+    session: requests.Session | None = None,
+    strategy_configs: dict[str, CaptureConfig] | None = None,
+    limiter: HostRateLimiter | None = None,
+    delay: float = 0.0,
 ) -> tuple[CaptureResult | None, list[AccessAttempt], str]:
     """
     Bounded attempt loop for a single URL with adaptive escalation.
 
+    strategy_configs, when given, memoizes the per-strategy CaptureConfig
+    across a site's URLs (it only depends on the site's plan and base config).
+    With limiter, every attempt (escalations included) holds the URL's host
+    and starts at least delay seconds after the previous request to it ended.
+
     Returns (final_capture_or_None, attempt_records, final_outcome_str).
     """
     strategy = plan.initial_strategy
@@ -243,13 +352,18 @@ def _capture_url_adaptive(
 
     for attempt_idx in range(plan.max_attempts):
         attempt_start = datetime.now(timezone.utc)
-
-        config = _make_capture_config_for_strategy(strategy, plan, base_config)
-        result = capture_page(url, config, RAW_DIR)
+        attempt_t0 = time.monotonic()
+
+        config = strategy_configs.get(strategy) if strategy_configs is not None else None
+        if config is None:
+            config = _make_capture_config_for_strategy(strategy, plan, base_config)
+            if strategy_configs is not None:
+                config = strategy_configs.setdefault(strategy, config)
+        with limiter.hold_url(url, delay) if limiter is not None else nullcontext():
+            result = capture_page(url, config, RAW_DIR, session=session)
         outcome = classify_capture_result(result, recon=recon)
 
-        attempt_end = datetime.now(timezone.utc)
-        duration_ms = int((attempt_end - attempt_start).total_seconds() * 1000)
+        duration_ms = int((time.monotonic() - attempt_t0) * 1000)
 
         attempt = AccessAttempt(
             attempt_index=attempt_idx + 1,
@@ -294,8 +408,7 @@ def _capture_url_adaptive(
             break
 
         # Backoff before retry
-        delay = compute_backoff_delay(attempt_idx, plan, outcome.outcome)
-        time.sleep(delay)
+        time.sleep(compute_backoff_delay(attempt_idx, plan, outcome.outcome))
         strategy = next_strategy
 
     # Terminal: return last result if it at least has HTML
@@ -307,6 +420,90 @@ def _capture_url_adaptive(
     return final_capture, attempt_records, final_outcome_str
 
 
+_ASSET_FIELDS = tuple(f.name for f in fields(AssetRef))
+
+
+def _asset_dicts(assets: list[AssetRef]) -> list[dict]:
+    """Shallow dicts for the extractor (asdict() deep-copies every field)."""
+    return [{name: getattr(a, name) for name in _ASSET_FIELDS} for a in assets]
+
+
+def _extract_kwargs(capture: CaptureResult, asset_inventory: list[dict]) -> dict:
+    """extract_from_capture() arguments for one captured page (picklable for --extract-procs)."""
+    return dict(
+        html_path=capture.html_path,
+        url=capture.url,
+        asset_inventory=asset_inventory,
+        screenshot_path=str(capture.screenshot_path) if capture.screenshot_path else None,
+        interaction_log=capture.interaction_log,
+        expansion_stats=capture.expansion_stats,
+        html=capture.html,
+    )
+
+
+def _reuse_extraction(extraction: dict, capture: CaptureResult) -> dict:
+    """Copy another capture's extraction of the same page for this capture's URL."""
+    return {
+        **extraction,
+        "url": capture.url,
+        "duplicate_of": extraction["url"],
+        "assets": [dict(a) for a in extraction["assets"]],
+        "interaction_log": capture.interaction_log or [],
+        "expansion_stats": capture.expansion_stats or {},
+        "archive": {
+            "html_path": str(capture.html_path),
+            "screenshot_path": str(capture.screenshot_path) if capture.screenshot_path else None,
+        },
+    }
+
+
+# Per-run results shared by carriers on the same host (sitemap discovery) or
+# start URL (recon), e.g. seeds listing several paths of one site. Values
+# are futures, so a site arriving while the first is still fetching waits
+# for that result instead of repeating the requests.
+_SITEMAP_CACHE: dict[str, Future] = {}
+_RECON_CACHE: dict[str, Future] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def _shared_call(cache: dict[str, Future], key: str, fn, *args, **kwargs):
+    """Return fn(*args, **kwargs), computed once per key. Failures are not cached."""
+    with _SHARED_LOCK:
+        future = cache.get(key)
+        owner = future is None
+        if owner:
+            future = cache[key] = Future()
+    if owner:
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as exc:
+            with _SHARED_LOCK:
+                cache.pop(key, None)
+            future.set_exception(exc)
+    return future.result()
+
+
+def _discover_sitemap_entries(start_url: str):
+    """Fetch robots.txt, then find and parse the site's sitemap (up to 50 URLs).
+
+    Returns (robots, sitemap_url, sitemap_result). Doesn't log, since it runs
+    on a helper thread alongside recon. Computed once per scheme://host a run.
+    """
+    parsed = urlparse(start_url)
+    return _shared_call(
+        _SITEMAP_CACHE, f"{parsed.scheme}://{parsed.netloc}", _fetch_sitemap_entries, start_url
+    )
+
+
+def _fetch_sitemap_entries(start_url: str):
+    session = _http_session()
+    robots = get_robots(start_url, session=session)
+    # The sitemap is parsed from the response that found it, not fetched twice
+    sitemap_result = find_sitemap(start_url, robots.sitemaps if robots else [], max_urls=50, session=session)
+    sitemap_url = sitemap_result.sitemap_url if sitemap_result else None
+    return robots, sitemap_url, sitemap_result
+
+
 def capture_site(
     carrier: dict,
     args: argparse.Namespace,
@@ -314,23 +511,38 @@ def capture_site(
     provided_flags: set[str],
     fetch_profiles: dict,
     playbooks: dict | None = None,
+    write_site: bool = True,
+    extract_procs: ProcessPoolExecutor | None = None,
+    max_urls: int | None = None,
+    write_telemetry: bool | None = None,
 ) -> dict:
     domain = carrier["domain"]
     base_domain = domain.split("/")[0] if "/" in domain else domain
 
-    print(f"\nCapturing {carrier['name']} ({domain})")
+    _log(f"\nCapturing {carrier['name']} ({domain})")
 
     start_url = _build_start_url(domain)
 
-    # Recon FIRST to detect SPA/JS requirements
-    recon = recon_site(start_url)
+    # robots.txt and sitemap discovery don't depend on recon or the access
+    # plan, so their requests run while recon fetches the home page
+    discovery_pool = ThreadPoolExecutor(max_workers=1)
+    discovery = discovery_pool.submit(_discover_sitemap_entries, start_url)
+    discovery_pool.shutdown(wait=False)
 
     fetch_spec = resolve_fetch_spec(carrier, args, cfg, provided_flags, fetch_profiles)
     resolved_method = _normalize_method(fetch_spec.get("method"))
 
+    # Recon to detect SPA/JS requirements; skipped when the carrier config
+    # or CLI already fixes a browser method, since it could only upgrade requests
+    recon = None
+    if resolved_method in (None, "requests"):
+        recon = _shared_call(_RECON_CACHE, start_url, recon_site, start_url, session=_http_session())
+    else:
+        _log(f"  [recon] skipped (method={resolved_method})")
+
     # Upgrade method if recon detected JS requirement (SPA, framework, etc.)
     if recon and recon.js_required and resolved_method in (None, "requests"):
-        print(f"  [recon] JS required ({recon.framework or 'SPA signals'}) → upgrading to js")
+        _log(f"  [recon] JS required ({recon.framework or 'SPA signals'}) → upgrading to js")
         resolved_method = "js"
 
     # Div 4k1: build access plan from layered config
@@ -348,90 +560,164 @@ def capture_site(
         cli_overrides=cli_overrides if cli_overrides else None,
     )
     escalation_mode = getattr(args, "access_escalation_mode", "adaptive")
-    print(f"  [access] plan: {access_plan.initial_strategy} "
+    _log(f"  [access] plan: {access_plan.initial_strategy} "
           f"(max_attempts={access_plan.max_attempts}, mode={escalation_mode})")
 
     capture_config = _resolve_capture_config(fetch_spec, args)
+    # Cookies set by one page (consent, session) go out with the site's later captures
+    capture_config.site_cookies = SiteCookieStore()
 
     urls_to_capture = [start_url]
-    robots = RobotsChecker.fetch(start_url)
-    sitemap_url = discover_sitemap(start_url, robots.sitemaps if robots else [])
+    seen_urls = {_url_key(start_url)}
+    robots, sitemap_url, sitemap_result = discovery.result()
     sitemap_urls: list[str] = []
-    if sitemap_url:
-        sitemap_result = parse_sitemap(sitemap_url, max_urls=50)
-        if sitemap_result and sitemap_result.urls:
-            for entry in sitemap_result.urls[:50]:
-                if robots and not robots.is_allowed(entry.loc):
-                    continue
-                urls_to_capture.append(entry.loc)
-                sitemap_urls.append(entry.loc)
-
-    urls_to_capture = list(dict.fromkeys(urls_to_capture))
-    print(f"  Found {len(urls_to_capture)} URLs to capture")
+    if sitemap_result and sitemap_result.urls:
+        for entry in sitemap_result.urls[:50]:
+            if robots and not robots.is_allowed(entry.loc):
+                continue
+            # The site profile reports every allowed sitemap entry; only
+            # the capture list is de-duped
+            sitemap_urls.append(entry.loc)
+            key = _url_key(entry.loc)
+            if key in seen_urls:
+                continue
+            seen_urls.add(key)
+            urls_to_capture.append(entry.loc)
+    if max_urls:
+        del urls_to_capture[max_urls:]
+
+    _log(f"  Found {len(urls_to_capture)} URLs to capture")
 
     captures: list[CaptureResult] = []
-    all_attempts_by_url: list[dict] = []
+    extract_futures: list[Future] = []  # parallel to captures
+    # (content_hash, final_url) -> extraction of the first capture of that page
+    futures_by_content: dict[tuple[str, str], Future] = {}
+    # Per-URL attempt telemetry goes straight to a JSONL sidecar (opened
+    # with the capture loop below); only its running summary is kept here.
+    # The sidecar follows the site JSON unless the caller says otherwise, so
+    # a capture whose site is never written can't replace a crawl's sidecar.
+    if write_telemetry is None:
+        write_telemetry = write_site
+    telemetry_path = access_telemetry_file(domain, SITES_DIR) if write_telemetry else None
     terminal_failures: list[dict] = []
+    failed_strategies: dict[str, None] = {}  # ordered set over terminal_failures
 
-    for i, url in enumerate(urls_to_capture):
+    def print_url_prefix(i: int, url: str) -> None:
         url_path = urlparse(url).path or '/'
-        print(f"  [{i+1}/{len(urls_to_capture)}] {url_path}", end="", flush=True)
-
-        final_capture, attempt_records, final_outcome = _capture_url_adaptive(
-            url=url,
-            plan=access_plan,
-            base_config=capture_config,
-            recon=recon,
-            domain_playbook=domain_playbook,
-            escalation_mode=escalation_mode,
-        )
+        _log(f"  [{i+1}/{len(urls_to_capture)}] {url_path}", end="", flush=True)
 
+    def record_url_result(url, final_capture, attempt_records, final_outcome) -> None:
         strategies_used = list(dict.fromkeys(a.strategy for a in attempt_records))
         num_attempts = len(attempt_records)
+        attempt_dicts = [a.to_dict() for a in attempt_records]
+        if final_capture:
+            final_capture.attempt_dicts = attempt_dicts
 
         if final_outcome == "success_real_content" and final_capture:
             kb = final_capture.html_size_bytes // 1024
             suffix = f" ({num_attempts} attempts)" if num_attempts > 1 else ""
-            print(f" ✓ {kb}KB{suffix}")
+            _log(f" ✓ {kb}KB{suffix}")
             captures.append(final_capture)
+            # URLs that redirect to the same page with identical HTML share one extraction
+            content_key = (final_capture.content_hash, final_capture.final_url)
+            future = futures_by_content.get(content_key)
+            if future is None:
+                future = extract_pool.submit(
+                    extract_from_capture,
+                    **_extract_kwargs(final_capture, _asset_dicts(final_capture.asset_inventory)),
+                )
+                futures_by_content[content_key] = future
+            extract_futures.append(future)
         else:
-            print(f" ✗ {final_outcome} ({num_attempts} attempts, tried: {','.join(strategies_used)})")
+            _log(f" ✗ {final_outcome} ({num_attempts} attempts, tried: {','.join(strategies_used)})")
             terminal_failures.append({
                 "url": url,
                 "final_outcome": final_outcome,
                 "strategies_tried": strategies_used,
             })
+            failed_strategies.update(dict.fromkeys(strategies_used))
 
-        all_attempts_by_url.append({
+        telemetry.add({
             "url": url,
             "final_outcome": final_outcome,
-            "attempts": [asdict(a) for a in attempt_records],
+            "attempts": attempt_dicts,
             "escalations_used": strategies_used,
         })
 
-        # Delay between URLs (base delay, not escalation backoff)
-        if i < len(urls_to_capture) - 1:
-            time.sleep(_resolve_capture_delay(fetch_spec, REQUEST_DELAY))
+    capture_kwargs = dict(
+        plan=access_plan,
+        base_config=capture_config,
+        recon=recon,
+        domain_playbook=domain_playbook,
+        escalation_mode=escalation_mode,
+        strategy_configs={},
+    )
+
+    # Polite delays are measured start-to-start per host, so time spent
+    # waiting on a response counts toward the next request's delay
+    limiter = HostRateLimiter()
+
+    # Pages are extracted in the background as soon as they are captured,
+    # overlapping HTML parsing with the next URL's request and delay: on the
+    # run's process pool when given (--extract-procs), else on a site thread.
+    # shared_browser(): JS captures on this thread reuse one Chromium (for
+    # the whole run when main() already opened the pool on this thread)
+    with ThreadPoolExecutor(max_workers=EXTRACT_WORKERS) as site_extract_pool, shared_browser(), \
+            AccessTelemetryLog(telemetry_path) as telemetry:
+        extract_pool = extract_procs or site_extract_pool
+        if access_plan.initial_strategy == "requests" and len(urls_to_capture) > 1:
+            # Static captures: each request waits only for the previous one to
+            # its own host plus the polite delay, so other hosts (subdomains
+            # from the sitemap) proceed in parallel while any one host still
+            # sees one request at a time, escalation retries included.
+            # Results are recorded in URL order.
+            pending: deque = deque()
+
+            def paced_capture(url: str, delay: float):
+                return _capture_url_adaptive(url=url, session=_http_session(),
+                                             limiter=limiter, delay=delay, **capture_kwargs)
+
+            def drain_one() -> None:
+                i, url, future = pending.popleft()
+                print_url_prefix(i, url)
+                record_url_result(url, *future.result())
+
+            with ThreadPoolExecutor(max_workers=URL_CAPTURE_WORKERS) as pool:
+                for i, url in enumerate(urls_to_capture):
+                    while len(pending) >= URL_CAPTURE_WORKERS:
+                        drain_one()
+                    delay = _resolve_capture_delay(fetch_spec, REQUEST_DELAY)
+                    pending.append((i, url, pool.submit(paced_capture, url, delay)))
+                    while pending and pending[0][2].done():
+                        drain_one()
+
+                while pending:
+                    drain_one()
+        else:
+            for i, url in enumerate(urls_to_capture):
+                delay = _resolve_capture_delay(fetch_spec, REQUEST_DELAY)
+                print_url_prefix(i, url)
+                record_url_result(url, *_capture_url_adaptive(url=url, session=_http_session(),
+                                                              limiter=limiter, delay=delay, **capture_kwargs))
 
     # Monkey auto-enqueue for terminal failures
-    if terminal_failures and _MONKEY_AVAILABLE:
+    if terminal_failures:
         failure_rate = len(terminal_failures) / len(urls_to_capture) if urls_to_capture else 0
+        add_to_monkey_queue = None
         if failure_rate > 0.5 or len(terminal_failures) >= 3:
+            add_to_monkey_queue = _load_monkey_queue()
+        if add_to_monkey_queue is not None:
             try:
-                all_strategies = []
-                for tf in terminal_failures:
-                    all_strategies.extend(tf.get("strategies_tried", []))
-                all_strategies = list(set(all_strategies))
                 add_to_monkey_queue(
                     domain=base_domain,
                     reason=f"adaptive_access_terminal: {len(terminal_failures)}/{len(urls_to_capture)} failed",
                     tier=carrier.get("tier"),
-                    attempts_auto=all_strategies,
+                    attempts_auto=list(failed_strategies),
                 )
-                print(f"  [monkey] Queued {base_domain} for manual attention "
+                _log(f"  [monkey] Queued {base_domain} for manual attention "
                       f"({len(terminal_failures)} terminal failures)")
             except Exception as exc:
-                print(f"  [monkey] Failed to enqueue: {exc}")
+                _log(f"  [monkey] Failed to enqueue: {exc}")
 
     site_profile = _build_site_profile(
         recon,
@@ -444,34 +730,38 @@ def capture_site(
 
     if captures:
         manifest_path = write_manifest(base_domain, RAW_DIR, captures, site_profile=site_profile)
-        print(f"  Manifest: {manifest_path}")
+        _log(f"  Manifest: {manifest_path}")
 
     extracted_pages = []
-    for capture in captures:
+    extracted_futures: set[Future] = set()
+    for capture, extract_future in zip(captures, extract_futures):
         try:
-            extraction = extract_from_capture(
-                html_path=capture.html_path,
-                url=capture.url,
-                asset_inventory=[asdict(a) for a in capture.asset_inventory],
-                screenshot_path=str(capture.screenshot_path) if capture.screenshot_path else None,
-                interaction_log=capture.interaction_log,
-                expansion_stats=capture.expansion_stats,
-            )
+            extraction = extract_future.result()
+            if extract_future in extracted_futures:
+                extraction = _reuse_extraction(extraction, capture)
+            extracted_futures.add(extract_future)
+            # write_manifest fills in found_on_pages after extraction was queued
+            for asset_ctx, asset in zip(extraction["assets"], capture.asset_inventory):
+                asset_ctx["found_on_pages"] = list(asset.found_on_pages)
             # Re-classify with extraction context for final accuracy
             outcome = classify_capture_result(capture, extracted_page=extraction, recon=recon)
             capture.access_outcome = outcome
+            attempt_dicts = capture.attempts_as_dicts()
             if capture.attempts:
                 capture.attempts[-1].outcome = outcome
+                # Earlier attempts are unchanged since they were serialized
+                capture.attempt_dicts = attempt_dicts[:-1] + [capture.attempts[-1].to_dict()]
             extraction["final_access_outcome"] = outcome_as_dict(outcome)
-            extraction["attempts"] = [asdict(a) for a in capture.attempts]
+            extraction["attempts"] = capture.attempt_dicts
             extracted_pages.append(extraction)
+            capture.html = None  # the archived file is the copy from here on
         except Exception as exc:
             extracted_pages.append(
                 {
                     "url": capture.url,
                     "error": f"extract_failed:{type(exc).__name__}",
                     "final_access_outcome": outcome_as_dict(getattr(capture, "access_outcome", None)),
-                    "attempts": [asdict(a) for a in getattr(capture, "attempts", [])],
+                    "attempts": capture.attempts_as_dicts(),
                     "archive": {
                         "html_path": str(capture.html_path) if capture.html_path else None,
                         "screenshot_path": str(capture.screenshot_path) if capture.screenshot_path else None,
@@ -485,17 +775,135 @@ def capture_site(
         extracted_pages=extracted_pages,
         attempted_count=len(urls_to_capture),
         site_profile=site_profile,
-        access_telemetry=all_attempts_by_url,
+        access_telemetry_path=str(telemetry_path.relative_to(SITES_DIR)) if telemetry_path else None,
+        access_summary=telemetry.summary.to_dict(),
     )
 
-    write_site_json(site_data, SITES_DIR)
-    success_count = sum(1 for t in all_attempts_by_url if t["final_outcome"] == "success_real_content")
-    print(f"  Done: {success_count}/{len(urls_to_capture)} URLs succeeded, "
+    if write_site:
+        write_site_json(site_data, SITES_DIR)
+    success_count = telemetry.summary.outcome_counts.get("success_real_content", 0)
+    _log(f"  Done: {success_count}/{len(urls_to_capture)} URLs succeeded, "
           f"{len(captures)} pages captured, {site_data['stats']['total_html_kb']}KB")
     return site_data
 
 
-def main():
+def _iter_site_results(
+    carriers: list[dict],
+    site_executor,
+    jobs: int,
+    address_limiter: AddressLimiter | None = None,
+    host_limiter: HostRateLimiter | None = None,
+    host_gap: float = 0.0,
+):
+    """
+    Run site_executor over carriers on `jobs` worker threads.
+
+    Yields (carrier, result) in completion order. Each worker takes the next
+    carrier when it finishes one, so only `jobs` sites are in flight and a
+    long carrier list never builds up a backlog. Workers live for the whole
+    run inside shared_browser(), so a JS site reuses the Chromium that
+    worker launched for an earlier site.
+
+    With address_limiter, a site holds a slot for its server address while
+    it runs. A worker whose next carrier's address is saturated sets it
+    aside and takes a later carrier instead of idling; set-aside carriers
+    go first once their address frees up. With host_limiter, sites on one
+    host also start at least host_gap seconds apart; a site still inside
+    its host's gap is set aside the same way, so the wait never holds an
+    address slot.
+    """
+    remaining = iter(carriers)
+    deferred: deque = deque()  # (carrier, address, host) waiting on a busy address or host
+    schedule_lock = threading.Lock()
+    stop = threading.Event()
+    finished: queue.Queue = queue.Queue()
+
+    def try_start(addr: str | None, host: str | None) -> bool:
+        """Take addr's slot and host's start without waiting for either."""
+        if addr is not None and not address_limiter.try_acquire(addr):
+            return False
+        if host is not None and not host_limiter.try_acquire(host, host_gap):
+            if addr is not None:
+                address_limiter.release(addr)
+            return False
+        return True
+
+    def claim_next() -> tuple[dict | None, str | None]:
+        """Next carrier to run and the address slot it holds (None when done)."""
+        while True:
+            with schedule_lock:
+                if stop.is_set():
+                    return None, None
+                if address_limiter is None and host_limiter is None:
+                    return next(remaining, None), None
+                for i, (waiting, addr, host) in enumerate(deferred):
+                    if try_start(addr, host):
+                        del deferred[i]
+                        return waiting, addr
+                carrier = next(remaining, None)
+                if carrier is None:
+                    if not deferred:
+                        return None, None
+                    waiting, addr, host = deferred.popleft()
+            if carrier is None:
+                # Only set-aside carriers are left and none can start yet: sit
+                # out the host gap first, then wait for the address slot
+                if host is not None:
+                    host_limiter.acquire(host, host_gap)
+                if addr is not None:
+                    address_limiter.acquire(addr)
+                if stop.is_set():
+                    if addr is not None:
+                        address_limiter.release(addr)
+                    return None, None
+                return waiting, addr
+            start_url = _build_start_url(carrier["domain"])
+            host = urlparse(start_url).hostname if host_limiter is not None else None
+            # DNS lookup outside the lock so other workers keep scheduling
+            addr = address_limiter.url_address(start_url) if address_limiter is not None else None
+            if try_start(addr, host):
+                return carrier, addr
+            with schedule_lock:
+                deferred.append((carrier, addr, host))
+
+    def worker():
+        try:
+            with shared_browser():
+                carrier, addr = claim_next()
+                while carrier is not None:
+                    try:
+                        finished.put((carrier, site_executor(carrier), None))
+                    except Exception as exc:
+                        finished.put((carrier, None, exc))
+                    finally:
+                        if addr is not None:
+                            address_limiter.release(addr)
+                    carrier, addr = claim_next()
+        finally:
+            finished.put(None)
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        workers = [executor.submit(worker) for _ in range(jobs)]
+        try:
+            active = jobs
+            while active:
+                item = finished.get()
+                if item is None:
+                    active -= 1
+                    continue
+                carrier, result, exc = item
+                if exc is not None:
+                    raise exc
+                yield carrier, result
+        finally:
+            # On an early exit, let in-flight sites finish but start no more
+            stop.set()
+    for future in workers:
+        future.result()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """The crawl.py command line (also used to build args for capture_site() callers)."""
     parser = argparse.ArgumentParser(description="Crawl trucking carrier websites")
     parser.add_argument("--domain", help="Crawl single domain")
     parser.add_argument("--tier", type=int, help="Only crawl carriers of this tier")
@@ -517,8 +925,14 @@ def main():
                         help="Skip sites crawled within interval (e.g., 7d, 24h, 2h, 30m)")
     parser.add_argument("--jobs", "-j", type=int, default=1,
                         help="Number of sites to crawl in parallel (default: 1)")
+    parser.add_argument("--jobs-per-ip", type=int, default=2,
+                        help="With --jobs, max sites crawled at once per server IP (default: 2; 0 = no cap)")
+    parser.add_argument("--extract-procs", type=int, default=0,
+                        help="Extract pages on a pool of N processes shared by all sites (default: 0 = a thread per site)")
     parser.add_argument("--progress", action="store_true",
                         help="Show clean progress bars instead of verbose output")
+    parser.add_argument("--compress-raw", action="store_true",
+                        help="Store captured pages as zstd-compressed .html.zst (needs zstandard)")
     parser.add_argument("--docker", action="store_true",
                         help="Run in Docker container with Xvfb (invisible browser windows)")
     parser.add_argument("--docker-rebuild", action="store_true",
@@ -529,7 +943,11 @@ def main():
     parser.add_argument("--access-escalation-mode", choices=["adaptive", "static"],
                         default="adaptive",
                         help="Access escalation mode: adaptive (closed-loop) or static (single attempt)")
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
 
     # Handle --docker flag: re-invoke via docker_crawl.sh
     if args.docker and not os.environ.get("CRAWL_IN_DOCKER"):
@@ -556,6 +974,8 @@ def main():
     if args.run_config:
         cfg.update(load_run_config(args.run_config))
     args = apply_run_config(args, cfg, provided_flags)
+    if args.compress_raw and not compression_available():
+        print("Warning: zstandard not installed; --compress-raw will write plain .html")
 
     fetch_profiles = load_fetch_profiles()
     playbooks = load_playbooks()
@@ -579,11 +999,14 @@ def main():
         if cfg and isinstance(cfg, dict) and isinstance(cfg.get("carriers"), list):
             carriers = cfg["carriers"]
 
-    if args.domain:
-        domains = [d.strip() for d in args.domain.split(",")]
-        carriers = [c for c in carriers if c["domain"] in domains]
-    if args.tier:
-        carriers = [c for c in carriers if c["tier"] == args.tier]
+    domains = frozenset(d.strip() for d in args.domain.split(",")) if args.domain else None
+    tier = args.tier or None
+    if domains is not None or tier is not None:
+        carriers = [
+            c for c in carriers
+            if (domains is None or c["domain"] in domains)
+            and (tier is None or c["tier"] == tier)
+        ]
     if args.limit:
         carriers = carriers[:args.limit]
 
@@ -613,50 +1036,119 @@ def main():
     crawl_start = datetime.now(timezone.utc)
     actual_jobs = min(args.jobs, len(carriers))
 
-    if not (args.progress and TQDM_AVAILABLE):
+    tqdm = _load_tqdm() if args.progress else None
+    use_progress = tqdm is not None
+    if not use_progress:
         print(f"Crawling {len(carriers)} carriers (jobs={actual_jobs})...")
 
     RAW_DIR.mkdir(parents=True, exist_ok=True)
     EXTRACTED_DIR.mkdir(parents=True, exist_ok=True)
     SITES_DIR.mkdir(parents=True, exist_ok=True)
 
+    buffer_site_logs = actual_jobs > 1 and not use_progress
+    # Sites sharing a CDN edge IP take turns instead of all hitting it at once
+    address_limiter = None
+    if actual_jobs > 1 and args.jobs_per_ip > 0:
+        address_limiter = AddressLimiter(args.jobs_per_ip)
+
+    # Site JSON files are serialized and written by one background thread, so
+    # a site worker moves on as soon as its pages are captured and extracted
+    site_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="site-writer")
+    site_writes: list[Future] = []
+
+    # Extraction is CPU-bound and holds the GIL, so parallel sites only
+    # extract in parallel on separate processes. Spawned rather than forked:
+    # by now this process has Playwright and pool threads running.
+    extract_procs = None
+    if args.extract_procs > 0:
+        extract_procs = ProcessPoolExecutor(
+            max_workers=args.extract_procs, mp_context=multiprocessing.get_context("spawn")
+        )
+
     def site_executor(carrier):
+        buf = io.StringIO() if buffer_site_logs else None
+        token = _SITE_LOG.set(buf)
         try:
-            return capture_site(carrier, args, cfg, provided_flags, fetch_profiles, playbooks=playbooks)
+            result = capture_site(carrier, args, cfg, provided_flags, fetch_profiles,
+                                  playbooks=playbooks, write_site=False, extract_procs=extract_procs,
+                                  write_telemetry=True)
+            site_writes.append(site_writer.submit(write_site_json, result, SITES_DIR))
+            return result
         except Exception as exc:
             if not (args.progress and actual_jobs > 1):
-                print(f"  FAILED {carrier['domain']}: {exc}")
+                _log(f"  FAILED {carrier['domain']}: {exc}")
             return None
+        finally:
+            _SITE_LOG.reset(token)
+            if buf is not None:
+                sys.stdout.write(buf.getvalue())
+                sys.stdout.flush()
 
     results = []
-    use_progress = args.progress and TQDM_AVAILABLE
     status_file = CORPUS_DIR / "crawl_status.json"
-
-    def update_status(current_domain=None, completed=None, failed=None, running=None):
+    status_tmp = status_file.with_name(status_file.name + ".tmp")
+    last_status_write = [float("-inf")]
+    latest_status: list[dict | None] = [None]
+    status_timer: list[threading.Timer | None] = [None]
+    status_lock = threading.Lock()
+    started_iso = crawl_start.isoformat()
+
+    def write_status() -> None:
+        # Caller holds status_lock
+        status_timer[0] = None
+        last_status_write[0] = time.monotonic()
         try:
-            status = {
-                "started": datetime.now(timezone.utc).isoformat(),
-                "total_sites": len(carriers),
-                "completed": completed or len(results),
-                "failed": failed or [],
-                "running": running or [],
-                "current": current_domain,
-            }
-            status_file.write_text(json.dumps(status, indent=2))
+            # Write-then-rename so readers never see a half-written file
+            status_tmp.write_bytes(_dump_json(latest_status[0], indent=True))
+            os.replace(status_tmp, status_file)
         except Exception:
             pass
 
-    if use_progress:
-        failed = []
-        update_status()
-        if actual_jobs > 1:
-            running = []
-            with tqdm(total=len(carriers), desc="Sites", unit="site", position=0) as pbar:
-                with ThreadPoolExecutor(max_workers=actual_jobs) as executor:
-                    futures = {executor.submit(site_executor, c): c for c in carriers}
-                    for future in as_completed(futures):
-                        carrier = futures[future]
-                        result = future.result()
+    def write_pending_status() -> None:
+        with status_lock:
+            if status_timer[0] is not None:  # not already written by a forced update
+                write_status()
+
+    def update_status(current_domain=None, completed=None, failed=None, running=None, force=False):
+        # Coalesced: with many fast sites the status file would otherwise be
+        # rewritten per site. Updates within STATUS_MIN_INTERVAL of the last
+        # write are folded into one timer write at the end of the interval,
+        # so the file never lags the crawl by more than that. The final call
+        # passes force=True.
+        status = {
+            "started": started_iso,
+            "total_sites": len(carriers),
+            "completed": completed or len(results),
+            "failed": list(failed or []),
+            "running": list(running or []),
+            "current": current_domain,
+        }
+        with status_lock:
+            latest_status[0] = status
+            if force:
+                if status_timer[0] is not None:
+                    status_timer[0].cancel()
+                write_status()
+                return
+            if status_timer[0] is not None:
+                return
+            wait = STATUS_MIN_INTERVAL - (time.monotonic() - last_status_write[0])
+            if wait <= 0:
+                write_status()
+            else:
+                status_timer[0] = threading.Timer(wait, write_pending_status)
+                status_timer[0].daemon = True
+                status_timer[0].start()
+
+    failed = []
+    # Spawned extraction workers must not outlive an error or Ctrl+C
+    try:
+        if use_progress:
+            update_status()
+            if actual_jobs > 1:
+                running = []
+                with tqdm(total=len(carriers), desc="Sites", unit="site", position=0) as pbar:
+                    for carrier, result in _iter_site_results(carriers, site_executor, actual_jobs, address_limiter):
                         if result:
                             results.append(result)
                             pages = get_page_count(result)
@@ -665,37 +1157,44 @@ def main():
                             failed.append(carrier["domain"])
                         pbar.update(1)
                         update_status(failed=failed)
-        else:
-            with tqdm(carriers, desc="Sites", unit="site") as pbar:
-                for carrier in pbar:
-                    pbar.set_description(f"{carrier['domain'][:20]}")
-                    update_status(current_domain=carrier["domain"], failed=failed)
-                    result = site_executor(carrier)
-                    if result:
-                        results.append(result)
-                        pages = get_page_count(result)
-                        pbar.set_postfix_str(f"{pages} pages")
-                    else:
-                        failed.append(carrier["domain"])
+            else:
+                # One browser pool for the whole run, as for the parallel workers
+                with shared_browser(), tqdm(carriers, desc="Sites", unit="site") as pbar:
+                    for carrier in pbar:
+                        pbar.set_description(f"{carrier['domain'][:20]}")
+                        update_status(current_domain=carrier["domain"], failed=failed)
+                        result = site_executor(carrier)
+                        if result:
+                            results.append(result)
+                            pages = get_page_count(result)
+                            pbar.set_postfix_str(f"{pages} pages")
+                        else:
+                            failed.append(carrier["domain"])
 
-        if failed:
-            print(f"\nFailed sites: {', '.join(failed)}")
-    else:
-        update_status()
-        if actual_jobs > 1:
-            with ThreadPoolExecutor(max_workers=actual_jobs) as executor:
-                futures = {executor.submit(site_executor, c): c for c in carriers}
-                for future in as_completed(futures):
-                    result = future.result()
+            if failed:
+                print(f"\nFailed sites: {', '.join(failed)}")
+        else:
+            update_status()
+            if actual_jobs > 1:
+                for _, result in _iter_site_results(carriers, site_executor, actual_jobs, address_limiter):
                     if result:
                         results.append(result)
                     update_status()
-        else:
-            for carrier in carriers:
-                update_status(current_domain=carrier["domain"])
-                result = site_executor(carrier)
-                if result:
-                    results.append(result)
+            else:
+                with shared_browser():
+                    for carrier in carriers:
+                        update_status(current_domain=carrier["domain"])
+                        result = site_executor(carrier)
+                        if result:
+                            results.append(result)
+    finally:
+        if extract_procs is not None:
+            extract_procs.shutdown(cancel_futures=True)
+    site_writer.shutdown(wait=True)
+    for write in site_writes:
+        if write.exception() is not None:
+            print(f"Warning: failed to write site file: {write.exception()!r}")
+    update_status(failed=failed, force=True)
 
     total_pages = sum(get_page_count(s) for s in results)
     total_words = sum(get_word_count(s) for s in results)
@@ -727,6 +1226,7 @@ def main():
                 "depth": args.depth,
                 "jobs_requested": args.jobs,
                 "jobs_actual": actual_jobs,
+                "jobs_per_ip": args.jobs_per_ip if address_limiter else None,
                 "freshen": args.freshen,
                 "docker": os.environ.get("CRAWL_IN_DOCKER") == "1",
             },
@@ -749,8 +1249,8 @@ def main():
             ],
         }
 
-        with open(log_file, "a") as f:
-            f.write(json.dumps(log_entry) + "\n")
+        with open(log_file, "ab") as f:
+            f.write(_dump_json(log_entry) + b"\n")
 
         print(f"Execution logged to: {log_file}")
     except Exception as exc:
@@ -1,27 +1,35 @@
 #!/usr/bin/env python3
 """
-Interactive Access Layer Evaluation.
+Access Layer Evaluation.
 
 Test the full adaptive access system with zero configuration.
-Auto-selects sites, runs recon, shows strategy decisions, crawls,
-and tracks SLO metrics - all with interactive prompts.
+Auto-selects sites, runs recon, picks a strategy, crawls, and tracks
+SLO metrics. Several sites run as a parallel headless batch by default;
+--interactive (or a single site) runs one at a time with prompts to
+confirm strategies and pause between sites.
 
 Usage:
-    python scripts/eval_access.py              # Just run it
+    python scripts/eval_access.py              # Just run it (parallel batch)
+    python scripts/eval_access.py --interactive  # Prompts and pauses per site
     python scripts/eval_access.py --tier 2     # Test tier-2 sites
     python scripts/eval_access.py --domain schneider.com  # Single site
     python scripts/eval_access.py --sample-size 3         # Quick test
+    python scripts/eval_access.py --tail corpus/eval_reports/eval_batch_<ts>.ndjson
 
 The goal: validate the access layer works without needing to remember
 any command-line arguments or read documentation.
 """
 
 import argparse
+import functools
+import io
 import json
+import os
 import random
 import sys
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -32,6 +40,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 import yaml
 
 from fetch.recon import recon_site, ReconResult
+from orchestrate.presenter import get_page_count, get_word_count
+from orchestrate.rate_limit import AddressLimiter, HostRateLimiter
 
 # Strategy recommendation logic (mirrors crawl.py)
 def recommend_strategy(recon: ReconResult | None, cached: str | None) -> tuple[str, str]:
@@ -65,6 +75,15 @@ PROJECT_ROOT = Path(__file__).parent.parent
 SEEDS_FILE = PROJECT_ROOT / "seeds" / "trucking_carriers.json"
 CONFIG_FILE = PROJECT_ROOT / "profiles" / "eval_config.yaml"
 SITES_DIR = PROJECT_ROOT / "corpus" / "sites"
+REPORTS_DIR = PROJECT_ROOT / "corpus" / "eval_reports"
+
+# Batch recon is one home-page GET per site, so it runs ahead of the crawls
+# on its own, wider pool instead of waiting for a crawl slot
+RECON_WORKERS = 16
+# Batch crawls sharing a host or server address run one at a time, and
+# crawls of one host start at least this many seconds apart, so the eval
+# doesn't trigger the blocks it is measuring
+SAME_HOST_GAP = 2.0
 
 
 # =============================================================================
@@ -87,24 +106,37 @@ class EvalConfig:
     pause_between_sites: bool = True
     track_slos: bool = True
     warn_on_slo_breach: bool = True
+    default_jobs: int = 0  # 0 = auto (resolve_jobs)
+    use_recon_cache: bool = True  # reuse recon results younger than a week
+    max_jobs: int = 16
+
+
+@functools.lru_cache(maxsize=1)
+def _read_config_file() -> dict | None:
+    """The parsed CONFIG_FILE (read once per process), or None."""
+    if not CONFIG_FILE.exists():
+        return None
+    try:
+        return yaml.safe_load(CONFIG_FILE.read_text())
+    except Exception:
+        return None
 
 
 def load_config() -> tuple[EvalConfig, list[str], list[str]]:
-    """Load config from YAML or use defaults."""
+    """Load config from YAML or use defaults. Each call returns a fresh EvalConfig."""
     config = EvalConfig()
     known_hard = []
     skip_sites = []
 
-    if CONFIG_FILE.exists():
+    data = _read_config_file()
+    if data:
         try:
-            data = yaml.safe_load(CONFIG_FILE.read_text())
-            if data:
-                ec = data.get("eval_access", {})
-                for key, val in ec.items():
-                    if hasattr(config, key):
-                        setattr(config, key, val)
-                known_hard = data.get("known_hard_sites", [])
-                skip_sites = data.get("skip_sites", [])
+            ec = data.get("eval_access", {})
+            for key, val in ec.items():
+                if hasattr(config, key):
+                    setattr(config, key, val)
+            known_hard = list(data.get("known_hard_sites", []))
+            skip_sites = list(data.get("skip_sites", []))
         except Exception:
             pass
 
@@ -115,8 +147,9 @@ def load_config() -> tuple[EvalConfig, list[str], list[str]]:
 # SITE SELECTION
 # =============================================================================
 
+@functools.lru_cache(maxsize=1)
 def load_seeds() -> list[dict]:
-    """Load carrier seed list."""
+    """Load carrier seed list (read once per process; treat as read-only)."""
     with open(SEEDS_FILE) as f:
         data = json.load(f)
     return data.get("carriers", [])
@@ -140,17 +173,27 @@ def select_sites(
             return [{"domain": domain_override, "name": domain_override, "tier": 0, "category": []}]
         return matches
 
-    # Filter by tier
+    # One pass over the seeds: the tier's carriers and all carriers (both
+    # without skip sites), and the known-hard candidates
     tier = tier_override or config.default_tier
-    tier_carriers = [c for c in carriers if c.get("tier") == tier]
-
-    # Remove skip sites
     skip_set = set(skip_sites)
-    tier_carriers = [c for c in tier_carriers if c["domain"] not in skip_set]
+    known_hard_set = set(known_hard)
+    tier_carriers = []
+    allowed_carriers = []
+    hard_candidates = []
+    for c in carriers:
+        domain = c["domain"]
+        if domain in known_hard_set:
+            hard_candidates.append(c)
+        if domain in skip_set:
+            continue
+        allowed_carriers.append(c)
+        if c.get("tier") == tier:
+            tier_carriers.append(c)
 
     if not tier_carriers:
         # Fall back to all tiers
-        tier_carriers = [c for c in carriers if c["domain"] not in skip_set]
+        tier_carriers = allowed_carriers
 
     # Shuffle if requested
     if config.shuffle:
@@ -161,10 +204,9 @@ def select_sites(
 
     # Ensure at least one known-hard site if configured
     if config.include_known_hard and known_hard:
-        has_hard = any(c["domain"] in known_hard for c in selected)
+        has_hard = any(c["domain"] in known_hard_set for c in selected)
         if not has_hard:
-            # Find a hard site and swap one in
-            hard_candidates = [c for c in carriers if c["domain"] in known_hard]
+            # Swap a hard site in
             if hard_candidates:
                 hard_site = random.choice(hard_candidates)
                 if len(selected) >= config.sample_size:
@@ -181,19 +223,40 @@ def select_sites(
 
 @dataclass
 class SLOTracker:
-    """Track SLO metrics during evaluation."""
+    """Track SLO metrics during evaluation, updated as each result arrives."""
     total_attempts: int = 0
     successful: int = 0
     blocked: int = 0
-    method_counts: dict = field(default_factory=dict)
+    method_counts: Counter = field(default_factory=Counter)
+    total_pages: int = 0
+    total_words: int = 0
 
-    def record(self, success: bool, blocked: bool, method: str):
+    def record(self, success: bool, blocked: bool, method: str, pages: int = 0, words: int = 0):
         self.total_attempts += 1
         if success:
             self.successful += 1
         if blocked:
             self.blocked += 1
-        self.method_counts[method] = self.method_counts.get(method, 0) + 1
+        self.method_counts[method] += 1
+        self.total_pages += pages
+        self.total_words += words
+
+    def record_result(self, result: dict):
+        """record() one per-site result dict."""
+        self.record(
+            success=result["success"],
+            blocked=result["blocked"],
+            method=result.get("method_used", "unknown"),
+            pages=result["pages"],
+            words=result["words"],
+        )
+
+    @classmethod
+    def from_results(cls, results: list[dict]) -> "SLOTracker":
+        slo = cls()
+        for r in results:
+            slo.record_result(r)
+        return slo
 
     @property
     def success_rate(self) -> float:
@@ -309,6 +372,20 @@ def display_recon(recon: ReconResult | None, cached_strategy: str | None, config
 # CRAWL EXECUTION
 # =============================================================================
 
+# Access outcomes that count as the site blocking the crawl
+BLOCK_OUTCOMES = ("hard_block", "soft_block", "challenge_not_cleared")
+
+
+@functools.lru_cache(maxsize=1)
+def _crawl_settings() -> tuple[dict, dict, dict]:
+    """crawl.py's run config, fetch profiles and playbooks, loaded once per process."""
+    from scripts import crawl
+
+    default_config = crawl.PROJECT_ROOT / "configs" / "defaults.yaml"
+    cfg = crawl.load_run_config(str(default_config)) if default_config.exists() else {}
+    return cfg, crawl.load_fetch_profiles(), crawl.load_playbooks()
+
+
 def run_crawl(
     carrier: dict,
     method: str,
@@ -317,59 +394,50 @@ def run_crawl(
     force_headless: bool = True,
 ) -> dict:
     """
-    Run a crawl and return results.
+    Capture a site through crawl.py's capture_site() and return results.
+
+    The method is applied as --fetch-method; depth 0 captures only the home
+    page. The site JSON is not written (the eval only reads the metrics).
 
     Returns dict with: success, pages, words, method_used, blocked, error
     """
-    from scripts.crawl import crawl_site, load_profile
+    from scripts import crawl
 
     try:
-        profile = load_profile("trucking")
-
-        # Build fetch spec based on method
-        # Force headless in fetch_spec to override any defaults
-        fetch_spec = {
-            "method": method,
-            "headless": force_headless,  # Explicitly force headless
-        }
-        if method in ("stealth", "visible") and not force_headless:
-            fetch_spec["js_auto"] = True
-
-        result = crawl_site(
-            carrier,
-            max_depth=depth,
-            use_js=(method in ("js", "stealth", "visible")),
-            use_stealth=(method == "stealth"),
-            headless=force_headless,  # Force headless here too
-            profile=profile,
-            quiet=True,
-            fetch_spec=fetch_spec,
-        )
+        cfg, fetch_profiles, playbooks = _crawl_settings()
+        argv = ["--fetch-method", method, "--depth", str(depth)]
+        if not force_headless:
+            argv.append("--no-headless")
+        # no_headless counts as given either way, so headless is forced too
+        provided_flags = {"fetch_method", "depth", "no_headless"}
+        args = crawl.apply_run_config(crawl.build_parser().parse_args(argv), cfg, provided_flags)
+
+        # capture_site() logs every URL; keep that out of the eval's output
+        token = crawl._SITE_LOG.set(io.StringIO())
+        try:
+            result = crawl.capture_site(
+                carrier, args, cfg, provided_flags, fetch_profiles,
+                playbooks=playbooks,
+                write_site=False,
+                max_urls=1 if depth == 0 else None,
+            )
+        finally:
+            crawl._SITE_LOG.reset(token)
 
-        if result is None:
-            # Site was queued for monkey
-            return {
-                "success": False,
-                "pages": 0,
-                "words": 0,
-                "method_used": method,
-                "blocked": True,
-                "error": "queued_for_monkey",
-            }
-
-        pages = result.get("structure", {}).get("total_pages", 0)
-        words = result.get("total_word_count", 0)
-        access = result.get("access", {})
-        blocked = access.get("blocked", False)
+        pages = get_page_count(result)
+        words = get_word_count(result)
+        outcomes = result.get("access_summary", {}).get("outcome_counts", {})
+        blocked = not outcomes.get("success_real_content") and any(outcomes.get(o) for o in BLOCK_OUTCOMES)
 
         # Consider success if we got meaningful content
         success = pages > 0 and words >= 100 and not blocked
 
+        fetch_method = result.get("fetch_method")
         return {
             "success": success,
             "pages": pages,
             "words": words,
-            "method_used": access.get("strategy", method),
+            "method_used": fetch_method if fetch_method not in (None, "unknown") else method,
             "blocked": blocked,
             "error": None,
         }
@@ -436,9 +504,10 @@ def prompt_continue() -> bool:
 def run_eval_session(
     sites: list[dict],
     config: EvalConfig,
+    slo: SLOTracker | None = None,
 ) -> list[dict]:
-    """Run interactive evaluation session."""
-    slo = SLOTracker()
+    """Run interactive evaluation session, recording each result into slo."""
+    slo = slo if slo is not None else SLOTracker()
     results = []
     total = len(sites)
 
@@ -488,7 +557,7 @@ def run_eval_session(
         # Run recon
         print(f"\n  Running recon...")
         start_url = f"https://www.{domain}"
-        recon = recon_site(start_url)
+        recon = recon_site(start_url, use_cache=config.use_recon_cache)
 
         display_recon(recon, cached_strategy, config)
 
@@ -558,11 +627,7 @@ def run_eval_session(
                     print("  Auto-added to queue.")
 
         # Record SLO metrics
-        slo.record(
-            success=crawl_result["success"],
-            blocked=crawl_result["blocked"],
-            method=crawl_result["method_used"],
-        )
+        slo.record_result(crawl_result)
 
         # Store result
         results.append({
@@ -584,18 +649,96 @@ def run_eval_session(
     return results
 
 
+def resolve_jobs(requested: int | None, num_sites: int, config: EvalConfig) -> int:
+    """
+    Parallel jobs for a run: --jobs if given, else config.default_jobs, else auto.
+
+    Auto is one job per site, up to 4 per CPU (recon and crawls are
+    I/O-bound) and max_jobs. EVAL_MAX_JOBS in the environment overrides
+    max_jobs; a value that isn't a positive integer is ignored. One job
+    means the interactive session.
+    """
+    if requested is not None:
+        return requested
+    if config.default_jobs:
+        return config.default_jobs
+    max_jobs = config.max_jobs
+    try:
+        env_max = int(os.environ.get("EVAL_MAX_JOBS", ""))
+    except ValueError:
+        env_max = 0
+    if env_max > 0:
+        max_jobs = env_max
+    return max(1, min(num_sites, max(4, (os.cpu_count() or 1) * 4), max_jobs))
+
+
+def _host_key(domain: str) -> str:
+    """The host a seed domain (possibly with a path, e.g. ups.com/freight) is crawled on."""
+    host = domain.split("/")[0].lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def _interleave_by_host(sites: list[dict]) -> list[dict]:
+    """
+    Order sites round-robin across hosts: the first site of each host, then
+    the second of each, and so on, so consecutive submissions hit different
+    hosts.
+    """
+    groups: dict[str, list[dict]] = {}
+    for site in sites:
+        groups.setdefault(_host_key(site["domain"]), []).append(site)
+    ordered = []
+    for i in range(max((len(g) for g in groups.values()), default=0)):
+        ordered.extend(g[i] for g in groups.values() if i < len(g))
+    return ordered
+
+
+# Fields of a batch result kept in memory for the per-site summary table;
+# the full result goes to the run's NDJSON file
+SUMMARY_FIELDS = ("domain", "success", "blocked", "method_used", "pages", "words")
+
+
+def _result_stub(result: dict) -> dict:
+    """The compact form of a result that print_summary needs."""
+    return {k: result.get(k) for k in SUMMARY_FIELDS}
+
+
+def read_results(path: Path):
+    """Yield compact result stubs from a batch NDJSON file, one line at a time."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield _result_stub(json.loads(line))
+            except json.JSONDecodeError:
+                continue  # truncated last line from an interrupted run
+
+
 def run_batch_eval(
     sites: list[dict],
     config: EvalConfig,
     jobs: int = 4,
+    slo: SLOTracker | None = None,
+    results_path: Path | None = None,
 ) -> list[dict]:
     """
     Run evaluation in parallel batch mode (non-interactive).
 
     No prompts, no pauses, just runs everything headless in parallel.
+    Each result is recorded into slo and written as one line of
+    results_path (default REPORTS_DIR/eval_batch_<ts>.ndjson) as it
+    completes, so memory stays flat and an interrupted run keeps what
+    finished. Returns compact per-site stubs (SUMMARY_FIELDS).
     """
+    slo = slo if slo is not None else SLOTracker()
     results = []
     total = len(sites)
+    if results_path is None:
+        ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        results_path = REPORTS_DIR / f"eval_batch_{ts}.ndjson"
+    results_path.parent.mkdir(parents=True, exist_ok=True)
 
     print("\n" + "=" * 60)
     print("ACCESS LAYER BATCH EVALUATION")
@@ -604,19 +747,26 @@ def run_batch_eval(
     print(f"Parallel jobs: {jobs}")
     print(f"Depth: {config.depth}")
     print(f"Mode: headless, non-interactive")
+    print(f"Results: {results_path}")
     print("\nStarting...\n")
 
+    from scripts.crawl import _iter_site_results
+
+    sites = _interleave_by_host(sites)
+
+    def recon_one_site(carrier: dict) -> ReconResult | None:
+        try:
+            return recon_site(f"https://www.{carrier['domain']}", use_cache=config.use_recon_cache)
+        except Exception:
+            return None
+
     def eval_one_site(carrier: dict) -> dict:
         """Evaluate a single site (for parallel execution)."""
         domain = carrier["domain"]
         tier = carrier.get("tier", "?")
 
-        # Run recon
-        start_url = f"https://www.{domain}"
-        try:
-            recon = recon_site(start_url)
-        except Exception:
-            recon = None
+        # Recon was started for every site up front
+        recon = recon_futures[_host_key(domain)].result()
 
         # Get cached strategy
         cached_strategy = get_cached_strategy(domain)
@@ -644,56 +794,86 @@ def run_batch_eval(
             **crawl_result,
         }
 
-    # Run in parallel
-    with ThreadPoolExecutor(max_workers=jobs) as executor:
-        futures = {executor.submit(eval_one_site, site): site for site in sites}
+    def eval_or_error(carrier: dict) -> tuple[dict | None, Exception | None]:
+        try:
+            return eval_one_site(carrier), None
+        except Exception as e:
+            return None, e
+
+    # Run in parallel: recon for all sites fans out on its own pool while
+    # `jobs` crawl workers run the sites. Workers use crawl.py's site
+    # scheduler: sites sharing a server address run one at a time, sites on
+    # one host start SAME_HOST_GAP apart, and a worker whose next site has
+    # to wait for either takes a later site instead of idling. Each worker
+    # keeps its Chromium open across its sites (shared_browser())
+    with open(results_path, "w", encoding="utf-8") as out, \
+            ThreadPoolExecutor(max_workers=max(jobs, RECON_WORKERS)) as recon_pool:
+        # One recon per host, shared by every seed on it (recon is cached per
+        # host anyway, but concurrent misses would each fetch)
+        recon_futures = {}
+        for site in sites:
+            host = _host_key(site["domain"])
+            if host not in recon_futures:
+                recon_futures[host] = recon_pool.submit(recon_one_site, site)
+
+        def record(result: dict):
+            out.write(json.dumps(result, default=str) + "\n")
+            out.flush()
+            slo.record_result(result)
+            results.append(_result_stub(result))
 
         completed = 0
-        for future in as_completed(futures):
-            site = futures[future]
-            try:
-                result = future.result()
-                results.append(result)
-                completed += 1
-
-                # Progress update
-                status = "✓" if result["success"] else "✗"
-                domain = result["domain"]
-                pages = result["pages"]
-                words = result["words"]
-                method = result.get("method_used", "?")
-                print(f"  [{completed}/{total}] {status} {domain}: {pages} pages, {words:,} words ({method})")
-
-            except Exception as e:
-                completed += 1
+        for site, (result, error) in _iter_site_results(
+            sites,
+            eval_or_error,
+            jobs=min(jobs, total),
+            address_limiter=AddressLimiter(1),
+            host_limiter=HostRateLimiter(),
+            host_gap=SAME_HOST_GAP,
+        ):
+            completed += 1
+            if error is not None:
                 domain = site["domain"]
-                print(f"  [{completed}/{total}] ✗ {domain}: error - {e}")
-                results.append({
+                print(f"  [{completed}/{total}] ✗ {domain}: error - {error}")
+                result = {
                     "domain": domain,
                     "name": site.get("name", domain),
                     "tier": site.get("tier", "?"),
                     "success": False,
-                    "error": str(e),
+                    "error": str(error),
                     "pages": 0,
                     "words": 0,
                     "blocked": False,
                     "method_used": "unknown",
-                })
+                }
+            else:
+                # Progress update
+                status = "✓" if result["success"] else "✗"
+                domain = result["domain"]
+                pages = result["pages"]
+                words = result["words"]
+                method = result.get("method_used", "?")
+                print(f"  [{completed}/{total}] {status} {domain}: {pages} pages, {words:,} words ({method})")
+            # Recorded after the error handling: a failed write must not record the site twice
+            record(result)
 
+    print(f"\nResults written to {results_path}")
     return results
 
 
 def print_summary(results: list[dict], slo: SLOTracker | None = None):
-    """Print evaluation summary."""
+    """Print evaluation summary from the run's SLOTracker (built from results if not given)."""
     print("\n" + "=" * 60)
     print("EVALUATION SUMMARY")
     print("=" * 60)
 
-    total = len(results)
-    successes = sum(1 for r in results if r["success"])
-    blocks = sum(1 for r in results if r["blocked"])
-    total_pages = sum(r["pages"] for r in results)
-    total_words = sum(r["words"] for r in results)
+    if slo is None:
+        slo = SLOTracker.from_results(results)
+    total = slo.total_attempts
+    successes = slo.successful
+    blocks = slo.blocked
+    total_pages = slo.total_pages
+    total_words = slo.total_words
 
     print(f"\nSites tested:  {total}")
     print(f"Successful:    {successes} ({100*successes/total:.0f}%)" if total else "Successful:    0")
@@ -702,10 +882,7 @@ def print_summary(results: list[dict], slo: SLOTracker | None = None):
     print(f"Total words:   {total_words:,}")
 
     # Method breakdown
-    methods = {}
-    for r in results:
-        m = r.get("method_used", "unknown")
-        methods[m] = methods.get(m, 0) + 1
+    methods = slo.method_counts
     if methods:
         print(f"\nMethods used:")
         for m, c in sorted(methods.items(), key=lambda x: -x[1]):
@@ -750,7 +927,8 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
-  python scripts/eval_access.py                    # Just run it (interactive)
+  python scripts/eval_access.py                    # Just run it (parallel batch, auto jobs)
+  python scripts/eval_access.py --interactive      # Prompts and pauses per site
   python scripts/eval_access.py -j 4               # Parallel batch mode (4 jobs)
   python scripts/eval_access.py --tier 2           # Test tier-2 sites
   python scripts/eval_access.py --domain jbhunt.com  # Single site
@@ -758,19 +936,32 @@ Examples:
   python scripts/eval_access.py --depth 1          # Crawl one level deep
   python scripts/eval_access.py --no-confirm       # Skip strategy confirmation
   python scripts/eval_access.py -j 4 -n 10         # 10 sites, 4 parallel
+  python scripts/eval_access.py --tail corpus/eval_reports/eval_batch_<ts>.ndjson  # Re-summarize a run
 """
     )
     parser.add_argument("--domain", "-d", help="Test single domain")
     parser.add_argument("--tier", "-t", type=int, help="Test specific tier (default: 1)")
     parser.add_argument("--sample-size", "-n", type=int, help="Number of sites to test")
     parser.add_argument("--depth", type=int, help="Crawl depth (default: 0 = homepage only)")
-    parser.add_argument("--jobs", "-j", type=int, default=1,
-                        help="Parallel jobs (>1 = batch mode, no prompts, headless)")
+    parser.add_argument("--jobs", "-j", type=int, default=None,
+                        help="Parallel jobs (>1 = batch mode, no prompts, headless; "
+                             "default: one per site, up to max_jobs)")
+    parser.add_argument("--interactive", "-i", action="store_true",
+                        help="Interactive session: prompts and pauses per site")
     parser.add_argument("--no-confirm", action="store_true", help="Skip strategy confirmation prompts")
     parser.add_argument("--no-pause", action="store_true", help="Don't pause between sites")
     parser.add_argument("--auto-queue", action="store_true", help="Auto-add failures to monkey queue")
+    parser.add_argument("--no-recon-cache", action="store_true",
+                        help="Re-run recon for every site instead of reusing cached results")
+    parser.add_argument("--tail", metavar="NDJSON",
+                        help="Summarize a batch results file (streamed; works on partial runs)")
     args = parser.parse_args()
 
+    if args.tail:
+        results = list(read_results(Path(args.tail)))
+        print_summary(results)
+        return
+
     # Load config
     config, known_hard, skip_sites = load_config()
 
@@ -785,6 +976,8 @@ Examples:
         config.pause_between_sites = False
     if args.auto_queue:
         config.on_block = "auto_queue"
+    if args.no_recon_cache:
+        config.use_recon_cache = False
 
     # Select sites
     sites = select_sites(
@@ -799,15 +992,17 @@ Examples:
         print("No sites to evaluate.")
         sys.exit(1)
 
-    # Run evaluation (batch mode if jobs > 1)
-    if args.jobs > 1:
-        results = run_batch_eval(sites, config, jobs=args.jobs)
+    # Run evaluation (batch mode if jobs > 1, unless --interactive)
+    jobs = 1 if args.interactive else resolve_jobs(args.jobs, len(sites), config)
+    slo = SLOTracker()
+    if jobs > 1:
+        results = run_batch_eval(sites, config, jobs=jobs, slo=slo)
     else:
-        results = run_eval_session(sites, config)
+        results = run_eval_session(sites, config, slo=slo)
 
     # Print summary
     if results:
-        print_summary(results)
+        print_summary(results, slo)
 
 
 if __name__ == "__main__":
@@ -36,6 +36,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from fetch.extractor import extract_content, STRIP_TAGS, STRIP_CLASSES
 from fetch.config import FetchConfig
+from fetch.html_archive import ZSTD_SUFFIX, read_html
 
 CORPUS_DIR = Path(__file__).parent.parent / "corpus"
 SEEDS_FILE = Path(__file__).parent.parent / "seeds" / "trucking_carriers.json"
@@ -262,11 +263,16 @@ def get_available_crawls() -> list[str]:
 
 
 def get_raw_html_files(domain: str) -> list[Path]:
-    """Get raw HTML files for a domain."""
+    """Get raw HTML files for a domain, plain or zstd-compressed (--compress-raw)."""
     raw_dir = CORPUS_DIR / "raw" / domain
     if not raw_dir.exists():
         return []
-    return sorted(raw_dir.glob("*.html"))
+    return sorted([*raw_dir.glob("*.html"), *raw_dir.glob("*.html" + ZSTD_SUFFIX)])
+
+
+def raw_page_path(html_file: Path) -> str:
+    """Page path encoded in a raw HTML file name."""
+    return html_file.name.removesuffix(ZSTD_SUFFIX).removesuffix(".html").replace("_", "/")
 
 
 def load_site_data(domain: str) -> dict | None:
@@ -554,13 +560,13 @@ def run_evaluation(domain: str, sample_size: int = 5, do_crawl: bool = False) ->
 
         # Read HTML
         try:
-            html = html_file.read_text(errors='replace')
+            html = read_html(html_file)
         except Exception as e:
             print(f"Error reading {html_file}: {e}")
             continue
 
         # Reconstruct URL from filename
-        page_path = html_file.stem.replace("_", "/")
+        page_path = raw_page_path(html_file)
         if page_path == "index":
             page_url = f"https://{domain}/"
         else:
@@ -716,11 +722,11 @@ def auto_eval_domain(domain: str, sample_size: int = 5) -> dict:
 
     for html_file in selected:
         try:
-            html = html_file.read_text(errors='replace')
+            html = read_html(html_file)
             extraction = extract_content(html, config)
 
             # Reconstruct URL
-            page_path = html_file.stem.replace("_", "/")
+            page_path = raw_page_path(html_file)
             if page_path == "index":
                 page_url = f"https://{domain}/"
             else:
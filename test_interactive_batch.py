@@ -5,6 +5,8 @@ import sys
 import time
 sys.path.insert(0, '.')
 
+import requests
+
 from fetch.interactive import interactive_fetch
 from fetch.config import FetchConfig
 from fetch import fetch_source
@@ -20,20 +22,20 @@ CARRIERS = [
     ('Knight-Swift', 'https://www.knight-swift.com'),
 ]
 
-def test_carrier(name, url):
+def test_carrier(name, url, session=None):
     """Test baseline vs interactive fetch."""
     config = FetchConfig()
 
     # Baseline
     start = time.time()
-    baseline = fetch_source(url, config)
+    baseline = fetch_source(url, config, session=session)
     baseline_time = time.time() - start
     baseline_words = baseline.word_count if baseline else 0
 
     # Interactive (forced)
     config_forced = FetchConfig(min_words=9999)
     start = time.time()
-    interactive = interactive_fetch(url, config_forced)
+    interactive = interactive_fetch(url, config_forced, session=session)
     interactive_time = time.time() - start
     interactive_words = interactive.word_count
     interactions = len(interactive.interaction_log)
@@ -55,10 +57,13 @@ def main():
     print(f"{'Carrier':<15} {'Baseline':>8} {'Interactive':>11} {'Delta':>8} {'Actions':>7} {'Time':>6}")
     print("-" * 60)
 
+    # One session for the run: each carrier's baseline and interactive
+    # fetches share a kept-alive connection instead of reconnecting
+    session = requests.Session()
     results = []
     for name, url in CARRIERS:
         try:
-            r = test_carrier(name, url)
+            r = test_carrier(name, url, session=session)
             results.append(r)
             print(f"{r['name']:<15} {r['baseline_words']:>8} {r['interactive_words']:>11} {r['delta']:>+8} {r['interactions']:>7} {r['interactive_time']:>5}s")
         except Exception as e:
@@ -2,11 +2,12 @@
 Tests for fetch/access_classifier.py (Div 4k1 Stream A).
 """
 
+from dataclasses import asdict
 from datetime import datetime, timezone
 from pathlib import Path
 
-from fetch.access_classifier import classify_capture_result
-from fetch.capture_config import CaptureResult
+from fetch.access_classifier import classify_capture_result, outcome_as_dict
+from fetch.capture_config import AccessAttempt, AccessOutcome, CaptureResult
 
 
 def _capture(tmp_path: Path, html: str | None = None, error: str | None = None) -> CaptureResult:
@@ -56,3 +57,23 @@ def test_classifies_success_with_extracted_words(tmp_path: Path):
     assert outcome.outcome == "success_real_content"
     assert outcome.word_count_estimate == 80
 
+
+def test_attempt_to_dict_matches_asdict():
+    outcome = AccessOutcome(outcome="soft_block", reason="r", http_status=200, detected_markers=["captcha"])
+    attempt = AccessAttempt(attempt_index=0, strategy="js", started_at="t", duration_ms=5, outcome=outcome)
+
+    assert attempt.to_dict() == asdict(attempt)
+    assert list(attempt.to_dict()["outcome"]) == list(asdict(outcome))
+    assert outcome_as_dict(outcome)["detected_markers"] is not outcome.detected_markers
+
+
+def test_capture_attempt_dicts_serialized_once(tmp_path: Path):
+    capture = _capture(tmp_path, html="<html></html>")
+    capture.attempts = [
+        AccessAttempt(attempt_index=0, strategy="requests", started_at="t", duration_ms=5,
+                      outcome=AccessOutcome(outcome="soft_block", reason="r")),
+    ]
+
+    dicts = capture.attempts_as_dicts()
+    assert dicts == [a.to_dict() for a in capture.attempts]
+    assert capture.attempts_as_dicts() is dicts
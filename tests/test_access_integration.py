@@ -238,6 +238,26 @@ class TestReconCaching:
             result = recon_site("https://example.com", cache_path=mock_recon_cache, ttl_days=7)
             assert mock_get.call_count == 1
 
+    def test_recon_cache_bypass_and_external_edits(self, mock_recon_cache):
+        """use_cache=False probes again; edits to the cache file are picked up."""
+        with patch('fetch.recon.requests.get') as mock_get:
+            mock_resp = MagicMock()
+            mock_resp.status_code = 200
+            mock_resp.headers = {"server": "nginx"}
+            mock_resp.text = "<html><body>Hello</body></html>"
+            mock_get.return_value = mock_resp
+
+            recon_site("https://example.com", cache_path=mock_recon_cache)
+            recon_site("https://example.com", cache_path=mock_recon_cache, use_cache=False)
+            assert mock_get.call_count == 2
+
+            cache = json.loads(mock_recon_cache.read_text())
+            cache["example.com"]["cdn"] = "edited"
+            mock_recon_cache.write_text(json.dumps(cache))
+            result = recon_site("https://example.com", cache_path=mock_recon_cache)
+            assert mock_get.call_count == 2
+            assert result.cdn == "edited"
+
 
 # =============================================================================
 # Strategy Cache Tests
@@ -0,0 +1,103 @@
+import json
+import os
+import pickle
+from pathlib import Path
+
+from scripts import analyze
+
+
+def _site(domain: str, texts: list[str], tier: int = 1) -> dict:
+    return {
+        "domain": domain,
+        "company_name": domain.split(".")[0].title(),
+        "tier": tier,
+        "category": ["truckload"],
+        "total_word_count": sum(len(t.split()) for t in texts),
+        "structure": {"total_pages": len(texts)},
+        "term_counts": {"driver": len(texts)},
+        "pages": [
+            {
+                "page_type": "home" if i == 0 else "other",
+                "h1": f"{domain} page {i}",
+                "word_count": len(text.split()),
+                "full_text": text,
+                "term_counts": {"driver": 1},
+                "sections": [{"heading": "Drive With Us", "text": text}],
+            }
+            for i, text in enumerate(texts)
+        ],
+    }
+
+
+def _write_sites(sites_dir: Path, sites: list[dict]) -> list[Path]:
+    sites_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for site in sites:
+        path = sites_dir / f"{site['domain'].replace('.', '_')}.json"
+        path.write_text(json.dumps(site), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def test_generate_report_ngrams_match_serial_with_jobs(monkeypatch):
+    phrases = [
+        "home time every week for our company drivers",
+        "owner operators earn top pay per mile",
+        "apply today to drive with a family owned carrier",
+        "regional lanes with home time and paid orientation",
+    ]
+    sites = [
+        _site(f"site{i}.com", [" ".join(phrases[(i + j) % len(phrases)] for j in range(k + 1)) for k in range(3)])
+        for i in range(7)
+    ]
+    # Small batches so several are in flight and merged across workers
+    monkeypatch.setattr(analyze, "NGRAM_BATCH_PAGES", 2)
+
+    serial = analyze.generate_report(iter(sites), jobs=1)
+    parallel = analyze.generate_report(iter(sites), jobs=3)
+
+    for key in ("bigrams", "trigrams"):
+        assert list(parallel[key]["top"].items()) == list(serial[key]["top"].items())
+    assert parallel == serial
+
+
+def test_corpus_cache_invalidated_when_corpus_changes(monkeypatch, tmp_path):
+    monkeypatch.setattr(analyze, "ANALYSIS_DIR", tmp_path / "analysis")
+    sites_dir = tmp_path / "sites"
+    files = _write_sites(sites_dir, [_site("a.com", ["first crawl"])])
+
+    assert analyze.load_all_sites_cached(files)[0]["pages"][0]["full_text"] == "first crawl"
+
+    # Recrawl: same file count, newer mtime
+    files[0].write_text(json.dumps(_site("a.com", ["second crawl"])), encoding="utf-8")
+    stat = files[0].stat()
+    os.utime(files[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert analyze.load_all_sites_cached(files)[0]["pages"][0]["full_text"] == "second crawl"
+
+    # Added site: file count changes
+    files += _write_sites(sites_dir, [_site("b.com", ["new site"])])
+    os.utime(files[1], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000_000))
+    assert sorted(s["domain"] for s in analyze.load_all_sites_cached(files)) == ["a.com", "b.com"]
+
+    # Replaced by an older copy (rsync, cp -p): same count, same newest mtime
+    files[0].write_text(json.dumps(_site("a.com", ["restored copy"])), encoding="utf-8")
+    os.utime(files[0], ns=(stat.st_atime_ns, stat.st_mtime_ns - 1_000_000_000))
+    by_domain = {s["domain"]: s for s in analyze.load_all_sites_cached(files)}
+    assert by_domain["a.com"]["pages"][0]["full_text"] == "restored copy"
+
+    # Stale cache files are removed as new ones are written
+    assert len(list((tmp_path / "analysis").glob(".corpus_cache.*.pkl"))) == 1
+
+
+def test_corpus_cache_recovers_from_corrupt_pickle(monkeypatch, tmp_path):
+    monkeypatch.setattr(analyze, "ANALYSIS_DIR", tmp_path / "analysis")
+    files = _write_sites(tmp_path / "sites", [_site("a.com", ["cached text"])])
+
+    expected = analyze.load_all_sites_cached(files)
+    (cache_path,) = (tmp_path / "analysis").glob(".corpus_cache.*.pkl")
+
+    for corrupt in (cache_path.read_bytes()[:20], b"not a pickle"):
+        cache_path.write_bytes(corrupt)
+        assert analyze.load_all_sites_cached(files) == expected
+        # The cache is rewritten with a loadable copy
+        assert pickle.loads(cache_path.read_bytes()) == expected
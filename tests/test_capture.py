@@ -8,6 +8,7 @@ from pathlib import Path
 
 import pytest
 
+from fetch import capture
 from fetch.capture import (
     hash_content,
     url_to_filename,
@@ -493,5 +494,101 @@ class TestCaptureConfig:
         assert '[aria-expanded="false"]' in config.accordion_selectors
 
 
+class _FakePage:
+    url = "https://www.example.com/"
+
+    def goto(self, url, **kwargs):
+        pass
+
+    def content(self):
+        return "<html><body><h1>Hi</h1></body></html>"
+
+
+class _FakeContext:
+    def __init__(self):
+        self.closed = False
+
+    def new_page(self):
+        return _FakePage()
+
+    def cookies(self):
+        return []
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+        self.closed = False
+
+    def new_context(self, **kwargs):
+        self.contexts.append(_FakeContext())
+        return self.contexts[-1]
+
+    def is_connected(self):
+        return not self.closed
+
+    def close(self):
+        self.closed = True
+
+
+class _FakePlaywright:
+    def __init__(self):
+        self.launched = []
+        self.stopped = False
+        self.chromium = self
+
+    def launch(self, headless=True):
+        self.launched.append(_FakeBrowser())
+        return self.launched[-1]
+
+    def start(self):
+        return self
+
+    def stop(self):
+        self.stopped = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class TestSharedBrowser:
+    """Tests for browser reuse in capture_page_playwright."""
+
+    @pytest.fixture
+    def fake_playwright(self, monkeypatch):
+        sync_api = pytest.importorskip("playwright.sync_api")
+        fake = _FakePlaywright()
+        monkeypatch.setattr(sync_api, "sync_playwright", lambda: fake)
+        monkeypatch.setattr(capture, "expand_all", lambda page, config: {})
+        return fake
+
+    def test_browser_launched_once_per_block(self, fake_playwright, tmp_path):
+        config = CaptureConfig(js_required=True, take_screenshot=False)
+        with capture.shared_browser():
+            for _ in range(3):
+                result = capture.capture_page_playwright("https://www.example.com/", config, tmp_path)
+                assert result.error is None
+
+        assert len(fake_playwright.launched) == 1
+        browser = fake_playwright.launched[0]
+        assert browser.closed and fake_playwright.stopped
+        assert len(browser.contexts) == 3
+        assert all(c.closed for c in browser.contexts)
+
+    def test_browser_closed_per_capture_outside_block(self, fake_playwright, tmp_path):
+        config = CaptureConfig(js_required=True, take_screenshot=False)
+        capture.capture_page_playwright("https://www.example.com/", config, tmp_path)
+        capture.capture_page_playwright("https://www.example.com/", config, tmp_path)
+
+        assert len(fake_playwright.launched) == 2
+        assert all(b.closed for b in fake_playwright.launched)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
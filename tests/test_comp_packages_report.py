@@ -27,6 +27,32 @@ def _sample_site():
     }
 
 
+def test_sentences_split_on_terminal_punctuation():
+    text = "Earn more!  Home weekly?\nYes. CPM 0.70 per mile.x Done"
+    assert cpr._sentences(text) == [
+        "Earn more!",
+        "Home weekly?",
+        "Yes.",
+        "CPM 0.70 per mile.x Done",
+    ]
+    assert cpr._sentences("   ") == []
+
+
+def test_collect_hits_returns_matching_sentences():
+    text = "We haul freight. Driver pay is weekly!  Great team. Home time? CDL required."
+    assert cpr._collect_hits(text, "drivers") == [
+        "Driver pay is weekly!",
+        "Home time?",
+        "CDL required.",
+    ]
+    assert cpr._collect_hits(text, "owner_operators") == []
+
+    # Lowercasing "İ" changes string length; the slow path must agree
+    assert cpr._collect_hits("İstanbul office. Driver pay weekly.", "drivers") == [
+        "Driver pay weekly.",
+    ]
+
+
 def test_comp_packages_report_json(tmp_path, monkeypatch):
     site_path = tmp_path / "site.json"
     site_path.write_text(json.dumps(_sample_site()), encoding="utf-8")
@@ -0,0 +1,67 @@
+import requests
+
+from scripts import cookie_inspect as ci
+
+
+class _Resp:
+    def __init__(self, body: bytes, encoding=None, status_code=200):
+        self.body = body
+        self.encoding = encoding
+        self.status_code = status_code
+        self.bytes_read = 0
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.body), chunk_size):
+            chunk = self.body[i:i + chunk_size]
+            self.bytes_read += len(chunk)
+            yield chunk
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+def test_scan_counts_characters_not_bytes():
+    text = "Willkommen, Straße und Café. " * 400
+    resp = _Resp(text.encode("utf-8"), encoding="utf-8")
+
+    assert ci._scan_for_block(resp) == (len(text), False, False)
+
+
+def test_scan_flags_every_early_exit_as_truncated():
+    text = "<p>Please complete the CAPTCHA</p>" + "x" * (ci.CHECK_CHUNK_SIZE * 4)
+    resp = _Resp(text.encode("utf-8"), encoding="utf-8")
+
+    content_len, blocked, truncated = ci._scan_for_block(resp)
+    assert blocked and truncated
+    assert content_len == ci.CHECK_CHUNK_SIZE < len(text)
+    assert resp.bytes_read < len(resp.body)
+
+    capped = _Resp(b"x" * (ci.MAX_CHECK_CHARS * 2), encoding="ascii")
+    assert ci._scan_for_block(capped) == (ci.MAX_CHECK_CHARS, False, True)
+
+
+def test_scan_sniffs_encoding_without_charset():
+    # Without a charset, requests leaves encoding unset; utf-8 would
+    # mangle this UTF-16 body and miss the block phrase
+    text = "Sorry, access denied for automated clients. " * 500
+    resp = _Resp(text.encode("utf-16"), encoding=None)
+
+    content_len, blocked, truncated = ci._scan_for_block(resp)
+    assert blocked and truncated
+    assert content_len < len(text)
+    assert ci._sniff_encoding(b"") == "utf-8"
+
+
+def test_check_reports_partial_length_with_plus(monkeypatch, capsys):
+    monkeypatch.setattr(ci, "load_site_cookies", lambda domain: [{"name": "sid", "value": "1", "expires": -1}])
+    body = ("<h1>Access Denied</h1>" + "x" * (ci.CHECK_CHUNK_SIZE * 2)).encode("utf-8")
+    monkeypatch.setattr(requests, "get", lambda url, **kw: _Resp(body, encoding="utf-8", status_code=200))
+
+    assert ci.cmd_check("example.com") is False
+
+    out = capsys.readouterr().out
+    assert f"Content length: {ci.CHECK_CHUNK_SIZE:,}+ chars" in out
+    assert "BLOCKED" in out
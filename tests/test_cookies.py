@@ -0,0 +1,28 @@
+import time
+
+from requests.cookies import RequestsCookieJar, create_cookie
+
+from fetch.cookies import SiteCookieStore
+
+
+def test_site_cookie_store_round_trips_requests_and_playwright_formats():
+    store = SiteCookieStore()
+
+    jar = RequestsCookieJar()
+    jar.set_cookie(create_cookie("consent", "yes", domain="www.example.com", path="/", rest={"HttpOnly": None}))
+    store.update_from_jar(jar)
+    store.update([
+        {"name": "sid", "value": "abc", "domain": ".example.com", "path": "/", "expires": None},
+        {"name": "old", "value": "x", "domain": ".example.com", "path": "/", "expires": time.time() - 60},
+    ])
+    # Later values replace earlier ones for the same (domain, path, name)
+    store.update([{"name": "sid", "value": "def", "domain": ".example.com", "path": "/"}])
+
+    cookies = {c["name"]: c for c in store.cookies()}
+    assert set(cookies) == {"consent", "sid"}
+    assert cookies["consent"]["httpOnly"] and cookies["consent"]["expires"] == -1
+    assert cookies["sid"]["value"] == "def"
+
+    sent = {c.name: c for c in store.to_jar()}
+    assert sent["sid"].value == "def" and sent["sid"].domain == ".example.com"
+    assert sent["consent"].has_nonstandard_attr("HttpOnly")
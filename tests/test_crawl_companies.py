@@ -1,6 +1,23 @@
+import argparse
+import contextlib
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import SimpleNamespace
 
+import pytest
+
+from fetch import capture
+from fetch.capture_config import CaptureResult
+from orchestrate import rate_limit
+from orchestrate.presenter import (
+    AccessTelemetryLog,
+    _build_access_summary,
+    access_telemetry_file,
+    build_capture_site_data,
+)
 from scripts import crawl
 
 
@@ -24,3 +41,266 @@ def test_load_companies_json_wrapped(tmp_path):
 
     loaded = crawl.load_companies_file(str(path))
     assert loaded[0]["domain"] == "c.com"
+
+
+def test_url_key_collapses_sitemap_variants():
+    key = crawl._url_key("https://www.example.com/about")
+    assert crawl._url_key("https://WWW.Example.com/about/") == key
+    assert crawl._url_key("https://www.example.com/about#team") == key
+    assert crawl._url_key("https://www.example.com/a?b=2&a=1") == crawl._url_key("https://www.example.com/a?a=1&b=2")
+    assert crawl._url_key("https://www.example.com/a?a=1") != crawl._url_key("https://www.example.com/a?a=2")
+    assert crawl._url_key("https://www.example.com") == crawl._url_key("https://www.example.com/")
+
+
+def test_capture_site_dedupes_captures_but_profiles_every_sitemap_entry(monkeypatch, tmp_path):
+    locs = [
+        "https://www.ex.com/",
+        "https://www.ex.com/about",
+        "https://www.ex.com/about/",
+        "https://www.ex.com/about#team",
+        "https://www.ex.com/jobs",
+    ]
+    robots = SimpleNamespace(found=True, robots_url="https://www.ex.com/robots.txt", crawl_delay=None,
+                             sitemaps=[], disallowed_paths=[], error=None, is_allowed=lambda url: True)
+    monkeypatch.setattr(crawl, "RAW_DIR", tmp_path / "raw")
+    monkeypatch.setattr(crawl, "SITES_DIR", tmp_path / "sites")
+    monkeypatch.setattr(crawl, "recon_site", lambda url, **kw: None)
+    monkeypatch.setattr(crawl, "get_robots", lambda url, **kw: robots)
+    monkeypatch.setattr(crawl, "find_sitemap", lambda *a, **kw: SimpleNamespace(
+        sitemap_url="https://www.ex.com/sitemap.xml", urls=[SimpleNamespace(loc=loc) for loc in locs]))
+    monkeypatch.setattr(crawl, "_SITEMAP_CACHE", {})
+    monkeypatch.setattr(crawl, "_RECON_CACHE", {})
+
+    captured = []
+
+    def fake_capture(url, config, archive_dir, session=None):
+        captured.append(url)
+        path = archive_dir / f"{len(captured)}.html"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        html = "<html><body><main>" + "<p>freight shipping lanes</p>" * 40 + "</main></body></html>"
+        path.write_text(html)
+        return CaptureResult(url=url, final_url=url, html_path=path, screenshot_path=None, asset_inventory=[],
+                             manifest_path=None, content_hash=str(len(captured)), captured_at="t",
+                             fetch_method="requests", timing=None, headers={"_http_status": "200"},
+                             cookies=[], html_size_bytes=len(html))
+
+    monkeypatch.setattr(crawl, "capture_page", fake_capture)
+    args = argparse.Namespace(no_headless=False, js=False, stealth=False, access_max_attempts=1,
+                              access_escalation_mode="static", delay=0.0, patient=False, slow_drip=False,
+                              fetch_method="requests", fetch_profile=None, depth=2)
+
+    site = crawl.capture_site({"name": "Ex", "domain": "ex.com"}, args, {}, {"delay", "fetch_method"}, {},
+                              playbooks={}, write_site=False)
+
+    assert sorted(captured) == ["https://www.ex.com", "https://www.ex.com/about", "https://www.ex.com/jobs"]
+    assert site["site_profile"]["sitemap"]["url_count"] == len(locs)
+    assert site["site_profile"]["sitemap"]["sample"] == locs
+
+
+def test_escalation_retries_hold_the_host_limiter(monkeypatch):
+    held = []
+
+    class RecordingLimiter:
+        @contextlib.contextmanager
+        def hold_url(self, url, delay):
+            held.append((url, delay))
+            yield
+
+    outcomes = iter(["soft_block", "soft_block", "success_real_content"])
+    monkeypatch.setattr(crawl, "_make_capture_config_for_strategy", lambda strategy, plan, base: strategy)
+    monkeypatch.setattr(crawl, "capture_page", lambda url, config, archive_dir, session=None: SimpleNamespace(
+        error=None, html_size_bytes=10, html_path="p", access_outcome=None, attempts=None))
+    monkeypatch.setattr(crawl, "classify_capture_result",
+                        lambda result, recon=None: SimpleNamespace(outcome=next(outcomes)))
+    monkeypatch.setattr(crawl, "decide_next_strategy", lambda **kw: "js")
+    monkeypatch.setattr(crawl, "compute_backoff_delay", lambda *a: 0.0)
+
+    plan = SimpleNamespace(initial_strategy="requests", max_attempts=4)
+    result, attempts, outcome = crawl._capture_url_adaptive(
+        "https://www.ex.com/a", plan, None, None, None, "adaptive",
+        limiter=RecordingLimiter(), delay=2.0,
+    )
+
+    assert outcome == "success_real_content"
+    assert [a.strategy for a in attempts] == ["requests", "js", "js"]
+    assert held == [("https://www.ex.com/a", 2.0)] * 3
+
+
+def test_sitemap_discovery_shared_per_host(monkeypatch):
+    calls = []
+
+    def fake_fetch(start_url):
+        calls.append(start_url)
+        if "flaky" in start_url:
+            raise RuntimeError("timeout")
+        return None, start_url, None
+
+    monkeypatch.setattr(crawl, "_SITEMAP_CACHE", {})
+    monkeypatch.setattr(crawl, "_fetch_sitemap_entries", fake_fetch)
+
+    first = crawl._discover_sitemap_entries("https://www.a.com/careers")
+    assert crawl._discover_sitemap_entries("https://www.a.com/fleet") == first
+    crawl._discover_sitemap_entries("https://www.b.com/")
+    assert calls == ["https://www.a.com/careers", "https://www.b.com/"]
+
+    # Failures are retried by the next site instead of being cached
+    for _ in range(2):
+        try:
+            crawl._discover_sitemap_entries("https://flaky.com/")
+        except RuntimeError:
+            pass
+    assert calls.count("https://flaky.com/") == 2
+
+
+def test_http_session_is_per_thread():
+    session = crawl._http_session()
+    assert crawl._http_session() is session
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        others = list(pool.map(lambda _: crawl._http_session(), range(2)))
+    assert all(other is not session for other in others)
+
+
+def test_site_workers_reuse_browser_across_sites(monkeypatch):
+    sync_api = pytest.importorskip("playwright.sync_api")
+
+    launched = []
+
+    class FakeBrowser:
+        closed = False
+
+        def is_connected(self):
+            return not self.closed
+
+        def close(self):
+            self.closed = True
+
+    class FakePlaywright:
+        def __init__(self):
+            self.chromium = self
+
+        def start(self):
+            return self
+
+        def stop(self):
+            pass
+
+        def launch(self, headless=True):
+            launched.append(FakeBrowser())
+            return launched[-1]
+
+    monkeypatch.setattr(sync_api, "sync_playwright", FakePlaywright)
+
+    def site_executor(carrier):
+        with capture._browser(True) as browser:
+            return browser
+
+    carriers = [{"domain": f"c{i}.com"} for i in range(6)]
+    results = list(crawl._iter_site_results(carriers, site_executor, jobs=2))
+
+    assert sorted(c["domain"] for c, _ in results) == [c["domain"] for c in carriers]
+    assert 1 <= len(launched) <= 2
+    assert {id(b) for _, b in results} <= {id(b) for b in launched}
+    assert all(b.closed for b in launched)
+
+
+def test_site_scheduler_skips_past_busy_addresses(monkeypatch):
+    ips = {"www.a1.com": "10.0.0.1", "www.a2.com": "10.0.0.1", "www.a3.com": "10.0.0.1", "www.b.com": "10.0.0.2"}
+    monkeypatch.setattr(rate_limit.socket, "gethostbyname", lambda host: ips[host])
+    monkeypatch.setattr(crawl, "shared_browser", contextlib.nullcontext)
+
+    running: dict[str, int] = {}
+    peak: dict[str, int] = {}
+    lock = threading.Lock()
+
+    def site_executor(carrier):
+        ip = ips["www." + carrier["domain"]]
+        with lock:
+            running[ip] = running.get(ip, 0) + 1
+            peak[ip] = max(peak.get(ip, 0), running[ip])
+        time.sleep(0.05)
+        with lock:
+            running[ip] -= 1
+        return carrier["domain"]
+
+    carriers = [{"domain": d} for d in ("a1.com", "a2.com", "a3.com", "b.com")]
+    limiter = rate_limit.AddressLimiter(1)
+    order = [r for _, r in crawl._iter_site_results(carriers, site_executor, jobs=2, address_limiter=limiter)]
+
+    assert sorted(order) == sorted(c["domain"] for c in carriers)
+    assert peak == {"10.0.0.1": 1, "10.0.0.2": 1}
+    # b.com ran alongside a1.com instead of waiting behind a2/a3
+    assert order.index("b.com") < 2
+
+
+def test_site_scheduler_waits_out_host_gap_without_a_slot(monkeypatch):
+    monkeypatch.setattr(rate_limit.socket, "gethostbyname", lambda host: "10.0.0.1")
+    monkeypatch.setattr(crawl, "shared_browser", contextlib.nullcontext)
+
+    started: dict[str, float] = {}
+
+    def site_executor(carrier):
+        started[carrier["domain"]] = time.monotonic()
+        time.sleep(0.05)
+        return carrier["domain"]
+
+    carriers = [{"domain": d} for d in ("a.com", "a.com/careers", "b.com")]
+    order = [r for _, r in crawl._iter_site_results(
+        carriers, site_executor, jobs=2,
+        address_limiter=rate_limit.AddressLimiter(1),
+        host_limiter=rate_limit.HostRateLimiter(), host_gap=0.3,
+    )]
+
+    # a.com/careers sat out www.a.com's gap without holding the shared
+    # address, so b.com ran in the meantime
+    assert order == ["a.com", "b.com", "a.com/careers"]
+    assert started["a.com/careers"] - started["a.com"] >= 0.3
+    assert started["b.com"] - started["a.com"] < 0.2
+
+
+def test_access_telemetry_streams_to_sidecar(tmp_path):
+    entries = [
+        {"url": "https://www.ex.com/", "final_outcome": "success_real_content",
+         "attempts": [{"strategy": "requests"}], "escalations_used": ["requests"]},
+        {"url": "https://www.ex.com/p1", "final_outcome": "soft_block",
+         "attempts": [{"strategy": "requests"}, {"strategy": "js"}], "escalations_used": ["requests", "js"]},
+    ]
+    path = access_telemetry_file("www.ex.com", tmp_path)
+    with AccessTelemetryLog(path) as telemetry:
+        for entry in entries:
+            telemetry.add(entry)
+
+    assert path.name == "www_ex_com.attempts.jsonl"
+    assert [json.loads(line) for line in path.read_text().splitlines()] == entries
+    assert telemetry.summary.to_dict() == _build_access_summary(entries)
+
+    site = build_capture_site_data(
+        {"name": "Ex", "domain": "www.ex.com"}, [], [], 2,
+        access_telemetry_path=path.name, access_summary=telemetry.summary.to_dict(),
+    )
+    assert site["access_telemetry_path"] == "www_ex_com.attempts.jsonl"
+    assert site["access_summary"]["total_attempts"] == 3
+    assert "access_telemetry" not in site
+
+
+def test_access_telemetry_sidecars_per_seed(tmp_path):
+    home = access_telemetry_file("ups.com", tmp_path)
+    freight = access_telemetry_file("ups.com/freight", tmp_path)
+    assert home != freight
+
+    # Concurrent seeds on one base domain each keep their own lines
+    with AccessTelemetryLog(home) as a, AccessTelemetryLog(freight) as b:
+        a.add({"url": "https://www.ups.com/"})
+        b.add({"url": "https://www.ups.com/freight"})
+    assert json.loads(home.read_text())["url"] == "https://www.ups.com/"
+    assert json.loads(freight.read_text())["url"] == "https://www.ups.com/freight"
+
+    # A failed capture leaves the previous sidecar in place
+    try:
+        with AccessTelemetryLog(home) as a:
+            a.add({"url": "https://www.ups.com/partial"})
+            raise RuntimeError("capture failed")
+    except RuntimeError:
+        pass
+    assert json.loads(home.read_text())["url"] == "https://www.ups.com/"
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted([home.name, freight.name])
@@ -0,0 +1,318 @@
+import contextlib
+import json
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from fetch.capture_config import CaptureResult
+from orchestrate import rate_limit
+from orchestrate.presenter import access_telemetry_file
+from scripts import crawl
+from scripts import eval_access as ea
+
+
+@pytest.fixture(autouse=True)
+def _no_dns(monkeypatch):
+    # Batch eval resolves each site's server address; keep tests offline
+    monkeypatch.setattr(rate_limit.socket, "gethostbyname", lambda host: host)
+
+
+def _site(pages, words, outcomes, fetch_method="requests"):
+    return {
+        "capture_mode": True,
+        "fetch_method": fetch_method,
+        "stats": {"pages_captured": pages},
+        "total_word_count": words,
+        "access_summary": {"outcome_counts": outcomes} if outcomes else {},
+    }
+
+
+def test_run_crawl_captures_through_capture_site(monkeypatch):
+    calls = []
+
+    def fake_capture_site(carrier, args, cfg, provided_flags, fetch_profiles, **kwargs):
+        calls.append((args, provided_flags, kwargs))
+        return _site(1, 450, {"success_real_content": 1})
+
+    monkeypatch.setattr(crawl, "capture_site", fake_capture_site)
+
+    result = ea.run_crawl({"name": "A", "domain": "a.com"}, method="js", depth=0, timeout=30)
+
+    assert result == {
+        "success": True, "pages": 1, "words": 450, "method_used": "requests",
+        "blocked": False, "error": None,
+    }
+    args, provided_flags, kwargs = calls[0]
+    assert args.fetch_method == "js" and not args.no_headless
+    assert {"fetch_method", "no_headless"} <= provided_flags
+    assert kwargs["write_site"] is False and kwargs["max_urls"] == 1
+
+
+def test_run_crawl_reports_blocks_and_errors(monkeypatch):
+    monkeypatch.setattr(crawl, "capture_site", lambda *a, **k: _site(0, 0, {"hard_block": 2}, "unknown"))
+    blocked = ea.run_crawl({"name": "A", "domain": "a.com"}, method="stealth", depth=1, timeout=30)
+    assert blocked["blocked"] and not blocked["success"]
+    assert blocked["method_used"] == "stealth"
+
+    def fail(*a, **k):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(crawl, "capture_site", fail)
+    failed = ea.run_crawl({"name": "A", "domain": "a.com"}, method="requests", depth=0, timeout=30)
+    assert failed["error"] == "boom" and not failed["success"]
+
+
+def test_run_crawl_leaves_crawl_telemetry_sidecar_alone(monkeypatch, tmp_path):
+    sites_dir = tmp_path / "sites"
+    sidecar = access_telemetry_file("ex.com", sites_dir)
+    sidecar.parent.mkdir(parents=True)
+    sidecar.write_text('{"url": "https://www.ex.com/", "final_outcome": "success_real_content"}\n')
+
+    robots = SimpleNamespace(found=True, robots_url="https://www.ex.com/robots.txt", crawl_delay=None,
+                             sitemaps=[], disallowed_paths=[], error=None, is_allowed=lambda url: True)
+    monkeypatch.setattr(crawl, "RAW_DIR", tmp_path / "raw")
+    monkeypatch.setattr(crawl, "SITES_DIR", sites_dir)
+    monkeypatch.setattr(crawl, "recon_site", lambda url, **kw: None)
+    monkeypatch.setattr(crawl, "get_robots", lambda url, **kw: robots)
+    monkeypatch.setattr(crawl, "find_sitemap", lambda *a, **kw: None)
+    monkeypatch.setattr(crawl, "_SITEMAP_CACHE", {})
+    monkeypatch.setattr(crawl, "_RECON_CACHE", {})
+
+    def fake_capture(url, config, archive_dir, session=None):
+        path = archive_dir / "index.html"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        html = "<html><body><main>" + "<p>freight shipping lanes</p>" * 60 + "</main></body></html>"
+        path.write_text(html)
+        return CaptureResult(url=url, final_url=url, html_path=path, screenshot_path=None, asset_inventory=[],
+                             manifest_path=None, content_hash="h", captured_at="t",
+                             fetch_method="requests", timing=None, headers={"_http_status": "200"},
+                             cookies=[], html_size_bytes=len(html))
+
+    monkeypatch.setattr(crawl, "capture_page", fake_capture)
+    before = sidecar.read_bytes()
+
+    result = ea.run_crawl({"name": "Ex", "domain": "ex.com"}, method="requests", depth=0, timeout=30)
+
+    assert result["error"] is None and result["success"]
+    assert sidecar.read_bytes() == before
+    assert sorted(p.name for p in sites_dir.iterdir()) == [sidecar.name]
+
+
+def test_interleave_by_host_round_robins_hosts():
+    sites = [{"domain": d} for d in ("ups.com", "ups.com/freight", "www.fedex.com", "ups.com/ltl", "fedex.com/x", "odfl.com")]
+
+    ordered = [s["domain"] for s in ea._interleave_by_host(sites)]
+
+    assert ordered == ["ups.com", "www.fedex.com", "odfl.com", "ups.com/freight", "fedex.com/x", "ups.com/ltl"]
+    assert ea._host_key("WWW.UPS.com/freight") == "ups.com"
+
+
+def test_batch_scheduling_skips_busy_addresses_and_spaces_hosts(monkeypatch, tmp_path):
+    ips = {"www.a.com": "10.0.0.1", "www.a2.com": "10.0.0.1", "www.b.com": "10.0.0.2"}
+    monkeypatch.setattr(rate_limit.socket, "gethostbyname", lambda host: ips[host])
+    monkeypatch.setattr(crawl, "shared_browser", contextlib.nullcontext)
+    monkeypatch.setattr(ea, "recon_site", lambda url, **kw: None)
+    monkeypatch.setattr(ea, "get_cached_strategy", lambda domain: None)
+    monkeypatch.setattr(ea, "SAME_HOST_GAP", 0.3)
+
+    lock = threading.Lock()
+    running: dict[str, int] = {}
+    peak: dict[str, int] = {}
+    started: dict[str, float] = {}
+
+    def fake_run_crawl(carrier, **kwargs):
+        ip = ips["www." + carrier["domain"].split("/")[0]]
+        with lock:
+            started[carrier["domain"]] = time.monotonic()
+            running[ip] = running.get(ip, 0) + 1
+            peak[ip] = max(peak.get(ip, 0), running[ip])
+        time.sleep(0.05)
+        with lock:
+            running[ip] -= 1
+        return {"success": True, "pages": 1, "words": 200, "method_used": "requests",
+                "blocked": False, "error": None}
+
+    monkeypatch.setattr(ea, "run_crawl", fake_run_crawl)
+    sites = [{"domain": d} for d in ("a.com", "a.com/careers", "a2.com", "b.com")]
+
+    results = ea.run_batch_eval(sites, ea.EvalConfig(), jobs=2, results_path=tmp_path / "batch.ndjson")
+
+    assert sorted(r["domain"] for r in results) == sorted(s["domain"] for s in sites)
+    # One crawl per server address at a time
+    assert peak == {"10.0.0.1": 1, "10.0.0.2": 1}
+    # Seeds on one host start SAME_HOST_GAP apart; the wait doesn't hold
+    # the address, so a2.com (same IP, other host) ran during it
+    assert started["a.com/careers"] - started["a.com"] >= 0.3
+    assert started["a2.com"] < started["a.com/careers"]
+    assert started["b.com"] - started["a.com"] < 0.2
+
+
+def test_result_stub_keeps_summary_fields():
+    result = {"domain": "a.com", "success": True, "blocked": False, "method_used": "js",
+              "pages": 3, "words": 900, "name": "A", "error": None, "recon_cdn": "cloudflare"}
+    assert ea._result_stub(result) == {
+        "domain": "a.com", "success": True, "blocked": False, "method_used": "js", "pages": 3, "words": 900,
+    }
+
+
+def test_batch_results_stream_to_ndjson(monkeypatch, tmp_path):
+    monkeypatch.setattr(ea, "recon_site", lambda url, **kw: None)
+    monkeypatch.setattr(ea, "get_cached_strategy", lambda domain: None)
+
+    def fake_run_crawl(carrier, **kwargs):
+        if carrier["domain"] == "bad.com":
+            raise RuntimeError("crawl crashed")
+        return {"success": True, "pages": 2, "words": 500, "method_used": kwargs["method"],
+                "blocked": False, "error": None}
+
+    monkeypatch.setattr(ea, "run_crawl", fake_run_crawl)
+    sites = [{"domain": d, "name": d, "tier": 1} for d in ("a.com", "b.com", "bad.com")]
+    path = tmp_path / "batch.ndjson"
+    slo = ea.SLOTracker()
+
+    stubs = ea.run_batch_eval(sites, ea.EvalConfig(), jobs=2, slo=slo, results_path=path)
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert sorted(r["domain"] for r in lines) == ["a.com", "b.com", "bad.com"]
+    assert next(r for r in lines if r["domain"] == "a.com")["strategy"] == "requests"
+    assert next(r for r in lines if r["domain"] == "bad.com")["error"] == "crawl crashed"
+    assert sorted(stubs, key=lambda r: r["domain"]) == sorted(map(ea._result_stub, lines), key=lambda r: r["domain"])
+    assert (slo.total_attempts, slo.successful, slo.total_pages) == (3, 2, 4)
+
+
+def test_batch_write_failure_is_not_recorded_twice(monkeypatch, tmp_path):
+    monkeypatch.setattr(ea, "recon_site", lambda url, **kw: None)
+    monkeypatch.setattr(ea, "get_cached_strategy", lambda domain: None)
+    monkeypatch.setattr(ea, "run_crawl", lambda carrier, **kw: {
+        "success": True, "pages": 1, "words": 200, "method_used": "requests", "blocked": False, "error": None,
+    })
+    failures = [OSError("disk full")]
+
+    def dumps(*args, **kwargs):
+        if failures:
+            raise failures.pop()
+        return json.dumps(*args, **kwargs)
+
+    monkeypatch.setattr(ea, "json", SimpleNamespace(dumps=dumps, loads=json.loads))
+    slo = ea.SLOTracker()
+
+    with pytest.raises(OSError):
+        ea.run_batch_eval([{"domain": "a.com"}], ea.EvalConfig(), jobs=1, slo=slo,
+                          results_path=tmp_path / "batch.ndjson")
+    assert slo.total_attempts == 0
+
+
+def test_tail_summarizes_a_truncated_results_file(monkeypatch, tmp_path, capsys):
+    rows = [
+        {"domain": "a.com", "success": True, "blocked": False, "method_used": "requests", "pages": 2, "words": 300},
+        {"domain": "b.com", "success": False, "blocked": True, "method_used": "js", "pages": 0, "words": 0},
+    ]
+    path = tmp_path / "batch.ndjson"
+    path.write_text("".join(json.dumps(r) + "\n" for r in rows) + '{"domain": "c.com", "succ')
+
+    assert list(ea.read_results(path)) == rows
+
+    monkeypatch.setattr(sys, "argv", ["eval_access.py", "--tail", str(path)])
+    ea.main()
+    out = capsys.readouterr().out
+    assert "Sites tested:  2" in out
+    assert "Blocked:       1" in out
+    assert "✓ a.com: 2 pages, 300 words (requests)" in out
+    assert "c.com" not in out
+
+
+def test_batch_workers_reuse_one_browser_across_sites(monkeypatch, tmp_path):
+    sync_api = pytest.importorskip("playwright.sync_api")
+    from fetch import capture
+
+    launched = []
+
+    class FakeBrowser:
+        closed = False
+
+        def is_connected(self):
+            return not self.closed
+
+        def close(self):
+            self.closed = True
+
+    class FakePlaywright:
+        def __init__(self):
+            self.chromium = self
+
+        def start(self):
+            return self
+
+        def stop(self):
+            pass
+
+        def launch(self, headless=True):
+            launched.append(FakeBrowser())
+            return launched[-1]
+
+    monkeypatch.setattr(sync_api, "sync_playwright", FakePlaywright)
+    monkeypatch.setattr(ea, "recon_site", lambda url, **kw: None)
+    monkeypatch.setattr(ea, "get_cached_strategy", lambda domain: "js")
+
+    def fake_run_crawl(carrier, **kwargs):
+        # What a JS capture inside capture_site() does
+        with capture._browser(True):
+            pass
+        return {"success": True, "pages": 1, "words": 200, "method_used": kwargs["method"],
+                "blocked": False, "error": None}
+
+    monkeypatch.setattr(ea, "run_crawl", fake_run_crawl)
+    sites = [{"domain": f"c{i}.com"} for i in range(6)]
+
+    results = ea.run_batch_eval(sites, ea.EvalConfig(), jobs=2, results_path=tmp_path / "batch.ndjson")
+
+    assert len(results) == 6
+    assert 1 <= len(launched) <= 2
+    assert all(b.closed for b in launched)
+
+
+def test_resolve_jobs(monkeypatch):
+    monkeypatch.delenv("EVAL_MAX_JOBS", raising=False)
+    monkeypatch.setattr(ea.os, "cpu_count", lambda: 2)
+    config = ea.EvalConfig()
+
+    # Explicit --jobs wins, even over a configured default
+    assert ea.resolve_jobs(3, 20, ea.EvalConfig(default_jobs=6)) == 3
+    assert ea.resolve_jobs(1, 20, config) == 1
+    assert ea.resolve_jobs(None, 20, ea.EvalConfig(default_jobs=6)) == 6
+
+    # Auto: one per site, capped at 4 per CPU and max_jobs
+    assert ea.resolve_jobs(None, 5, config) == 5
+    assert ea.resolve_jobs(None, 50, config) == 8
+    assert ea.resolve_jobs(None, 50, ea.EvalConfig(max_jobs=3)) == 3
+    # A single site falls back to the interactive session
+    assert ea.resolve_jobs(None, 1, config) == 1
+
+    monkeypatch.setenv("EVAL_MAX_JOBS", "2")
+    assert ea.resolve_jobs(None, 50, config) == 2
+    for bad in ("0", "-3", "lots", ""):
+        monkeypatch.setenv("EVAL_MAX_JOBS", bad)
+        assert ea.resolve_jobs(None, 50, ea.EvalConfig(max_jobs=3)) == 3
+
+
+def test_main_picks_batch_or_interactive(monkeypatch):
+    calls = []
+    monkeypatch.setattr(ea, "load_config", lambda: (ea.EvalConfig(), [], []))
+    monkeypatch.setattr(ea, "run_batch_eval", lambda sites, config, jobs, slo: calls.append(("batch", jobs)) or [])
+    monkeypatch.setattr(ea, "run_eval_session", lambda sites, config, slo: calls.append(("session", 1)) or [])
+    monkeypatch.setattr(ea.os, "cpu_count", lambda: 2)
+    monkeypatch.delenv("EVAL_MAX_JOBS", raising=False)
+
+    def run(argv, num_sites):
+        monkeypatch.setattr(ea, "select_sites", lambda *a, **k: [{"domain": f"c{i}.com"} for i in range(num_sites)])
+        monkeypatch.setattr(sys, "argv", ["eval_access.py", *argv])
+        ea.main()
+        return calls.pop()
+
+    assert run([], 5) == ("batch", 5)
+    assert run([], 1) == ("session", 1)
+    assert run(["--interactive"], 5) == ("session", 1)
+    assert run(["-j", "2"], 5) == ("batch", 2)
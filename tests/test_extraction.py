@@ -129,3 +129,59 @@ def test_link_categorization(tmp_path: Path):
     content_urls = [l.get("url") for l in links.get("content", [])]
     # Contact and Privacy should be content links (not in nav)
     assert len(content_urls) >= 1
+
+
+def test_read_html_mapped_matches_read_text(tmp_path: Path):
+    from fetch.extractor import MMAP_MIN_BYTES, _read_html
+
+    chunk = "<p>Café — line</p>\r\n<p>old mac\rline</p>\n".encode("utf-8") + b"\xff\xfe"
+    html_path = tmp_path / "big.html"
+    html_path.write_bytes(chunk * (MMAP_MIN_BYTES // len(chunk) + 1))
+
+    assert _read_html(html_path) == html_path.read_text(encoding="utf-8", errors="ignore")
+
+
+def test_extract_from_compressed_capture(tmp_path: Path):
+    import pytest
+    pytest.importorskip("zstandard")
+    from fetch.html_archive import read_html, write_html
+
+    html = "<html><head><title>Zst Page</title></head><body><main><h1>Hi</h1>\r\n<p>Café</p></main></body></html>"
+    plain = write_html(tmp_path / "plain.html", html)
+    packed = write_html(tmp_path / "page.html", html, compress=True)
+
+    assert packed.name == "page.html.zst"
+    assert read_html(packed) == read_html(plain)
+
+    result = extract_from_capture(html_path=packed, url="https://example.com/")
+    assert result["title"] == "Zst Page"
+
+
+def test_extract_from_in_memory_html_matches_archived_file(tmp_path: Path):
+    from fetch.html_archive import archived_text, write_html
+
+    html = "<html><head><title>Mem</title></head><body><main>\r\n<p>Line one</p>\r<p>Two</p></main></body></html>"
+    html_path = write_html(tmp_path / "page.html", html)
+
+    from_disk = extract_from_capture(html_path=html_path, url="https://example.com/")
+    in_memory = extract_from_capture(html_path=html_path, url="https://example.com/", html=archived_text(html))
+
+    for key in ("title", "content_hash", "tagged_blocks", "links"):
+        assert in_memory.get(key) == from_disk.get(key)
+
+
+def test_eval_extraction_reads_compressed_raw_pages(tmp_path: Path, monkeypatch):
+    import pytest
+    pytest.importorskip("zstandard")
+    from fetch.html_archive import write_html
+    from scripts import eval_extraction
+
+    raw_dir = tmp_path / "raw" / "example.com"
+    raw_dir.mkdir(parents=True)
+    write_html(raw_dir / "index.html", "<html><body><p>Home</p></body></html>")
+    write_html(raw_dir / "about_team.html", "<html><body><p>Team</p></body></html>", compress=True)
+    monkeypatch.setattr(eval_extraction, "CORPUS_DIR", tmp_path)
+
+    files = eval_extraction.get_raw_html_files("example.com")
+    assert [f.name for f in files] == ["about_team.html.zst", "index.html"]
+    assert [eval_extraction.raw_page_path(f) for f in files] == ["about/team", "index"]
@@ -0,0 +1,38 @@
+from fetch import FetchConfig, fetch_source, interactive_fetch
+
+PAGE = "<html><head><title>Carrier</title></head><body><main><h1>Freight</h1><p>{}</p></main></body></html>".format(
+    " ".join(["Truckload and intermodal freight shipping across North America."] * 40)
+)
+
+
+class _Resp:
+    status_code = 200
+    headers = {"Content-Type": "text/html; charset=utf-8"}
+    text = PAGE
+
+    def __init__(self, url):
+        self.url = url
+
+    def raise_for_status(self):
+        pass
+
+
+class _Session:
+    def __init__(self):
+        self.urls = []
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        return _Resp(url)
+
+
+def test_fetch_source_and_interactive_fetch_reuse_the_session():
+    session = _Session()
+    config = FetchConfig(js_fallback=False, archive_html=False)
+
+    result = fetch_source("https://www.example.com/", config, session=session)
+    interactive = interactive_fetch("https://www.example.com/about", config, session=session)
+
+    assert session.urls == ["https://www.example.com/", "https://www.example.com/about"]
+    assert result.fetch_method == "requests" and result.word_count > 100
+    assert interactive.word_count == result.word_count
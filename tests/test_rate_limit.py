@@ -0,0 +1,115 @@
+import threading
+
+from orchestrate import rate_limit
+from orchestrate.rate_limit import HostRateLimiter
+
+
+def test_host_rate_limiter_spaces_same_host_only(monkeypatch):
+    clock = [100.0]
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(rate_limit.time, "sleep", fake_sleep)
+
+    limiter = HostRateLimiter()
+    assert limiter.acquire_url("https://www.example.com/a", 3.0) == 0
+    # Another host is not held back by www.example.com's delay
+    assert limiter.acquire_url("https://careers.example.com/jobs", 3.0) == 0
+    assert limiter.acquire_url("https://www.example.com/b", 3.0) == 3.0
+    assert limiter.acquire_url("https://www.example.com/c", 0.5) == 3.0
+
+    clock[0] += 10
+    assert limiter.acquire_url("https://www.example.com/d", 3.0) == 0
+    assert sleeps == [3.0, 3.0]
+
+
+def test_host_rate_limiter_try_acquire_never_waits(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(rate_limit.time, "sleep", lambda seconds: (_ for _ in ()).throw(AssertionError("slept")))
+
+    limiter = HostRateLimiter()
+    assert limiter.try_acquire("www.example.com", 2.0)
+    assert not limiter.try_acquire("www.example.com", 2.0)
+    assert limiter.try_acquire("careers.example.com", 2.0)
+
+    clock[0] += 2.0
+    assert limiter.try_acquire("www.example.com", 2.0)
+    assert not limiter.try_acquire("www.example.com", 2.0)
+
+
+def test_host_rate_limiter_hold_spaces_from_end_of_request(monkeypatch):
+    clock = [100.0]
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(rate_limit.time, "sleep", fake_sleep)
+
+    limiter = HostRateLimiter()
+    with limiter.hold_url("https://www.example.com/a", 3.0):
+        clock[0] += 5.0  # slow response, longer than the delay
+        # Another host is not held back
+        with limiter.hold_url("https://careers.example.com/jobs", 3.0):
+            pass
+    # The delay counts from the end of the slow request, not its start
+    with limiter.hold_url("https://www.example.com/b", 3.0):
+        pass
+    assert sleeps == [3.0]
+
+
+def test_host_rate_limiter_hold_never_overlaps_one_host():
+    limiter = HostRateLimiter()
+    entered = threading.Event()
+
+    def same_host():
+        with limiter.hold_url("https://www.example.com/b", 0.0):
+            entered.set()
+
+    with limiter.hold_url("https://www.example.com/a", 0.0):
+        worker = threading.Thread(target=same_host)
+        worker.start()
+        assert not entered.wait(0.1)
+    worker.join(1)
+    assert entered.is_set()
+
+
+def test_address_limiter_caps_sites_per_ip(monkeypatch):
+    from orchestrate.rate_limit import AddressLimiter
+
+    ips = {"www.a.com": "10.0.0.1", "www.b.com": "10.0.0.1", "www.c.com": "10.0.0.2"}
+
+    def fake_resolve(host):
+        if host not in ips:
+            raise OSError("unknown host")
+        return ips[host]
+
+    monkeypatch.setattr(rate_limit.socket, "gethostbyname", fake_resolve)
+
+    limiter = AddressLimiter(1)
+    assert limiter.address("nowhere.invalid") == "nowhere.invalid"
+
+    with limiter.hold_url("https://www.a.com/") as addr:
+        assert addr == "10.0.0.1"
+        # A different IP is not held back
+        with limiter.hold_url("https://www.c.com/"):
+            pass
+
+        entered = threading.Event()
+
+        def same_ip():
+            with limiter.hold_url("https://www.b.com/"):
+                entered.set()
+
+        worker = threading.Thread(target=same_ip)
+        worker.start()
+        assert not entered.wait(0.1)
+    worker.join(1)
+    assert entered.is_set()
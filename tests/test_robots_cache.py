@@ -0,0 +1,61 @@
+import os
+import time
+
+from orchestrate import robots_cache
+
+
+class _Resp:
+    def __init__(self, status_code, text=""):
+        self.status_code = status_code
+        self.text = text
+
+
+class _Session:
+    def __init__(self, responses):
+        self.responses = responses
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append(url)
+        return self.responses[url]
+
+
+def test_get_robots_caches_in_memory_and_on_disk(tmp_path):
+    robots_cache.clear_cache()
+    session = _Session({
+        "https://www.example.com/robots.txt": _Resp(200, "User-agent: *\nDisallow: /private\n"),
+    })
+
+    first = robots_cache.get_robots("https://www.example.com/", session=session, cache_dir=tmp_path)
+    again = robots_cache.get_robots("https://www.example.com/about", session=session, cache_dir=tmp_path)
+    assert again is first
+    assert session.calls == ["https://www.example.com/robots.txt"]
+    assert not first.is_allowed("https://www.example.com/private/x")
+
+    # A fresh process (empty memory cache) is served from disk
+    robots_cache.clear_cache()
+    from_disk = robots_cache.get_robots("https://www.example.com/", session=session, cache_dir=tmp_path)
+    assert len(session.calls) == 1
+    assert from_disk.found
+    assert not from_disk.is_allowed("https://www.example.com/private/x")
+    assert from_disk.is_allowed("https://www.example.com/drivers")
+
+
+def test_get_robots_expires_and_remembers_missing(tmp_path):
+    robots_cache.clear_cache()
+    session = _Session({"https://example.org/robots.txt": _Resp(404)})
+
+    checker = robots_cache.get_robots("https://example.org/", session=session, cache_dir=tmp_path)
+    assert not checker.found
+    assert (tmp_path / "example.org.missing").exists()
+
+    robots_cache.clear_cache()
+    robots_cache.get_robots("https://example.org/", session=session, cache_dir=tmp_path)
+    assert len(session.calls) == 1
+
+    # Past the TTL the entry is refetched
+    stale = time.time() - 2 * robots_cache.DEFAULT_TTL
+    os.utime(tmp_path / "example.org.missing", (stale, stale))
+    robots_cache.clear_cache()
+    robots_cache.get_robots("https://example.org/", session=session, cache_dir=tmp_path)
+    assert len(session.calls) == 2
@@ -0,0 +1,162 @@
+from fetch import sitemap
+
+NS = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+
+
+class _Resp:
+    def __init__(self, status_code, text="", first_chunk=None):
+        self.status_code = status_code
+        self.body = text.encode("utf-8")
+        self.first_chunk = first_chunk
+        self.bytes_read = 0
+        self.closed = False
+
+    def iter_content(self, chunk_size=1):
+        # first_chunk: a short first chunk, as chunked transfer encoding can send
+        bounds = [0]
+        if self.first_chunk:
+            bounds.append(self.first_chunk)
+        bounds.extend(range(bounds[-1] + chunk_size, len(self.body), chunk_size))
+        bounds.append(len(self.body))
+        for start, end in zip(bounds, bounds[1:]):
+            chunk = self.body[start:end]
+            self.bytes_read += len(chunk)
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _Session:
+    def __init__(self, docs, first_chunk=None):
+        self.docs = docs
+        self.first_chunk = first_chunk
+        self.responses = []
+
+    def get(self, url, **kwargs):
+        if url in self.docs:
+            resp = _Resp(200, self.docs[url], self.first_chunk)
+        else:
+            resp = _Resp(404)
+        self.responses.append(resp)
+        return resp
+
+
+def _urlset(n, ns=NS):
+    entries = "".join(
+        f"<url><loc> https://www.example.com/p{i} </loc><lastmod>2024-01-02</lastmod>"
+        f"<priority>0.{i % 10}</priority></url>"
+        for i in range(n)
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><urlset {ns}>{entries}</urlset>'
+
+
+def test_parse_sitemap_stops_at_max_urls():
+    session = _Session({"https://www.example.com/sitemap.xml": _urlset(500)})
+
+    result = sitemap.parse_sitemap("https://www.example.com/sitemap.xml", max_urls=3, session=session)
+
+    assert result.found and result.error is None
+    assert [u.loc for u in result.urls] == [f"https://www.example.com/p{i}" for i in range(3)]
+    assert result.urls[1].lastmod == "2024-01-02T00:00:00"
+    assert result.urls[1].priority == 0.1
+
+
+def test_parse_sitemap_index_follows_children():
+    index = (
+        f'<?xml version="1.0"?><sitemapindex {NS}>'
+        "<sitemap><loc>https://www.example.com/a.xml</loc></sitemap>"
+        "<sitemap><loc>https://www.example.com/b.xml</loc></sitemap>"
+        "</sitemapindex>"
+    )
+    session = _Session({
+        "https://www.example.com/index.xml": index,
+        "https://www.example.com/a.xml": _urlset(2),
+        "https://www.example.com/b.xml": _urlset(2, ns=""),
+    })
+
+    result = sitemap.parse_sitemap("https://www.example.com/index.xml", max_urls=3, session=session)
+
+    assert result.is_index
+    assert result.child_sitemaps == ["https://www.example.com/a.xml", "https://www.example.com/b.xml"]
+    assert len(result.urls) == 3
+    assert result.urls[2].source_sitemap == "https://www.example.com/b.xml"
+
+
+def test_parse_sitemap_reports_xml_errors():
+    session = _Session({"https://www.example.com/sitemap.xml": "<html><body>&nbsp;</body></html>"})
+
+    result = sitemap.parse_sitemap("https://www.example.com/sitemap.xml", session=session)
+
+    assert not result.found
+    assert result.error.startswith("XML parse error")
+
+
+def test_parse_sitemap_stops_downloading_at_max_urls():
+    session = _Session({"https://www.example.com/sitemap.xml": _urlset(20000)})
+
+    result = sitemap.parse_sitemap("https://www.example.com/sitemap.xml", max_urls=50, session=session)
+
+    resp = session.responses[0]
+    assert len(result.urls) == 50
+    assert resp.closed
+    assert resp.bytes_read <= sitemap.CHUNK_SIZE < len(resp.body)
+
+
+def test_discover_sitemap_reads_only_the_start():
+    session = _Session({"https://www.example.com/sitemap_index.xml": _urlset(20000)})
+
+    assert sitemap.discover_sitemap("https://www.example.com/about", session=session) == (
+        "https://www.example.com/sitemap_index.xml"
+    )
+    assert all(r.closed for r in session.responses)
+    assert session.responses[-1].bytes_read == sitemap.CHUNK_SIZE
+
+
+def test_find_sitemap_parses_the_discovery_response():
+    session = _Session({
+        "https://www.example.com/robots-listed.xml": "<html>not a sitemap</html>",
+        "https://www.example.com/sitemap_index.xml": _urlset(20),
+    })
+
+    result = sitemap.find_sitemap(
+        "https://www.example.com/about",
+        ["https://www.example.com/robots-listed.xml"],
+        max_urls=5,
+        session=session,
+    )
+
+    assert result.found and result.sitemap_url == "https://www.example.com/sitemap_index.xml"
+    assert [u.loc for u in result.urls] == [f"https://www.example.com/p{i}" for i in range(5)]
+    # robots hint, /sitemap.xml, then the sitemap itself: fetched once
+    assert len(session.responses) == 3
+    assert all(r.closed for r in session.responses)
+
+
+def test_find_sitemap_returns_none_without_a_sitemap():
+    assert sitemap.find_sitemap("https://www.example.com/", session=_Session({})) is None
+
+
+def test_discover_sitemap_reads_past_a_short_first_chunk():
+    doc = _urlset(20)
+    # The first chunk is just the XML declaration
+    session = _Session({"https://www.example.com/sitemap.xml": doc}, first_chunk=doc.index("?>") + 2)
+
+    assert sitemap.discover_sitemap("https://www.example.com/", session=session) == (
+        "https://www.example.com/sitemap.xml"
+    )
+
+
+def test_find_sitemap_parses_past_a_short_first_chunk():
+    doc = _urlset(20)
+    session = _Session({"https://www.example.com/sitemap.xml": doc}, first_chunk=doc.index("?>") + 2)
+
+    result = sitemap.find_sitemap("https://www.example.com/", session=session)
+
+    assert [u.loc for u in result.urls] == [f"https://www.example.com/p{i}" for i in range(20)]